@@ -0,0 +1,273 @@
+"""
+Batch Generation Module for History Syllabus Generator
+Renders a directory of saved syllabi without the GUI.
+
+Usage:
+    python -m batch_generation SYLLABI_DIR --term "Fall 2025" --format both --workers 4
+
+Each *.json file in SYLLABI_DIR is a SyllabusContent saved with
+syllabus_model.save_content(). Word documents are built in parallel worker
+processes; the PDFs are then converted in batches, one LibreOffice
+invocation per ConversionPool worker (--converters, each with its own
+profile). A per-file timing/failure summary is printed at the end.
+"""
+
+import argparse
+import dataclasses
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+from syllabus_model import load_content
+from document_generation import DocumentGenerationMixin, REPORTLAB_SUCCESS_MESSAGE, write_bytes, write_scratch_docx
+from docx_builder import build_syllabus_document, docx_bytes
+from output_cache import OutputCache
+from pdf_renderer import render_syllabus_pdf
+from office_server import ConversionPool, find_soffice, set_office_converter
+
+
+class _HeadlessGenerator(DocumentGenerationMixin):
+    """Host for the conversion methods of DocumentGenerationMixin that don't need Tk"""
+
+
+def _load(path, term=None):
+    """Load a saved syllabus, optionally overriding its term"""
+    content = load_content(path)
+    if term:
+        content = dataclasses.replace(
+            content, course_info=dataclasses.replace(content.course_info, term=term))
+    return content
+
+
+def render_file(path, output_dir, term=None, formats=("docx",), use_cache=True, pdf_engine="office"):
+    """
+    Build the Word document for one saved syllabus; runs in a worker process.
+
+    The document is serialized once; if a PDF is wanted, the saved .docx (or,
+    for PDF-only output, a scratch copy on RAM-backed storage) becomes the
+    converter input, returned as result["pending_pdf"]. With pdf_engine="builtin"
+    the PDF is rendered right here with ReportLab instead. Unchanged syllabi are
+    served from the output cache. Returns a result dictionary instead of
+    raising so one bad file can't take down the batch.
+    """
+    start = time.perf_counter()
+    result = {"path": path, "outputs": [], "error": None, "message": "", "seconds": 0.0,
+              "pending_pdf": None, "scratch": None, "cache_hits": 0, "cache_lookups": 0}
+    try:
+        content = _load(path, term)
+        stem = os.path.splitext(os.path.basename(path))[0]
+        pdf_path = os.path.join(output_dir, stem + ".pdf")
+        cache = OutputCache() if use_cache else None
+
+        def cached(export_format):
+            if cache is None:
+                return None
+            result["cache_lookups"] += 1
+            data = cache.get(content, export_format)
+            if data is not None:
+                result["cache_hits"] += 1
+            return data
+
+        if "pdf" in formats and pdf_engine == "builtin":
+            render_syllabus_pdf(content, pdf_path)
+            result["outputs"].append(pdf_path)
+            result["message"] = REPORTLAB_SUCCESS_MESSAGE
+            formats = tuple(f for f in formats if f != "pdf")
+
+        pdf_data = cached("pdf") if "pdf" in formats else None
+        if pdf_data is not None:
+            write_bytes(pdf_path, pdf_data)
+            result["outputs"].append(pdf_path)
+            result["message"] = "PDF reused from the output cache"
+            formats = tuple(f for f in formats if f != "pdf")
+
+        if not formats:
+            result["seconds"] = time.perf_counter() - start
+            return result
+
+        data = cached("docx")
+        if data is None:
+            data = docx_bytes(build_syllabus_document(content))
+            if cache is not None:
+                cache.put(content, "docx", data)
+
+        source = None
+        if "docx" in formats:
+            source = os.path.join(output_dir, stem + ".docx")
+            write_bytes(source, data)
+            result["outputs"].append(source)
+
+        if "pdf" in formats:
+            if source is None:
+                source = result["scratch"] = write_scratch_docx(data)
+            result["pending_pdf"] = (source, pdf_path)
+
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def convert_pending_pdf(result, term=None):
+    """Convert the .docx left by render_file() to PDF with the full fallback chain"""
+    source, pdf_path = result["pending_pdf"]
+    try:
+        success, message = _HeadlessGenerator().convert_docx_to_pdf_robust(source, pdf_path, _load(result["path"], term))
+        result["message"] = message
+        if success:
+            result["outputs"].append(pdf_path)
+        else:
+            result["error"] = message
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["pending_pdf"] = None
+    return result
+
+
+def _report(result):
+    status = "FAILED" if result["error"] else "ok"
+    print(f"  {status:6} {result['seconds']:7.2f}s  {os.path.basename(result['path'])}", flush=True)
+
+
+def run_batch(input_dir, output_dir=None, term=None, formats=("docx",), workers=None, converters=None,
+              use_cache=True, pdf_engine="office"):
+    """Render every *.json syllabus in input_dir; returns the list of result dictionaries"""
+    paths = sorted(glob.glob(os.path.join(input_dir, "*.json")))
+    output_dir = output_dir or input_dir
+    os.makedirs(output_dir, exist_ok=True)
+
+    results = []
+    if not paths:
+        return results
+
+    pending = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(render_file, path, output_dir, term, formats, use_cache, pdf_engine)
+                       for path in paths]
+        for future in as_completed(futures):
+            result = future.result()
+            if result["pending_pdf"] and not result["error"]:
+                pending.append(result)
+                continue
+            _report(result)
+            results.append(result)
+
+    if pending:
+        results.extend(_convert_pending(pending, term, converters or workers or os.cpu_count() or 1, use_cache))
+
+    results.sort(key=lambda r: r["path"])
+    return results
+
+
+def _convert_pending(pending, term, converters, use_cache=True):
+    """
+    Convert all pending PDFs: one LibreOffice invocation per pool worker for the
+    whole batch, then the full fallback chain for any file that didn't convert.
+    """
+    start = time.perf_counter()
+    soffice_path = find_soffice()
+    pool = ConversionPool(soffice_path, size=min(converters, len(pending))) if soffice_path else None
+    previous_converter = set_office_converter(pool) if pool is not None else None
+    try:
+        retry = pending
+        if pool is not None:
+            errors = pool.convert_many([result["pending_pdf"] for result in pending])
+            retry = []
+            for result in pending:
+                _, pdf_path = result["pending_pdf"]
+                if errors.get(pdf_path) is None and os.path.exists(pdf_path):
+                    result["outputs"].append(pdf_path)
+                    result["message"] = "PDF created successfully using LibreOffice (batch)"
+                    result["pending_pdf"] = None
+                else:
+                    retry.append(result)
+
+        with ThreadPoolExecutor(max_workers=converters) as executor:
+            list(executor.map(lambda r: convert_pending_pdf(r, term), retry))
+
+        if use_cache:
+            # Remember finished PDFs (but not basic-formatting fallbacks) for the next run
+            cache = OutputCache()
+            for result in pending:
+                if result["error"] or result["message"] == REPORTLAB_SUCCESS_MESSAGE:
+                    continue
+                pdf_path = result["outputs"][-1]
+                with open(pdf_path, "rb") as f:
+                    cache.put(_load(result["path"], term), "pdf", f.read())
+    finally:
+        if pool is not None:
+            set_office_converter(previous_converter)
+            pool.shutdown()
+        for scratch in [result["scratch"] for result in pending if result["scratch"]]:
+            try:
+                os.remove(scratch)
+            except OSError:
+                pass
+
+    elapsed = time.perf_counter() - start
+    for result in pending:
+        # Conversion time is shared by the batch; charge each file its share
+        result["seconds"] += elapsed / len(pending)
+        _report(result)
+    print(f"  PDF conversion of {len(pending)} files took {elapsed:.2f}s", flush=True)
+    return pending
+
+
+def print_summary(results, elapsed):
+    """Print per-file timings and failures"""
+    failures = [r for r in results if r["error"]]
+    print()
+    print(f"Rendered {len(results) - len(failures)} of {len(results)} syllabi in {elapsed:.2f}s")
+    if results:
+        timings = [r["seconds"] for r in results]
+        print(f"Per file: min {min(timings):.2f}s, mean {sum(timings) / len(timings):.2f}s, max {max(timings):.2f}s")
+        lookups = sum(r.get("cache_lookups", 0) for r in results)
+        if lookups:
+            hits = sum(r.get("cache_hits", 0) for r in results)
+            print(f"Output cache: {hits} hits, {lookups - hits} misses")
+    if failures:
+        print("\nFailures:")
+        for r in failures:
+            print(f"  {os.path.basename(r['path'])}: {r['error']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m batch_generation",
+        description="Render a directory of saved syllabi (*.json) to Word and/or PDF."
+    )
+    parser.add_argument("input_dir", help="Directory containing saved syllabus files (*.json)")
+    parser.add_argument("--term", help="Term to print on every syllabus, e.g. \"Fall 2025\"")
+    parser.add_argument("--format", choices=("docx", "pdf", "both"), default="docx",
+                        help="Output format (default: docx)")
+    parser.add_argument("--output", help="Output directory (default: the input directory)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="Number of worker processes (default: CPU count)")
+    parser.add_argument("--pdf-engine", choices=("office", "builtin"), default="office",
+                        help="office: convert the Word document with Word/LibreOffice; "
+                             "builtin: render PDFs in-process with ReportLab (default: office)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Rebuild everything instead of reusing unchanged outputs from the cache")
+    parser.add_argument("--converters", type=int,
+                        help="Number of parallel LibreOffice workers for PDF output (default: --workers)")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.input_dir):
+        parser.error(f"not a directory: {args.input_dir}")
+
+    formats = ("docx", "pdf") if args.format == "both" else (args.format,)
+
+    start = time.perf_counter()
+    results = run_batch(args.input_dir, args.output, args.term, formats, args.workers, args.converters,
+                        use_cache=not args.no_cache, pdf_engine=args.pdf_engine)
+    if not results:
+        print(f"No syllabus files (*.json) found in {args.input_dir}")
+        return 1
+    print_summary(results, time.perf_counter() - start)
+    return 1 if any(r["error"] for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
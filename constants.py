@@ -89,6 +89,18 @@ class_communication_policy_default = (
     "Finally, when you email the professor, please carbon copy (cc) your TA to streamline communication."
 )
 
+late_policy_default = (
+    "Late assignments will be penalized 10% per day late unless prior arrangements have been made with the instructor due to documented emergency or illness. "
+    "Contact instructor as soon as possible if you anticipate being unable to meet a deadline."
+)
+
+extra_credit_policy_default = (
+    "Extra credit opportunities may be available at the instructor's discretion. "
+    "These will be announced in class and posted on Canvas when available."
+)
+
+required_materials_default = "**Required** textbook *and* materials will be *listed* here."
+
 evaluations_default = (
     "Students are expected to provide professional and respectful feedback on the quality of instruction by completing **course evaluations** online via GatorEvals. "
     "Evaluations can be done via the email link from GatorEvals, the link in Canvas, or by logging in to the GatorEvals portal. Students will be notified when the evaluation period opens, and can view summary results of past evaluations on the GatorEvals website."
@@ -131,3 +143,94 @@ Writing Studio: 2215 Turlington Hall, 352-846-1138. Help brainstorming, formatti
 Student Complaints On-Campus: Visit the Student Honor Code and Student Conduct Code webpage for more information.  
 
 On-Line Students Complaints: View the Distance Learning Student Complaint Process."""
+
+# Student Learning Outcomes used when none are entered
+student_learning_outcomes_default = [
+    "Describe the factual details of the substantive historical episodes under study.",
+    "Identify and analyze foundational developments that shaped history using critical thinking skills.",
+    "Demonstrate an understanding of the primary ideas, values, and perceptions that have shaped history.",
+    "Demonstrate competency in civic literacy."
+]
+
+# Objectives table rows (category, SLO, state SLO assignments) used when no categories are entered
+slo_table_default = [
+    ("Content",
+     "Identify, describe, and explain key themes, principles, and terminology; the history, theory and/or methodologies used; and social institutions, structures and processes.",
+     "Outcomes 1-4\n\nStudents will demonstrate their knowledge of the details of the substantive historical episodes by analyzing primary and secondary sources in short papers, homework assignments, exams, and in-class discussion."),
+    ("Critical Thinking",
+     "Apply formal and informal qualitative or quantitative analysis effectively to examine the processes and means by which individuals make personal and group decisions. Assess and analyze ethical perspectives in individual and societal decisions.",
+     "Outcomes 1-4\n\nStudents will demonstrate their ability in applying qualitative and quantitative methods by analyzing primary and secondary sources in short papers, homework assignments, and exams by using critical thinking skills."),
+    ("Communication",
+     "Communication is the development and expression of ideas in written and oral forms.",
+     "Outcomes 1-4\n\nStudents will identify and explain key developments that shaped history in written assignments and class discussion.\n\nStudents will demonstrate their understandings of the primary ideas, values, and perceptions that have shaped history and will describe them in written assignments, exams, and class discussion.")
+]
+
+# General Education designation of the department's courses
+GEN_ED_DESIGNATION = "Social and Behavioral Sciences (S)"
+
+# Statement under the General Education heading; formatted with course_num and designation
+gen_ed_credit_statement = (
+    "Your successful completion of {course_num} with a grade of \"C\" or higher will count towards UF's "
+    "General Education State Core in {designation}. It will also count towards the State of Florida's "
+    "Civic Literacy requirement."
+)
+
+# Instructor policy sections printed after the submission instructions, in document order:
+# (heading, Policies flag that turns the section on, Policies field holding its text)
+COURSE_POLICY_SECTIONS = [
+    ("Late Submissions", "late_submissions_enabled", "late_policy_text"),
+    ("Extra Credit", "extra_credit_enabled", "extra_credit_text"),
+    ("Canvas", "canvas_enabled", "canvas_text"),
+    ("Technology in the Classroom", "technology_enabled", "technology_text"),
+    ("Class Communication Policy", "communication_enabled", "communication_text"),
+    ("Assignment Support Outside the Classroom", "outside_support_enabled", "support_text"),
+]
+
+# IV. University Policies and Resources, as printed in every syllabus ([text](url) marks a link)
+uf_policies_simplified_text = (
+    "This course complies with all UF academic policies. For information on those polices and for resources "
+    "for students, please see [this link](https://syllabus.ufl.edu/syllabus-policy/uf-syllabus-policy-links/)."
+)
+
+# (heading, text) of the detailed university policies, used when the simplified statement is off
+UF_POLICIES_DETAILED = [
+    ("Students requiring accommodation",
+     "Students with disabilities who experience learning barriers and would like to request academic accommodations "
+     "should connect with the Disability Resource Center by visiting https://disability.ufl.edu/students/get-started/. "
+     "It is important for students to share their accommodation letter with the instructor and discuss their "
+     "access needs as early as possible in the semester."),
+    ("University Honesty Policy",
+     "UF students are bound by The Honor Pledge which states \"We, the members of the University of Florida "
+     "community, pledge to hold ourselves and our peers to the highest standards of honor and integrity by "
+     "abiding by the Honor Code.\" On all work submitted for credit by students at the University of Florida, "
+     "the following pledge is either required or implied: \"On my honor, I have neither given nor received "
+     "unauthorized aid in doing this assignment.\" The Conduct Code specifies a number of behaviors that are "
+     "in violation of this code and the possible sanctions. "
+     "[See the UF Conduct Code website for more information](https://sccr.dso.ufl.edu/process/student-conduct-code/). "
+     "If you have any questions or concerns, please consult with the instructor or TAs in this class."),
+    ("Plagiarism and Related Ethical Violations",
+     "Ethical violations such as plagiarism, cheating, academic misconduct (e.g. passing off others' work as your "
+     "own, reusing old assignments, etc.) will not be tolerated and will result in a failing grade in this course. "
+     "Students must be especially wary of plagiarism. The UF Student Honor Code defines plagiarism as follows: "
+     "A student shall not represent as the student's own work all or any portion of the work of another. "
+     "Plagiarism includes (but is not limited to): a. Quoting oral or written materials, whether published or "
+     "unpublished, without proper attribution. b. Submitting a document or assignment which in whole or in part "
+     "is identical or substantially identical to a document or assignment not authored by the student. Note that "
+     "plagiarism also includes the use of any artificial intelligence programs, such as ChatGPT."),
+]
+
+# UF grading scale (letter grade, number grade)
+GRADING_SCALE = [
+    ("A", "100-93"),
+    ("A-", "92-90"),
+    ("B+", "89-87"),
+    ("B", "86-83"),
+    ("B-", "82-80"),
+    ("C+", "79-77"),
+    ("C", "76-73"),
+    ("C-", "72-70"),
+    ("D+", "69-67"),
+    ("D", "66-63"),
+    ("D-", "62-60"),
+    ("E", "59-0")
+]
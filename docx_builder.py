@@ -0,0 +1,493 @@
+"""
+Docx Builder Module for History Syllabus Generator
+Builds the Word document for a SyllabusContent with python-docx.
+
+Kept apart from document_generation so the GUI can start without importing
+python-docx; the mixin imports this module on first generation (or when the
+background pre-warm runs).
+"""
+
+import copy
+import io
+import threading
+import weakref
+
+import docx
+from docx import Document
+from docx.oxml import OxmlElement, parse_xml
+from docx.oxml.ns import nsdecls, qn
+from docx.shared import Inches, Pt
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from lxml import etree
+
+from constants import *
+from docx_tables import add_table
+from markup import tokenize, BOLD, ITALIC
+
+
+class LinkRegistry:
+    """
+    Hyperlink relationship IDs of one document part, cached per URL.
+    
+    part.relate_to() scans every relationship of the part to find an existing
+    one, which adds up in link-heavy syllabi; the registry does that lookup
+    once per URL. It is seeded from the part's existing hyperlinks, so links
+    already in the skeleton are reused.
+    """
+    
+    def __init__(self, part):
+        self.part = part
+        self._ids = {}
+        for r_id, rel in part.rels.items():
+            if rel.is_external and rel.reltype == docx.opc.constants.RELATIONSHIP_TYPE.HYPERLINK:
+                self._ids.setdefault(rel.target_ref, r_id)
+    
+    def r_id(self, url):
+        """Relationship ID for url, adding a relationship the first time it is seen"""
+        r_id = self._ids.get(url)
+        if r_id is None:
+            r_id = self.part.relate_to(url, docx.opc.constants.RELATIONSHIP_TYPE.HYPERLINK, is_external=True)
+            self._ids[url] = r_id
+        return r_id
+
+_link_registries = weakref.WeakKeyDictionary()
+
+def link_registry(part):
+    """The LinkRegistry for a document part (created on first use)"""
+    registry = _link_registries.get(part)
+    if registry is None:
+        registry = _link_registries[part] = LinkRegistry(part)
+    return registry
+
+# Run properties shared by every hyperlink: blue, single underline
+_HYPERLINK_RPR = parse_xml(
+    f'<w:rPr {nsdecls("w")}><w:color w:val="0000FF"/><w:u w:val="single"/></w:rPr>'
+)
+
+def add_hyperlink(paragraph, text, url):
+    """Add a hyperlink to a paragraph."""
+    r_id = link_registry(paragraph.part).r_id(url)
+    
+    # Create the hyperlink element
+    hyperlink = OxmlElement('w:hyperlink')
+    hyperlink.set(qn('r:id'), r_id)
+    
+    # Create a new run with a copy of the prebuilt hyperlink formatting
+    new_run = OxmlElement('w:r')
+    new_run.append(copy.deepcopy(_HYPERLINK_RPR))
+    new_run.text = text
+    hyperlink.append(new_run)
+    paragraph._p.append(hyperlink)
+    
+    return hyperlink
+
+def add_tokens(paragraph, tokens):
+    """Add markup.tokenize() output to a paragraph as runs and hyperlinks"""
+    for token in tokens:
+        if token.url:
+            try:
+                add_hyperlink(paragraph, token.text, token.url)
+            except Exception as e:
+                # Fallback to plain text if hyperlink creation fails
+                paragraph.add_run(token.text)
+        elif token.kind == BOLD:
+            paragraph.add_run(token.text).bold = True
+        elif token.kind == ITALIC:
+            paragraph.add_run(token.text).italic = True
+        else:
+            paragraph.add_run(token.text)
+
+def process_text_with_hyperlinks(paragraph, text):
+    """Process text containing URLs and email addresses and convert them to hyperlinks"""
+    add_tokens(paragraph, tokenize(text))
+
+def add_materials_markup(doc, text):
+    """
+    Parse Markdown-like markup in Required Materials and add it to a Word doc.
+    - Supports the following syntax:
+      - *italic* -> Text between single asterisks (*) will be italicized.
+      - **bold** -> Text between double asterisks (**) will be bolded.
+      - [text](url) -> Text inside square brackets ([text]) followed by a URL in parentheses (url) will become a hyperlink.
+      - Bare URLs and email addresses also become hyperlinks.
+    """
+    paragraph = doc.add_paragraph()
+    add_tokens(paragraph, tokenize(text, markup=True))
+    return paragraph
+
+def docx_bytes(doc):
+    """Serialize a python-docx Document into memory and return the .docx bytes"""
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+def _add_slo_table(doc, slo_rows, designation=None):
+    """Add the General Education objectives table (and its caption) to a document"""
+    designation = designation or GEN_ED_DESIGNATION
+    doc.add_paragraph()
+    doc.add_paragraph(f"Objectives—General Education and {designation}")
+    
+    # Customize the second header based on designation
+    slo_header = "SOCIAL SCIENCE SLOS"
+    if "Humanities" in designation:
+        slo_header = "HUMANITIES SLOS"
+    elif "International" in designation:
+        slo_header = "INTERNATIONAL SLOS"
+    elif "Diversity" in designation:
+        slo_header = "DIVERSITY SLOS"
+    elif "Biological" in designation:
+        slo_header = "BIOLOGICAL SCIENCES SLOS"
+    elif "Physical" in designation:
+        slo_header = "PHYSICAL SCIENCES SLOS"
+    elif "Mathematics" in designation:
+        slo_header = "MATHEMATICS SLOS"
+    
+    add_table(doc, ("CATEGORY", slo_header, "STATE SLO ASSIGNMENTS", "COURSE-SPECIFIC"), slo_rows)
+
+# ----------------------------------------------------------------------
+# Document skeleton
+#
+# Everything that is identical in every syllabus (page-number footer, grading
+# scale, submission instructions, UF policy blocks, ...) is built once into a
+# skeleton document. Each build loads a copy of the skeleton and splices in
+# pre-rendered XML fragments, so only course-specific content is built per
+# syllabus. Hyperlink relationships used by the fragments live in the
+# skeleton, so the r:id references in the fragments stay valid in every copy.
+
+def _add_page_number_footer(doc):
+    """Add "Page N" to the footer using a PAGE field"""
+    section = doc.sections[0]
+    footer = section.footer
+    paragraph = footer.paragraphs[0]
+    paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    paragraph.text = "Page "
+    
+    # Add a field for the page number
+    run = paragraph.add_run()
+    fldChar1 = OxmlElement('w:fldChar')
+    fldChar1.set(qn('w:fldCharType'), 'begin')
+    run._element.append(fldChar1)
+    
+    instrText = OxmlElement('w:instrText')
+    instrText.set(qn('xml:space'), 'preserve')
+    instrText.text = "PAGE"
+    run._element.append(instrText)
+    
+    fldChar2 = OxmlElement('w:fldChar')
+    fldChar2.set(qn('w:fldCharType'), 'end')
+    run._element.append(fldChar2)
+
+def _static_gen_ed_designation(doc):
+    doc.add_heading(f"General Education Designation: {GEN_ED_DESIGNATION}", level=1)
+    doc.add_paragraph(gen_ed_default)
+
+def _static_objectives_intro(doc):
+    doc.add_heading("Course Objectives", level=1)
+    p = doc.add_paragraph("All General Education area objectives can be found ")
+    add_hyperlink(p, "here", "https://undergrad.aa.ufl.edu/general-education/gen-ed-program/subject-area-objectives/")
+    p.add_run(".")
+
+def _static_outcomes_intro(doc):
+    doc.add_heading("II. Student Learning Outcomes", level=1)
+    doc.add_paragraph("A student who successfully completes this course will:")
+
+def _static_slo_table_default(doc):
+    _add_slo_table(doc, [(category, slo, assignments, "") for category, slo, assignments in slo_table_default])
+
+def _static_grading_scale(doc):
+    doc.add_heading("Grading Scale", level=2)
+    
+    add_table(doc, ("Letter Grade", "Number Grade"), GRADING_SCALE)
+    
+    # Add UF grading policies note
+    p = doc.add_paragraph()
+    p.add_run("See the UF Catalog's ") 
+    add_hyperlink(p, "Grades and Grading Policies", "https://catalog.ufl.edu/UGRD/academic-regulations/grades-grading-policies/")
+    p.add_run(" for information on how UF assigns grade points.")
+
+def _static_grading_rounding(doc):
+    doc.add_paragraph(grading_rounding_default)
+
+def _static_submission_instructions(doc):
+    # Add minimum grade note
+    p = doc.add_paragraph()
+    p.add_run("Note: A minimum grade of C is required to earn General Education credit.")
+    
+    # Instructions for Submitting Written Assignments
+    doc.add_heading("Instructions for Submitting Written Assignments", level=1)
+    doc.add_paragraph("All written assignments must be submitted as Word documents (.doc or .docx) through the \"Assignments\" portal in Canvas by the specified deadlines. Do NOT send assignments as PDF files.")
+
+def _static_uf_policies_simplified(doc):
+    doc.add_heading("IV. University Policies and Resources", level=1)
+    add_tokens(doc.add_paragraph(), tokenize(uf_policies_simplified_text, markup=True))
+
+def _static_uf_policies_detailed(doc):
+    doc.add_heading("IV. University Policies and Resources", level=1)
+    
+    # Accommodations, honesty and plagiarism policies
+    for heading, text in UF_POLICIES_DETAILED:
+        doc.add_heading(heading, level=2)
+        add_tokens(doc.add_paragraph(), tokenize(text, markup=True))
+
+STATIC_FRAGMENTS = {
+    "gen_ed_designation": _static_gen_ed_designation,
+    "objectives_intro": _static_objectives_intro,
+    "outcomes_intro": _static_outcomes_intro,
+    "slo_table_default": _static_slo_table_default,
+    "grading_scale": _static_grading_scale,
+    "grading_rounding": _static_grading_rounding,
+    "submission_instructions": _static_submission_instructions,
+    "uf_policies_simplified": _static_uf_policies_simplified,
+    "uf_policies_detailed": _static_uf_policies_detailed,
+}
+
+_skeleton_lock = threading.Lock()
+_skeleton = None  # (skeleton .docx bytes, {fragment name: [serialized XML elements]})
+
+def _build_skeleton():
+    """Build the skeleton document and capture each static fragment's XML"""
+    doc = Document()
+    _add_page_number_footer(doc)
+    
+    body = doc.element.body
+    fragments = {}
+    for name, build in STATIC_FRAGMENTS.items():
+        build(doc)
+        # Lift the new body elements out; their hyperlink relationships stay in the skeleton
+        elements = [el for el in body if el.tag != qn('w:sectPr')]
+        fragments[name] = [etree.tostring(el) for el in elements]
+        for el in elements:
+            body.remove(el)
+    
+    return docx_bytes(doc), fragments
+
+def _get_skeleton():
+    global _skeleton
+    with _skeleton_lock:
+        if _skeleton is None:
+            _skeleton = _build_skeleton()
+        return _skeleton
+
+def new_skeleton_document():
+    """Return a fresh Document copied from the cached skeleton"""
+    data, _ = _get_skeleton()
+    return Document(io.BytesIO(data))
+
+def append_static(doc, name):
+    """Append a pre-rendered static fragment to a document created by new_skeleton_document()"""
+    _, fragments = _get_skeleton()
+    sectPr = doc.element.body.sectPr
+    for xml in fragments[name]:
+        sectPr.addprevious(parse_xml(xml))
+
+def build_syllabus_document(content):
+    """
+    Build the Word document for a syllabus following the exact format from the example.
+    
+    Pure function of a SyllabusContent: it never touches Tk widgets, so it can
+    run on a worker thread, in batch jobs or in benchmarks.
+    """
+    course = content.course_info
+    instructor = content.instructor
+    policies = content.policies
+    
+    # Starts from the cached skeleton: footer with page numbers already in place
+    doc = new_skeleton_document()
+    
+    # Title and Course Info (centered)
+    title = doc.add_heading(f"{course.course_num}: {course.course_title}", level=0)
+    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    
+    term = doc.add_paragraph(f"{course.term} ({course.credits} credits)")
+    term.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    
+    doc.add_paragraph()  # Single space after title
+    
+    # I. General Information
+    doc.add_heading("I. General Information", level=1)
+    
+    # Meeting times and location - no extra spacing
+    p = doc.add_paragraph()
+    p.add_run("Meeting days and times: ").bold = True
+    p.add_run(course.meeting_times)
+    
+    p = doc.add_paragraph()
+    p.add_run("Class location: ").bold = True
+    p.add_run(course.location)
+    
+    # Instructor info - compact format
+    p = doc.add_paragraph()
+    p.add_run("\nInstructor:").bold = True
+    
+    instructor_info = [
+        ("Name:", instructor.name),
+        ("Office:", instructor.office),
+        ("Phone:", instructor.phone),
+        ("Email:", instructor.email),
+        ("Office Hours:", instructor.office_hours)
+    ]
+    for label, value in instructor_info:
+        p = doc.add_paragraph()
+        p.paragraph_format.left_indent = Inches(0.25)  # Reduced indentation
+        p.paragraph_format.space_after = Pt(0)  # Remove spacing after paragraphs
+        p.add_run(f"{label} ").bold = True
+        
+        if label == "Email:":
+            # Add email as mailto hyperlink
+            try:
+                add_hyperlink(p, value, f"mailto:{value}")
+            except Exception:
+                # Fallback to plain text if hyperlink creation fails
+                p.add_run(value)
+        else:
+            # Other fields remain as plain text
+            p.add_run(value)
+    
+    # Sections - compact format
+    if content.tas:
+        p = doc.add_paragraph()
+        p.add_run("\nSections:").bold = True
+        
+        for ta in content.tas:
+            for label, value in (("Name: ", ta.name), ("Email: ", ta.email),
+                                 ("Office Hours: ", ta.office_hours),
+                                 ("Class Room: ", ta.class_room), ("Class Time: ", ta.class_time)):
+                p = doc.add_paragraph()
+                p.paragraph_format.left_indent = Inches(0.25)
+                p.paragraph_format.space_after = Pt(0)
+                p.add_run(label).bold = True
+                
+                if label == "Email: ":
+                    # Add email as mailto hyperlink
+                    try:
+                        add_hyperlink(p, value, f"mailto:{value}")
+                    except Exception:
+                        # Fallback to plain text
+                        p.add_run(value)
+                else:
+                    p.add_run(value)
+    
+    # Course Description
+    doc.add_heading("Course Description", level=1)
+    doc.add_paragraph(course.description)
+    
+    # Prerequisites (moved before General Education)
+    doc.add_heading("Prerequisites", level=1)
+    doc.add_paragraph(course.prerequisites)
+    
+    # --- Add General Education Designation (moved after Prerequisites) ---
+    designation = GEN_ED_DESIGNATION
+    if policies.show_gen_ed:
+        # Add the General Education heading and the full description text
+        append_static(doc, "gen_ed_designation")
+        
+        doc.add_paragraph(gen_ed_credit_statement.format(course_num=course.course_num, designation=designation))
+    
+    # Course Objectives (after General Education)
+    append_static(doc, "objectives_intro")
+    
+    for i, obj_text in enumerate(course.objectives, 1):
+        p = doc.add_paragraph(f"{i}. {obj_text}")
+        p.paragraph_format.left_indent = Inches(0.25)
+    
+    # Add Student Learning Outcomes (defaults if none provided)
+    append_static(doc, "outcomes_intro")
+    
+    for i, outcome_text in enumerate(content.outcomes or student_learning_outcomes_default, 1):
+        p = doc.add_paragraph(f"{i}. {outcome_text}")
+        p.paragraph_format.left_indent = Inches(0.25)
+    
+    # If General Education is enabled, add the objectives table after the Student Learning Outcomes
+    if policies.show_gen_ed:
+        if content.slo_rows:
+            _add_slo_table(doc, [(row.category, row.slo, row.assignments, row.course_specific)
+                                 for row in content.slo_rows])
+        else:
+            # Fallback to default table if no custom entries exist
+            append_static(doc, "slo_table_default")
+    
+    # III. Graded Work
+    doc.add_heading("III. Graded Work", level=1)
+    
+    # Materials (if provided)
+    if content.materials is not None and content.materials.required:
+        doc.add_heading("Required Materials", level=2)
+        # --- Use markup parser for formatted output ---
+        add_materials_markup(doc, content.materials.required)
+        # Always include the Materials Fee value
+        p = doc.add_paragraph()
+        p.add_run("\nMaterials Fee: $").bold = True
+        p.add_run(content.materials.fee or "0.00")
+    
+    # Grading Components (Categories and Assignments)
+    if content.grading_categories:
+        doc.add_heading("Grading Components", level=2)
+        
+        # Create a table for categories and weights
+        add_table(doc, ("Category", "Weight"), [
+            (category.name, f"{category.weight}%")
+            for category in content.grading_categories
+            if category.name and category.weight
+        ])
+        
+        # Category descriptions and assignments
+        for category in content.grading_categories:
+            if category.name and category.description:
+                p = doc.add_paragraph()
+                p.add_run(f"\n{category.name}: ").bold = True
+                p.add_run(category.description)
+            
+            has_assignments = False
+            for assignment in category.assignments:
+                if not assignment.title:
+                    continue
+                if not has_assignments:
+                    p = doc.add_paragraph()
+                    p.add_run(f"{category.name} Assignments:").bold = True
+                    has_assignments = True
+                
+                p = doc.add_paragraph()
+                p.paragraph_format.left_indent = Inches(0.25)
+                p.add_run(f"• {assignment.title}")
+                if assignment.due_date:
+                    p.add_run(f" (Due: {assignment.due_date})")
+                if assignment.points:
+                    p.add_run(f" - {assignment.points} points")
+                
+                if assignment.description:
+                    p = doc.add_paragraph(assignment.description)
+                    p.paragraph_format.left_indent = Inches(0.5)
+    
+    # Grading Scale
+    append_static(doc, "grading_scale")
+
+    # Add rounding statement if enabled
+    if policies.grading_rounding:
+        append_static(doc, "grading_rounding")
+
+    # Minimum grade note and Instructions for Submitting Written Assignments
+    append_static(doc, "submission_instructions")
+    
+    # Instructor-specific policies, in document order
+    for heading, text in policies.course_sections():
+        doc.add_heading(heading, level=2)
+        process_text_with_hyperlinks(doc.add_paragraph(), text)
+    
+    # IV. University Policies and Resources (formerly V.)
+    if policies.use_simplified_policies:
+        append_static(doc, "uf_policies_simplified")
+    else:
+        append_static(doc, "uf_policies_detailed")
+    
+    # V. Course Schedule (Calendar) (formerly VI.)
+    doc.add_heading("V. Calendar", level=1)
+    
+    schedule = [entry for entry in content.schedule if not entry.is_empty()]  # Skip empty rows
+    if schedule:
+        add_table(doc, ("Date", "Topic", "Readings/Preparation", "Work Due"), [
+            (entry.date.strip(), entry.topic.strip(), entry.readings.strip(), entry.work_due.strip())
+            for entry in schedule
+        ])
+    else:
+        doc.add_paragraph("Schedule will be provided separately.")
+
+    return doc
@@ -3,37 +3,80 @@ History Syllabus Generator - Main Application File
 This is the main entry point for the History Syllabus Generator application.
 """
 
+import sys
+from startup_profile import StartupProfile
+
+# --startup-profile reports import and tab-creation times (see startup_profile.py)
+STARTUP_PROFILE = StartupProfile.from_argv(sys.argv)
+STARTUP_PROFILE.start_import_timing()
+
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, simpledialog
 from tkinter import scrolledtext
 import os
-import sys
+import sqlite3
 
 # Import the modules we've created
 from constants import *
-from templates import SyllabusTemplate, load_default_templates
+from templates import SyllabusTemplate, load_default_templates, template_from_content
+from template_store import TemplateStore, template_name
+from template_library import BUILTIN, PAGE_SIZE, TemplateLibrary
+from syllabus_model import (
+    SyllabusContent, CourseInfo, InstructorInfo, Section, SloRow, Assignment,
+    GradingCategory, Materials, Policies, ScheduleEntry
+)
 from ui_tabs import UITabsMixin
 from document_generation import DocumentGenerationMixin
 from document_preview import DocumentPreviewMixin
+from text_preview import TextPreviewMixin
 
-class HistorySyllabusGenerator(UITabsMixin, DocumentGenerationMixin, DocumentPreviewMixin):
+STARTUP_PROFILE.stop_import_timing()
+
+# Last entry of the template selector when a search has more matches than one page
+MORE_TEMPLATES = "More results..."
+
+class HistorySyllabusGenerator(UITabsMixin, DocumentGenerationMixin, DocumentPreviewMixin, TextPreviewMixin):
     """Main application class for the History Syllabus Generator"""
     
-    def __init__(self):
+    def __init__(self, prewarm=True):
+        STARTUP_PROFILE.instrument(self)
         self.root = tk.Tk()
         self.root.title("History Syllabus Generator")
         self.root.state('zoomed')
         self.current_template = None
+        # Current page of template search results (template_library.LibraryEntry) and their names
         self.templates = []
         self.template_names = []
+        self.template_query = ""
+        self.template_total = 0
+        self.template_search_delay_ms = 150
+        self._template_search_job = None
         # Store Sections (keeping ta_entries variable name for compatibility)
         self.ta_entries = []
-        # Store schedule entries
-        self.schedule_entries = []
+        # Schedule editor (see schedule_grid.ScheduleGrid); created with the Calendar tab
+        self.schedule_grid = None
+        # Last inputs of the Generate Dates dialog (see UITabsMixin.open_term_calendar)
+        self.term_calendar_settings = {}
         # Store category frames
         self.category_frames = []
         # Store learning objective entries
         self.learning_objectives_entries = {}
+        # Document preview refresh scheduler (see DocumentPreviewMixin.schedule_preview_refresh)
+        self.preview_refresh_delay_ms = 300
+        self.preview_refresh_stats = {"requested": 0, "performed": 0, "dropped": 0, "sections_rendered": 0}
+        self._preview_refresh_job = None
+        # Nesting depth of preview_refresh_suspended() and whether a refresh was held back
+        self._preview_refresh_suspended = 0
+        self._preview_refresh_held = False
+        # Background syllabus export in progress (see DocumentGenerationMixin.generate_syllabus)
+        self._generation_job = None
+        # Tabs not built yet and the field values they will show (see UITabsMixin.add_lazy_tab)
+        self._lazy_tabs = {}
+        self.pending_field_values = {}
+        # Content-addressed cache of generated documents (see DocumentGenerationMixin.get_output_cache)
+        self.output_cache = None
+        # Import python-docx/ReportLab in the background once the window is up (see DocumentGenerationMixin.start_prewarm)
+        self.prewarm_on_startup = prewarm
         # Set up styles
         self.setup_styles()
         # Add variable for Gen Ed toggle
@@ -80,10 +123,12 @@ class HistorySyllabusGenerator(UITabsMixin, DocumentGenerationMixin, DocumentPre
         # Then create the main interface
         self.create_main_interface()
         
-        self.templates = load_default_templates()
-        
-        self.template_names = [f"{t.course_code}: {t.title}" for t in self.templates]
-        self.template_combo['values'] = ["Clear Template"] + self.template_names
+        # Built-in templates plus the saved ones; only the store's index is read here,
+        # and the selector is filled from the library's search index a page at a time
+        self.default_templates = load_default_templates()
+        self.template_store = TemplateStore()
+        self.template_library = self.open_template_library()
+        self.refresh_template_list()
 
     def setup_styles(self):
         """Set up ttk styles for the application"""
@@ -131,22 +176,41 @@ class HistorySyllabusGenerator(UITabsMixin, DocumentGenerationMixin, DocumentPre
         
         tk.Label(template_frame, text="Load Template:", font=('Arial', 10, 'bold')).pack(side=tk.LEFT)
         
-        self.template_combo = ttk.Combobox(template_frame, values=["Clear Template"], state="readonly", width=25)
+        # Editable: typing searches the template library (course code, title, description, objectives, readings)
+        self.template_combo = ttk.Combobox(template_frame, values=["Clear Template"], width=40)
         self.template_combo.pack(side=tk.LEFT, padx=(10, 0))
         self.template_combo.bind("<<ComboboxSelected>>", self.on_template_selected)
+        self.template_combo.bind("<KeyRelease>", self.on_template_typed)
+        self.template_combo.bind("<Return>", self.on_template_return)
         self.template_combo.set("Clear Template")
         
+        self.template_count_var = tk.StringVar()
+        tk.Label(template_frame, textvariable=self.template_count_var, fg='gray').pack(side=tk.LEFT, padx=(10, 0))
+        
         # Create notebook for tabs
         self.notebook = ttk.Notebook(self.main_container)
         self.notebook.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
         
-        # Create all tabs using methods from UITabsMixin
+        # Create the first tab now; the others are built the first time they are selected
         self.create_course_info_tab()
-        self.create_instructor_info_tab()
-        self.create_schedule_tab()
-        self.create_assignments_tab()
-        self.create_policies_tab()
-        self.create_document_preview_tab()
+        self.add_lazy_tab("★ Instructor Information", self.create_instructor_info_tab)
+        self.add_lazy_tab("★ Calendar/Course Schedule", self.create_schedule_tab, {"schedule_grid": ()})
+        self.add_lazy_tab("★ Assignments & Grading [Required]", self.create_assignments_tab, {
+            "materials_text": required_materials_default,
+            "fee_entry": "",
+        })
+        self.add_lazy_tab("Policies", self.create_policies_tab, {
+            "canvas_policy_text": canvas_policy_default,
+            "technology_policy_text": technology_policy_default,
+            "communication_policy_text": class_communication_policy_default,
+            "support_text": assignment_support_default,
+            "late_policy_var": "Custom",
+            "late_policy_text": late_policy_default,
+            "extra_credit_var": "Custom",
+            "extra_credit_text": extra_credit_policy_default,
+        })
+        self.add_lazy_tab("Document Preview", self.create_document_preview_tab)
 
     def on_template_selected(self, event=None):
         """Handle template selection from dropdown"""
@@ -154,15 +218,100 @@ class HistorySyllabusGenerator(UITabsMixin, DocumentGenerationMixin, DocumentPre
         
         if selected == "Clear Template":
             self.clear_all_fields()
-        else:
-            # Find the template
-            template_index = self.template_names.index(selected)
-            template = self.templates[template_index]
-            self.load_template_content(template)
+        elif selected == MORE_TEMPLATES:
+            # Append the next page of results and reopen the list where the user left off
+            self.search_templates(self.template_query, offset=len(self.templates))
+            self.template_combo.set(self.template_query)
+            self.template_combo.event_generate("<Down>")
+        elif selected in self.template_names:
+            entry = self.templates[self.template_names.index(selected)]
+            template = self.resolve_template(entry)
+            if template is not None:
+                self.load_template_content(template)
+
+    def resolve_template(self, entry):
+        """The template behind a search result; saved templates are read from disk the first time they are chosen"""
+        if entry.source == BUILTIN:
+            for template in self.default_templates:
+                if template_name(template.course_code, template.title) == entry.name:
+                    return template
+            messagebox.showerror("Error", f"Built-in template '{entry.name}' no longer exists.")
+            return None
+        try:
+            return self.template_store.load(entry.id)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"Could not load template '{entry.name}':\n{str(e)}")
+            return None
+
+    def open_template_library(self):
+        """Open the template search index, or an in-memory one if the database file can't be used"""
+        try:
+            return TemplateLibrary()
+        except (sqlite3.Error, OSError) as e:
+            print(f"Template library unavailable ({e}); indexing templates in memory for this session")
+            return TemplateLibrary(":memory:")
+
+    def refresh_template_list(self):
+        """Bring the search index up to date with the saved and built-in templates, then redo the current search"""
+        try:
+            self.template_library.sync(self.template_store, self.default_templates)
+        except sqlite3.Error as e:
+            print(f"Error updating the template library: {e}")
+            import traceback
+            traceback.print_exc()
+        self.search_templates(self.template_query)
+
+    def search_templates(self, query, offset=0):
+        """Fill the template selector with one page of matches (appended to the list when offset > 0)"""
+        try:
+            entries, self.template_total = self.template_library.search(query, PAGE_SIZE, offset)
+        except sqlite3.Error as e:
+            print(f"Error searching templates: {e}")
+            entries, self.template_total = [], 0
+        self.template_query = query
+        self.templates = self.templates + entries if offset else entries
+        self.template_names = [entry.name for entry in self.templates]
+        
+        values = ["Clear Template"] + self.template_names
+        if len(self.templates) < self.template_total:
+            values.append(MORE_TEMPLATES)
+        self.template_combo['values'] = values
+        self.template_count_var.set(
+            f"{self.template_total} match{'es' if self.template_total != 1 else ''}" if query.strip()
+            else f"{self.template_total} templates"
+        )
+
+    def on_template_typed(self, event=None):
+        """Search as the user types, once typing pauses"""
+        if event is not None and event.keysym in ("Return", "Escape", "Up", "Down", "Tab"):
+            return
+        if self._template_search_job is not None:
+            self.root.after_cancel(self._template_search_job)
+        self._template_search_job = self.root.after(self.template_search_delay_ms, self.run_template_search)
+
+    def run_template_search(self):
+        self._template_search_job = None
+        query = self.template_combo.get()
+        if query in ("Clear Template", MORE_TEMPLATES) or query in self.template_names:
+            return
+        self.search_templates(query)
+
+    def on_template_return(self, event=None):
+        """Enter loads the best match for the typed text"""
+        if self._template_search_job is not None:
+            self.root.after_cancel(self._template_search_job)
+            self.run_template_search()
+        if self.template_combo.get() not in self.template_names and self.template_names:
+            self.template_combo.set(self.template_names[0])
+        self.on_template_selected()
+        return "break"
 
     def load_template_content(self, template):
         """Load template content into form fields"""
         try:
+            # Templates fill in every tab, so build the ones not visited yet
+            self.build_all_tabs()
+            
             # Clear existing content first using the comprehensive clearing method
             self.clear_all_fields()
             
@@ -179,7 +328,7 @@ class HistorySyllabusGenerator(UITabsMixin, DocumentGenerationMixin, DocumentPre
             if hasattr(template, 'credits'):
                 self.entry_credits.insert(0, template.credits)
             if hasattr(template, 'class_days') and hasattr(template, 'class_times'):
-                meeting_times = f"{template.class_days} {template.class_times}"
+                meeting_times = " ".join(part for part in (template.class_days, template.class_times) if part)
                 self.entry_meeting_times.insert(0, meeting_times)
             if hasattr(template, 'classroom'):
                 self.entry_location.insert(0, template.classroom)
@@ -227,13 +376,15 @@ class HistorySyllabusGenerator(UITabsMixin, DocumentGenerationMixin, DocumentPre
                 
             # Schedule
             if hasattr(template, 'schedule') and template.schedule:
-                for entry in template.schedule:
-                    self.add_schedule_entry(
+                self.set_field_value('schedule_grid', tuple(
+                    ScheduleEntry(
                         entry.get('date', ''),
                         entry.get('topic', ''),
                         entry.get('readings', ''),
                         entry.get('work_due', '')
                     )
+                    for entry in template.schedule
+                ))
                     
             # Learning Objectives Table
             if hasattr(template, 'learning_objectives') and template.learning_objectives:
@@ -342,17 +493,7 @@ class HistorySyllabusGenerator(UITabsMixin, DocumentGenerationMixin, DocumentPre
             self.outcome_entries.clear()
         
         # Clear schedule properly
-        if hasattr(self, 'schedule_entries'):
-            for entry_dict in self.schedule_entries[:]:
-                # Handle the new grid-based schedule entries
-                if "readings_frame" in entry_dict:
-                    entry_dict["readings_frame"].destroy()
-                if "delete_btn" in entry_dict:
-                    entry_dict["delete_btn"].destroy()
-                entry_dict["date"].destroy()
-                entry_dict["topic"].destroy()
-                entry_dict["work_due"].destroy()
-            self.schedule_entries.clear()
+        self.set_field_value('schedule_grid', ())
         
         # Clear assignment categories properly
         if hasattr(self, 'category_frames'):
@@ -395,23 +536,24 @@ class HistorySyllabusGenerator(UITabsMixin, DocumentGenerationMixin, DocumentPre
         if hasattr(self, 'late_policy_text'):
             self.late_policy_text.delete("1.0", tk.END)
             # Restore default late policy text
-            default_late_text = "Late assignments will be penalized 10% per day late unless prior arrangements have been made with the instructor due to documented emergency or illness. Contact instructor as soon as possible if you anticipate being unable to meet a deadline."
-            self.late_policy_text.insert("1.0", default_late_text)
+            self.late_policy_text.insert("1.0", late_policy_default)
         if hasattr(self, 'extra_credit_text'):
             self.extra_credit_text.delete("1.0", tk.END)
             # Restore default extra credit text
-            default_extra_credit_text = "Extra credit opportunities may be available at the instructor's discretion. These will be announced in class and posted on Canvas when available."
-            self.extra_credit_text.insert("1.0", default_extra_credit_text)
+            self.extra_credit_text.insert("1.0", extra_credit_policy_default)
             
         # Reset dropdown selections to default values
         if hasattr(self, 'late_policy_var'):
             self.late_policy_var.set("Custom")
         if hasattr(self, 'extra_credit_var'):
             self.extra_credit_var.set("Custom")
+        
+        # Tabs that haven't been built go back to their defaults
+        self.reset_pending_field_values()
     
         # Update any previews that might be affected
-        if hasattr(self, 'update_document_preview'):
-            self.update_document_preview()
+        if hasattr(self, 'schedule_preview_refresh'):
+            self.schedule_preview_refresh()
         if hasattr(self, 'update_lo_preview'):
             self.update_lo_preview()
         if hasattr(self, 'update_outcomes_references'):
@@ -419,6 +561,8 @@ class HistorySyllabusGenerator(UITabsMixin, DocumentGenerationMixin, DocumentPre
 
     def load_template(self, template):
         """Load a template into the form fields"""
+        self.build_all_tabs()
+        
         # Clear existing data first
         self.clear_all_fields()
         
@@ -489,7 +633,7 @@ class HistorySyllabusGenerator(UITabsMixin, DocumentGenerationMixin, DocumentPre
             frame.destroy()
             self.objective_entries.remove(obj_dict)
             self.renumber_objectives()
-            self.update_document_preview()
+            self.schedule_preview_refresh()
         
         remove_btn = ttk.Button(frame, text="X", command=remove_objective, style="Delete.TButton")
         remove_btn.pack(side=tk.LEFT, padx=5)
@@ -497,7 +641,7 @@ class HistorySyllabusGenerator(UITabsMixin, DocumentGenerationMixin, DocumentPre
         obj_dict = {"frame": frame, "number": number_label, "entry": entry}
         self.objective_entries.append(obj_dict)
         
-        entry.bind("<KeyRelease>", lambda e: self.update_document_preview())
+        entry.bind("<KeyRelease>", self.schedule_preview_refresh)
         
         return obj_dict
 
@@ -556,6 +700,7 @@ class HistorySyllabusGenerator(UITabsMixin, DocumentGenerationMixin, DocumentPre
         """Update both previews"""
         self.update_outcomes_references()
         self.update_lo_preview()
+        self.schedule_preview_refresh()
 
     def renumber_outcomes(self):
         """Update the numbering of outcome entries after one is removed"""
@@ -628,161 +773,171 @@ class HistorySyllabusGenerator(UITabsMixin, DocumentGenerationMixin, DocumentPre
 
     def run(self):
         """Start the application main loop"""
+        self.root.after_idle(self.on_window_ready)
         self.root.mainloop()
 
+    def on_window_ready(self):
+        """Runs once the window is first idle: report startup timings and pre-warm document generation"""
+        STARTUP_PROFILE.report()
+        if self.prewarm_on_startup:
+            self.start_prewarm()
+
     def on_tab_changed(self, event):
         """Update preview when tab changes"""
         try:
             selected_tab = self.notebook.select()
-            tab_id = self.notebook.index(selected_tab)
-            # Document Preview tab
-            if tab_id == 6:  # Document Preview tab
+            # First visit: build the tab; selecting it fires this handler again
+            if selected_tab in self._lazy_tabs:
+                self.build_lazy_tab(selected_tab)
+                return
+            # Document Preview tab - refreshes dropped while it was hidden are applied now
+            if hasattr(self, 'preview_tab') and selected_tab == str(self.preview_tab):
                 if hasattr(self, 'update_document_preview'):
                     self.update_document_preview()
-            elif tab_id == 2:  # Learning Objectives tab
+            elif hasattr(self, 'lo_tab') and selected_tab == str(self.lo_tab):
                 if hasattr(self, 'update_lo_preview'):
                     self.update_lo_preview()
         except Exception as e:
             print(f"Error changing tabs: {e}")
 
     def gather_content(self):
-        """Gather all content from form fields"""
+        """
+        Gather all content from form fields into an immutable SyllabusContent.
+        
+        This is the only place document generation reads widgets; the result can
+        be handed to build_syllabus_document() on any thread.
+        """
         try:
-            content = {
-                "course_info": {
-                    "course_num": self.entry_course_num.get() if hasattr(self, 'entry_course_num') else "",
-                    "course_title": self.entry_course_title.get() if hasattr(self, 'entry_course_title') else "",
-                    "term": self.entry_term.get() if hasattr(self, 'entry_term') else "",
-                    "credits": self.entry_credits.get() if hasattr(self, 'entry_credits') else "",
-                    "prerequisites": self.entry_prerequisites.get() if hasattr(self, 'entry_prerequisites') else "",
-                    "meeting_times": self.entry_meeting_times.get() if hasattr(self, 'entry_meeting_times') else "",
-                    "location": self.entry_location.get() if hasattr(self, 'entry_location') else "",
-                    "description": self.txt_description.get("1.0", tk.END).strip() if hasattr(self, 'txt_description') else "",
-                    "objectives": "\n".join([obj["entry"].get().strip() for obj in self.objective_entries if obj["entry"].get().strip()]) if hasattr(self, 'objective_entries') else ""
-                },
-                "instructor_info": {
-                    "name": self.entry_instr_name.get() if hasattr(self, 'entry_instr_name') else "",
-                    "office": self.entry_instr_office.get() if hasattr(self, 'entry_instr_office') else "",
-                    "phone": self.entry_instr_phone.get() if hasattr(self, 'entry_instr_phone') else "",
-                    "email": self.entry_instr_email.get() if hasattr(self, 'entry_instr_email') else "",
-                    "office_hours": self.entry_instr_office_hours.get() if hasattr(self, 'entry_instr_office_hours') else ""
-                },
-                "tas": [],
-                "outcomes": [],
-                "schedule": [],
-                "grading_categories": [],
-                "optional_policies": {},
-                "late_policy": "",
-                "extra_credit_policy": "",
-                "canvas_policy": self.canvas_policy_text.get("1.0", tk.END).strip() if hasattr(self, 'canvas_policy_text') else "",
-                "technology_policy": self.technology_policy_text.get("1.0", tk.END).strip() if hasattr(self, 'technology_policy_text') else "",
-                "communication_policy": self.communication_policy_text.get("1.0", tk.END).strip() if hasattr(self, 'communication_policy_text') else "",
-                "support_policy": self.support_text.get("1.0", tk.END).strip() if hasattr(self, 'support_text') else "",
-                "learning_objectives": {}
-            }
+            # Fields of tabs that haven't been built yet come from pending_field_values
+            def entry_value(attr_name):
+                return self.field_value(attr_name)
 
-            # Gather outcomes from the new numbered list
-            if hasattr(self, 'outcome_entries'):
-                content["outcomes"] = [
-                    {"text": outcome_entry["entry"].get().strip()}
-                    for outcome_entry in self.outcome_entries if outcome_entry["entry"].get().strip()
-                ]
-
-            # Gather TAs
-            if hasattr(self, 'ta_entries'):
-                for ta_entry_widgets in self.ta_entries:
-                    if len(ta_entry_widgets) == 5:
-                         content["tas"].append({
-                            "name": ta_entry_widgets[0].get(),
-                            "email": ta_entry_widgets[1].get(),
-                            "office_hours": ta_entry_widgets[2].get(),
-                            "class_room": ta_entry_widgets[3].get(),
-                            "class_time": ta_entry_widgets[4].get()
-                        })
-
-            # Gather schedule
-            if hasattr(self, 'schedule_entries'):
-                for entry in self.schedule_entries:
-                    content["schedule"].append({
-                        "date": entry["date"].get(),
-                        "topic": entry["topic"].get(),
-                        "readings": entry["readings"].get("1.0", tk.END).strip(),
-                        "work_due": entry["work_due"].get()
-                    })
-
-            # Gather assignment categories
-            if hasattr(self, 'category_frames'):
-                for category in self.category_frames:
-                    assignments_data = []
-                    if "assignments" in category:
-                        for assignment in category["assignments"]:
-                            assignments_data.append({
-                                "title": assignment["title"].get(),
-                                "due_date": assignment["due date"].get(),
-                                "points": assignment["points"].get(),
-                                "description": assignment["description"].get("1.0", tk.END).strip()
-                            })
-                    content["grading_categories"].append({
-                        "name": category["name"].get(),
-                        "weight": category["weight"].get(),
-                        "description": category["description"].get("1.0", tk.END).strip(),
-                        "assignments": assignments_data
-                    })
-
-            # Gather learning objectives table data
-            if hasattr(self, 'learning_objectives_entries'):
-                for category_key, entries in self.learning_objectives_entries.items():
-                    category_name = entries.get('name_entry').get() if 'name_entry' in entries else category_key
-                    if category_name:
-                        content["learning_objectives"][category_name] = {
-                            "slo": entries['slo'].get("1.0", tk.END).strip(),
-                            "assignments": entries['assignments'].get("1.0", tk.END).strip(),
-                            "course_specific": entries['course_specific'].get("1.0", tk.END).strip()
-                        }
-
-            # Gather optional policies boolean values
-            if hasattr(self, 'optional_policies'):
-                for policy_name, policy_var in self.optional_policies.items():
-                    content["optional_policies"][policy_name] = policy_var.get()
-
-            # Keep only the instructor-specific policy options
-            content["optional_policies"]["outside_support"] = self.outside_support_var.get() if hasattr(self, 'outside_support_var') else True
-            content["optional_policies"]["show_gen_ed"] = self.show_gen_ed.get() if hasattr(self, 'show_gen_ed') else True
-
-            if hasattr(self, 'materials_text'):
-                content["materials"] = {
-                    "required": self.materials_text.get("1.0", tk.END).strip(),
-                    "fee": self.fee_entry.get() if hasattr(self, 'fee_entry') else ""
-                }
-
-            # Add policy details if available
-            if hasattr(self, 'late_policy_var'):
-                content["late_policy"] = self.late_policy_var.get()
-                if hasattr(self, 'late_policy_text'):
-                     content["late_policy_text"] = self.late_policy_text.get("1.0", tk.END).strip()
-
-            if hasattr(self, 'extra_credit_var'):
-                content["extra_credit_policy"] = self.extra_credit_var.get()
-                if hasattr(self, 'extra_credit_text'):
-                    content["extra_credit_policy_text"] = self.extra_credit_text.get("1.0", tk.END).strip()
-
-            return content
+            def text_value(attr_name):
+                return self.field_value(attr_name).strip()
+
+            def flag(attr_name, default=True):
+                return getattr(self, attr_name).get() if hasattr(self, attr_name) else default
+
+            course_info = CourseInfo(
+                course_num=entry_value('entry_course_num'),
+                course_title=entry_value('entry_course_title'),
+                term=entry_value('entry_term'),
+                credits=entry_value('entry_credits'),
+                prerequisites=entry_value('entry_prerequisites').strip(),
+                meeting_times=entry_value('entry_meeting_times'),
+                location=entry_value('entry_location'),
+                description=text_value('txt_description'),
+                objectives=tuple(
+                    obj["entry"].get().strip() for obj in getattr(self, 'objective_entries', [])
+                    if obj["entry"].get().strip()
+                )
+            )
+
+            instructor = InstructorInfo(
+                name=entry_value('entry_instr_name'),
+                office=entry_value('entry_instr_office'),
+                phone=entry_value('entry_instr_phone'),
+                email=entry_value('entry_instr_email'),
+                office_hours=entry_value('entry_instr_office_hours')
+            )
+
+            # Sections
+            tas = tuple(
+                Section(*(widget.get() for widget in ta_entry_widgets[:5]))
+                for ta_entry_widgets in getattr(self, 'ta_entries', [])
+                if len(ta_entry_widgets) == 5
+            )
+
+            # Outcomes from the numbered list
+            outcomes = tuple(
+                outcome_entry["entry"].get().strip() for outcome_entry in getattr(self, 'outcome_entries', [])
+                if outcome_entry["entry"].get().strip()
+            )
+
+            # Learning objectives table, skipping categories that were removed
+            slo_rows = []
+            for category_key, entries in getattr(self, 'learning_objectives_entries', {}).items():
+                if 'frame' in entries and not entries['frame'].winfo_exists():
+                    continue
+                category_name = entries['name_entry'].get() if 'name_entry' in entries else category_key
+                if category_name:
+                    slo_rows.append(SloRow(
+                        category=category_name,
+                        slo=entries['slo'].get("1.0", tk.END).strip(),
+                        assignments=entries['assignments'].get("1.0", tk.END).strip(),
+                        course_specific=entries['course_specific'].get("1.0", tk.END).strip()
+                    ))
+
+            # Assignment categories
+            grading_categories = tuple(
+                GradingCategory(
+                    name=category["name"].get().strip(),
+                    weight=category["weight"].get().strip(),
+                    description=category["description"].get("1.0", tk.END).strip(),
+                    assignments=tuple(
+                        Assignment(
+                            title=assignment["title"].get().strip(),
+                            due_date=assignment["due date"].get().strip(),
+                            points=assignment["points"].get().strip(),
+                            description=assignment["description"].get("1.0", tk.END).strip()
+                        )
+                        for assignment in category.get("assignments", [])
+                    )
+                )
+                for category in getattr(self, 'category_frames', [])
+            )
+
+            materials = None
+            if hasattr(self, 'materials_text') or 'materials_text' in self.pending_field_values:
+                materials = Materials(required=text_value('materials_text'),
+                                      fee=entry_value('fee_entry').strip())
+
+            # Late/extra credit text falls back to the selected dropdown policy
+            late_choice = self.field_value('late_policy_var')
+            late_text = text_value('late_policy_text') or self.late_policies.get(late_choice, "")
+            extra_credit_choice = self.field_value('extra_credit_var')
+            extra_credit_text = text_value('extra_credit_text') or self.extra_credit_policies.get(extra_credit_choice, "")
+
+            policies = Policies(
+                show_gen_ed=flag('show_gen_ed'),
+                grading_rounding=flag('grading_rounding_var', False),
+                use_simplified_policies=flag('use_simplified_policies_var'),
+                late_submissions_enabled=flag('late_submissions_policy_var'),
+                late_policy_choice=late_choice,
+                late_policy_text=late_text,
+                extra_credit_enabled=flag('extra_credit_policy_var'),
+                extra_credit_choice=extra_credit_choice,
+                extra_credit_text=extra_credit_text,
+                canvas_enabled=flag('canvas_policy_var'),
+                canvas_text=text_value('canvas_policy_text'),
+                technology_enabled=flag('technology_policy_var'),
+                technology_text=text_value('technology_policy_text'),
+                communication_enabled=flag('communication_policy_var'),
+                communication_text=text_value('communication_policy_text'),
+                outside_support_enabled=flag('outside_support_var'),
+                support_text=text_value('support_text')
+            )
+
+            # Schedule
+            schedule = self.field_value('schedule_grid', ())
+
+            return SyllabusContent(
+                course_info=course_info,
+                instructor=instructor,
+                tas=tas,
+                outcomes=outcomes,
+                slo_rows=tuple(slo_rows),
+                grading_categories=grading_categories,
+                materials=materials,
+                policies=policies,
+                schedule=schedule
+            )
 
         except Exception as e:
             print(f"Error gathering content: {e}")
             import traceback
             traceback.print_exc()
-            return {
-                "course_info": {
-                    "course_num": "", "course_title": "", "term": "", "credits": "", "prerequisites": "",
-                    "meeting_times": "", "location": "", "description": "", "objectives": ""
-                },
-                "instructor_info": {"name": "", "office": "", "phone": "", "email": "", "office_hours": ""},
-                "tas": [], "outcomes": [], "schedule": [], "grading_categories": [],
-                "optional_policies": {}, "learning_objectives": {}, "materials": {"required": "", "fee": ""},
-                "late_policy": "", "extra_credit_policy": "", "canvas_policy": "", "technology_policy": "",
-                "communication_policy": "", "support_policy": ""
-            }
+            return SyllabusContent()
 
     def add_category(self, name="", weight="", description=""):
         """Add a new empty grading category"""
@@ -931,11 +1086,7 @@ class HistorySyllabusGenerator(UITabsMixin, DocumentGenerationMixin, DocumentPre
                     obj_dict["frame"].destroy()
             self.objective_entries.clear()
 
-        if hasattr(self, 'schedule_entries'):
-            for entry_dict in self.schedule_entries[:]:
-                if entry_dict["frame"].winfo_exists():
-                    entry_dict["frame"].destroy()
-            self.schedule_entries.clear()
+        self.set_field_value('schedule_grid', ())
 
         if hasattr(self, 'category_frames'):
             for category_dict in self.category_frames[:]:
@@ -992,8 +1143,28 @@ class HistorySyllabusGenerator(UITabsMixin, DocumentGenerationMixin, DocumentPre
 
     def save_template(self):
         """Save current form content as a template"""
-        # This method can be implemented later if needed
-        pass
+        template = template_from_content(self.gather_content())
+        if not template.course_code.strip() or not template.title.strip():
+            messagebox.showerror("Error", "Enter a Course Number and Course Title before saving the project.")
+            return
+        
+        name = template_name(template.course_code, template.title)
+        if self.template_store.find(name) and not messagebox.askyesno(
+                "Replace Template", f"A saved template named '{name}' already exists. Replace it?"):
+            return
+        
+        try:
+            self.template_store.save(template)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"Could not save template:\n{str(e)}")
+            import traceback
+            traceback.print_exc()
+            return
+        
+        self.template_query = ""
+        self.refresh_template_list()
+        self.template_combo.set(name)
+        messagebox.showinfo("Template Saved", f"Template '{name}' has been saved to {self.template_store.directory}.")
 
     def import_schedule(self):
         """Import schedule from file"""
@@ -1014,5 +1185,6 @@ class HistorySyllabusGenerator(UITabsMixin, DocumentGenerationMixin, DocumentPre
             UITabsMixin.export_schedule_example(self)
 
 if __name__ == "__main__":
-    app = HistorySyllabusGenerator()
+    # --no-prewarm: load the document libraries only when a syllabus is first generated
+    app = HistorySyllabusGenerator(prewarm="--no-prewarm" not in sys.argv)
     app.run()
@@ -0,0 +1,82 @@
+"""
+Markup Module for History Syllabus Generator
+Single tokenizer for the light markup used in syllabus text.
+
+tokenize() splits text into Tokens (plain text, bold, italic, links and
+email addresses) with one precompiled pattern in a single pass. Results are
+memoized, so the Word builder, the PDF renderer and both previews can all
+consume the same tokens and render the same links.
+
+Supported syntax:
+  - **bold** and *italic* (materials markup only)
+  - [text](url) (materials markup only)
+  - bare http(s) URLs; trailing punctuation such as "." is not part of the link
+  - email addresses (linked as mailto:)
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+TEXT = "text"
+BOLD = "bold"
+ITALIC = "italic"
+LINK = "link"
+EMAIL = "email"
+
+_URL = r"""(?P<url>https?://[^\s'"<>]+[^\s'"<>.,;:])"""
+_EMAIL = r"(?P<email>[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})"
+
+# Bare links only: used for policy and description text, where asterisks are literal
+LINK_PATTERN = re.compile(f"{_URL}|{_EMAIL}")
+
+# Required Materials markup; the earliest match wins, so [text](url) takes precedence over its bare URL
+MARKUP_PATTERN = re.compile(
+    r"\*\*(?P<bold>.*?)\*\*"
+    r"|\*(?P<italic>.*?)\*"
+    r"|\[(?P<label>.*?)\]\((?P<href>.*?)\)"
+    f"|{_URL}|{_EMAIL}"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Token:
+    """One run of text; url is set for LINK and EMAIL tokens"""
+    kind: str
+    text: str
+    url: str = ""
+
+
+def _token(match):
+    if match.group("url") is not None:
+        url = match.group("url")
+        return Token(LINK, url, url)
+    if match.group("email") is not None:
+        email = match.group("email")
+        return Token(EMAIL, email, f"mailto:{email}")
+    if match.group("bold") is not None:
+        return Token(BOLD, match.group("bold"))
+    if match.group("italic") is not None:
+        return Token(ITALIC, match.group("italic"))
+    return Token(LINK, match.group("label"), match.group("href"))
+
+
+@lru_cache(maxsize=1024)
+def tokenize(text, markup=False):
+    """
+    Split text into a tuple of Tokens.
+
+    With markup=False only URLs and email addresses are recognized; with
+    markup=True the bold/italic/[text](url) syntax is recognized too.
+    """
+    pattern = MARKUP_PATTERN if markup else LINK_PATTERN
+    tokens = []
+    position = 0
+    for match in pattern.finditer(text):
+        if match.start() > position:
+            tokens.append(Token(TEXT, text[position:match.start()]))
+        tokens.append(_token(match))
+        position = match.end()
+    if position < len(text):
+        tokens.append(Token(TEXT, text[position:]))
+    return tuple(tokens)
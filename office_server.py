@@ -0,0 +1,652 @@
+"""
+Office Server Module for History Syllabus Generator
+Converts Word documents to PDF with LibreOffice.
+
+LibreOfficeServer keeps one headless soffice running and talks to it over a
+local UNO socket, so only the first PDF export pays LibreOffice's cold start.
+When the Python UNO bridge isn't available, SubprocessOfficeConverter runs a
+fresh `soffice --convert-to pdf` per document (the original behaviour).
+Tests can install FakeOfficeConverter with set_office_converter().
+"""
+
+import atexit
+import os
+import pathlib
+import platform
+import queue
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+
+try:
+    import uno
+    UNO_AVAILABLE = True
+except ImportError:
+    UNO_AVAILABLE = False
+
+
+# How often a batch conversion checks soffice's output for progress (seconds)
+GROUP_POLL_INTERVAL = 0.2
+
+# What soffice prints to stderr for an input it can't open before skipping to the next file
+LOAD_ERROR = "source file could not be loaded"
+
+
+class OfficeConversionError(Exception):
+    """Raised when a document could not be converted to PDF"""
+
+
+class OfficeWorkerCrashed(OfficeConversionError):
+    """Raised when soffice died during a conversion (as opposed to rejecting the document)"""
+
+
+def find_soffice():
+    """Return the path of the LibreOffice executable, or None if it isn't installed"""
+    if platform.system() == "Windows":
+        libreoffice_paths = [
+            r"C:\Program Files\LibreOffice\program\soffice.exe",
+            r"C:\Program Files (x86)\LibreOffice\program\soffice.exe",
+        ]
+    elif platform.system() == "Darwin":  # macOS
+        libreoffice_paths = [
+            "/Applications/LibreOffice.app/Contents/MacOS/soffice"
+        ]
+    else:  # Linux
+        libreoffice_paths = [
+            "/usr/bin/libreoffice",
+            "/usr/bin/soffice",
+            "/snap/bin/libreoffice"
+        ]
+
+    for path in libreoffice_paths:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def _free_port():
+    """Ask the OS for an unused local TCP port"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class SubprocessOfficeConverter:
+    """
+    Cold-start converter: one `soffice --headless --convert-to pdf` per document.
+    
+    With isolated=True it uses a private LibreOffice profile, so several
+    converters can run at once without colliding on the user's profile lock.
+    """
+
+    name = "LibreOffice"
+
+    def __init__(self, soffice_path, isolated=False):
+        self.soffice_path = soffice_path
+        self.isolated = isolated
+        self._profile_dir = None
+
+    def convert(self, docx_path, pdf_path, job=None, timeout=30):
+        output_dir = os.path.dirname(os.path.abspath(pdf_path))
+        expected_pdf = os.path.join(output_dir, os.path.splitext(os.path.basename(docx_path))[0] + ".pdf")
+        cmd = [self.soffice_path]
+        if self.isolated:
+            if self._profile_dir is None:
+                self._profile_dir = tempfile.mkdtemp(prefix="syllabus-soffice-")
+                atexit.register(self.shutdown)
+            cmd.append(f"-env:UserInstallation={pathlib.Path(self._profile_dir).as_uri()}")
+        cmd += [
+            "--headless",
+            "--convert-to", "pdf",
+            "--outdir", output_dir,
+            docx_path
+        ]
+
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        if job is not None:
+            job.attach_process(process)
+        try:
+            _, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            raise OfficeConversionError("LibreOffice conversion timed out")
+        finally:
+            if job is not None:
+                job.attach_process(None)
+
+        if job is not None and job.cancelled:
+            # Don't leave a half-written PDF behind
+            if os.path.exists(expected_pdf) and expected_pdf != os.path.abspath(pdf_path):
+                os.remove(expected_pdf)
+            raise OfficeConversionError("PDF export was cancelled")
+
+        if process.returncode < 0:
+            raise OfficeWorkerCrashed(f"LibreOffice crashed (signal {-process.returncode})")
+        if process.returncode != 0:
+            raise OfficeConversionError(f"LibreOffice conversion failed: {stderr}")
+
+        # LibreOffice creates PDF with same name as docx
+        if os.path.exists(expected_pdf) and expected_pdf != os.path.abspath(pdf_path):
+            os.replace(expected_pdf, pdf_path)
+
+    def convert_many(self, pairs, timeout=30):
+        """
+        Convert many (docx_path, pdf_path) pairs with a single soffice invocation.
+
+        LibreOffice names each output after its input, so inputs with the same
+        file name go to separate invocations. Returns {pdf_path: None, or the
+        OfficeConversionError for a file that didn't convert}.
+        """
+        results = {}
+        remaining = list(pairs)
+        while remaining:
+            group, seen, remaining_next = [], set(), []
+            for docx_path, pdf_path in remaining:
+                stem = os.path.splitext(os.path.basename(docx_path))[0]
+                if stem in seen:
+                    remaining_next.append((docx_path, pdf_path))
+                else:
+                    seen.add(stem)
+                    group.append((docx_path, pdf_path))
+            results.update(self._convert_group(group, timeout))
+            remaining = remaining_next
+        return results
+
+    def _convert_group(self, group, timeout):
+        """
+        Convert a group of differently named files, as few soffice invocations as possible.
+
+        soffice converts the files in order. If no new PDF appears for timeout
+        seconds, the file being converted is taken to be hung: soffice is
+        killed, that file fails with a timeout and the files after it go to a
+        new invocation. Files soffice skipped because it couldn't load them
+        fail with that error instead, so a bad document costs one timeout,
+        not one per file.
+        """
+        results = {}
+        while group:
+            converted, group = self._run_group(group, timeout)
+            results.update(converted)
+        return results
+
+    def _run_group(self, group, timeout):
+        """One soffice invocation over group; returns (results, files left to convert after a hang)"""
+        output_dir = tempfile.mkdtemp(prefix="syllabus-pdf-")
+        try:
+            cmd = [self.soffice_path]
+            if self.isolated:
+                if self._profile_dir is None:
+                    self._profile_dir = tempfile.mkdtemp(prefix="syllabus-soffice-")
+                    atexit.register(self.shutdown)
+                cmd.append(f"-env:UserInstallation={pathlib.Path(self._profile_dir).as_uri()}")
+            cmd += ["--headless", "--convert-to", "pdf", "--outdir", output_dir]
+            cmd += [docx_path for docx_path, _ in group]
+            produced = [os.path.join(output_dir, os.path.splitext(os.path.basename(docx_path))[0] + ".pdf")
+                        for docx_path, _ in group]
+
+            hung = False
+            with tempfile.TemporaryFile(mode="w+") as stderr:
+                process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=stderr, text=True)
+                finished, last_progress = 0, time.monotonic()
+                while process.poll() is None:
+                    time.sleep(GROUP_POLL_INTERVAL)
+                    count = sum(1 for path in produced if os.path.exists(path))
+                    if count > finished:
+                        finished, last_progress = count, time.monotonic()
+                    elif time.monotonic() - last_progress > timeout:
+                        process.kill()
+                        process.wait()
+                        hung = True
+                stderr.seek(0)
+                stderr_text = stderr.read()
+
+            if hung:
+                failure = OfficeConversionError("LibreOffice conversion timed out")
+            elif process.returncode < 0:
+                failure = OfficeWorkerCrashed(f"LibreOffice crashed (signal {-process.returncode})")
+            elif process.returncode != 0:
+                failure = OfficeConversionError(f"LibreOffice conversion failed: {stderr_text}")
+            else:
+                failure = OfficeConversionError("LibreOffice did not produce a PDF for this file")
+
+            # soffice reports each file it can't load and moves on, in order, so the n-th
+            # load error belongs to the n-th missing file; the hung file comes after them all
+            load_errors = [line.strip() for line in stderr_text.splitlines() if LOAD_ERROR in line]
+
+            results, remaining = {}, []
+            for (docx_path, pdf_path), output in zip(group, produced):
+                if os.path.exists(output):
+                    shutil.move(output, pdf_path)
+                    results[pdf_path] = None
+                elif load_errors:
+                    results[pdf_path] = OfficeConversionError(f"LibreOffice conversion failed: {load_errors.pop(0)}")
+                elif hung and failure is None:
+                    remaining.append((docx_path, pdf_path))
+                else:
+                    # After a hang only the first missing file (the one soffice was stuck on) fails
+                    results[pdf_path] = failure
+                    if hung:
+                        failure = None
+            return results, remaining
+        finally:
+            shutil.rmtree(output_dir, ignore_errors=True)
+
+    def shutdown(self):
+        """Remove the private profile, if one was created"""
+        if self._profile_dir is not None:
+            shutil.rmtree(self._profile_dir, ignore_errors=True)
+            self._profile_dir = None
+
+
+class LibreOfficeServer:
+    """
+    A long-lived headless LibreOffice reached over a local UNO socket.
+
+    Started lazily on the first conversion, health-checked before each job,
+    restarted if it crashed and shut down when the application exits.
+    Conversions are serialized; soffice handles one document at a time.
+
+    If the server fails to start, jobs go straight to the fallback converter
+    for retry_interval seconds instead of waiting for another failed start.
+    """
+
+    name = "LibreOffice (warm server)"
+
+    def __init__(self, soffice_path, startup_timeout=30, fallback=None, retry_interval=300):
+        self.soffice_path = soffice_path
+        self.startup_timeout = startup_timeout
+        self.retry_interval = retry_interval
+        self.stats = {"starts": 0, "restarts": 0, "conversions": 0, "start_failures": 0, "fallbacks": 0}
+        self._start_failed_at = None
+        self._lock = threading.Lock()
+        self._process = None
+        self._desktop = None
+        self._profile_dir = None
+        self._fallback = fallback or SubprocessOfficeConverter(soffice_path)
+        atexit.register(self.shutdown)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+
+    def is_healthy(self):
+        """Return True if soffice is running and answering UNO calls"""
+        if self._process is None or self._process.poll() is not None or self._desktop is None:
+            return False
+        try:
+            self._desktop.getFrames()
+            return True
+        except Exception:
+            return False
+
+    def _ensure_running(self):
+        if self.is_healthy():
+            return
+        if self._start_failed_at is not None and time.monotonic() - self._start_failed_at < self.retry_interval:
+            raise OfficeConversionError("LibreOffice server failed to start recently")
+        if self._process is not None:
+            # It was running before, so this is a crash recovery
+            self.stats["restarts"] += 1
+            self._stop_process()
+        try:
+            self._start()
+        except (OfficeConversionError, OSError) as e:
+            self._stop_process()  # also removes the private profile
+            self._start_failed_at = time.monotonic()
+            self.stats["start_failures"] += 1
+            raise OfficeConversionError(f"LibreOffice server failed to start: {e}") from e
+        self._start_failed_at = None
+
+    def _start(self):
+        port = _free_port()
+        # A private profile keeps us from colliding with the user's own LibreOffice
+        self._profile_dir = tempfile.mkdtemp(prefix="syllabus-soffice-")
+        cmd = [
+            self.soffice_path,
+            "--headless", "--invisible", "--nologo", "--norestore", "--nodefault",
+            f"-env:UserInstallation={pathlib.Path(self._profile_dir).as_uri()}",
+            f"--accept=socket,host=127.0.0.1,port={port};urp;StarOffice.ComponentContext"
+        ]
+        self._process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        self.stats["starts"] += 1
+
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context)
+        deadline = time.monotonic() + self.startup_timeout
+        while True:
+            try:
+                context = resolver.resolve(
+                    f"uno:socket,host=127.0.0.1,port={port};urp;StarOffice.ComponentContext")
+                self._desktop = context.ServiceManager.createInstanceWithContext(
+                    "com.sun.star.frame.Desktop", context)
+                return
+            except Exception:
+                if self._process.poll() is not None or time.monotonic() > deadline:
+                    self._stop_process()
+                    raise OfficeConversionError("soffice did not accept a UNO connection")
+                time.sleep(0.25)
+
+    def _stop_process(self):
+        if self._desktop is not None:
+            try:
+                self._desktop.terminate()
+            except Exception:
+                pass
+            self._desktop = None
+        if self._process is not None:
+            try:
+                self._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+            self._process = None
+        if self._profile_dir is not None:
+            shutil.rmtree(self._profile_dir, ignore_errors=True)
+            self._profile_dir = None
+
+    def shutdown(self):
+        """Stop soffice; called automatically at exit"""
+        with self._lock:
+            self._stop_process()
+        self._fallback.shutdown()
+
+    # ------------------------------------------------------------------
+    # Conversion
+
+    def convert(self, docx_path, pdf_path, job=None, timeout=30):
+        with self._lock:
+            try:
+                self._ensure_running()
+            except OfficeConversionError:
+                # The UNO bridge isn't usable here; convert the slow way
+                self.stats["fallbacks"] += 1
+                return self._fallback.convert(docx_path, pdf_path, job, timeout)
+            process = self._process
+
+            # Cancelling or timing out kills the server; it is restarted on the next job
+            if job is not None:
+                job.attach_process(process)
+            watchdog = threading.Timer(timeout, process.kill)
+            watchdog.start()
+            try:
+                self._convert(docx_path, pdf_path)
+            except Exception as e:
+                if job is not None and job.cancelled:
+                    raise OfficeConversionError("PDF export was cancelled")
+                if not watchdog.is_alive():
+                    raise OfficeConversionError("LibreOffice conversion timed out")
+                if process.poll() is not None:
+                    raise OfficeWorkerCrashed(f"LibreOffice crashed during conversion: {e}")
+                raise OfficeConversionError(f"LibreOffice conversion failed: {e}")
+            finally:
+                watchdog.cancel()
+                if job is not None:
+                    job.attach_process(None)
+            self.stats["conversions"] += 1
+
+    def convert_many(self, pairs, timeout=30):
+        """Convert (docx_path, pdf_path) pairs on the warm server; returns {pdf_path: None or the error}"""
+        results = {}
+        for docx_path, pdf_path in pairs:
+            try:
+                self.convert(docx_path, pdf_path, timeout=timeout)
+                results[pdf_path] = None
+            except OfficeConversionError as e:
+                results[pdf_path] = e
+        return results
+
+    def _convert(self, docx_path, pdf_path):
+        def prop(name, value):
+            p = uno.createUnoStruct("com.sun.star.beans.PropertyValue")
+            p.Name = name
+            p.Value = value
+            return p
+
+        document = self._desktop.loadComponentFromURL(
+            uno.systemPathToFileUrl(os.path.abspath(docx_path)), "_blank", 0,
+            (prop("Hidden", True), prop("ReadOnly", True)))
+        try:
+            document.storeToURL(
+                uno.systemPathToFileUrl(os.path.abspath(pdf_path)),
+                (prop("FilterName", "writer_pdf_Export"),))
+        finally:
+            document.close(True)
+
+
+class FakeOfficeConverter:
+    """
+    Stand-in converter for tests: records each call and writes a tiny PDF
+    instead of starting LibreOffice.
+    """
+
+    name = "Fake converter"
+
+    def __init__(self, fail=False, crash=False):
+        self.fail = fail
+        self.crash = crash
+        self.calls = []
+        self.shut_down = False
+
+    def convert(self, docx_path, pdf_path, job=None, timeout=30):
+        self.calls.append((docx_path, pdf_path))
+        if job is not None and job.cancelled:
+            raise OfficeConversionError("PDF export was cancelled")
+        if self.crash:
+            raise OfficeWorkerCrashed("Fake converter crashed")
+        if self.fail:
+            raise OfficeConversionError("Fake conversion failure")
+        with open(pdf_path, "wb") as f:
+            f.write(b"%PDF-1.4\n%fake\n%%EOF\n")
+
+    def convert_many(self, pairs, timeout=30):
+        results = {}
+        for docx_path, pdf_path in pairs:
+            try:
+                self.convert(docx_path, pdf_path, timeout=timeout)
+                results[pdf_path] = None
+            except OfficeConversionError as e:
+                results[pdf_path] = e
+        return results
+
+    def shutdown(self):
+        self.shut_down = True
+
+
+class ConversionPool:
+    """
+    Runs up to `size` conversions at once, each on its own LibreOffice worker
+    with a private profile (two soffice processes sharing a profile collide).
+
+    Jobs wait for a free worker and get a per-job timeout. A worker that
+    crashes is shut down and replaced by a new one, and its job (or the
+    files of its batch that crashed) is retried once on the replacement. If
+    no replacement can be started, the next job that needs the slot tries
+    again. The pool has the same convert() interface as a single converter,
+    so it can be installed with set_office_converter().
+    """
+
+    name = "LibreOffice (conversion pool)"
+
+    def __init__(self, soffice_path, size=None, timeout=60, converter_factory=None):
+        self.size = size or os.cpu_count() or 1
+        self.timeout = timeout
+        self.stats = {"conversions": 0, "retries": 0, "failures": 0}
+        self._stats_lock = threading.Lock()
+        if converter_factory is None:
+            def converter_factory():
+                fallback = SubprocessOfficeConverter(soffice_path, isolated=True)
+                if UNO_AVAILABLE:
+                    return LibreOfficeServer(soffice_path, fallback=fallback)
+                return fallback
+        self._converter_factory = converter_factory
+        self._workers = [converter_factory() for _ in range(self.size)]
+        self._idle = queue.Queue()
+        for worker in self._workers:
+            self._idle.put(worker)
+        self._executor = None
+
+    def _count(self, key):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _start_worker(self):
+        """Create a worker and add it to the pool; raises OfficeConversionError if that fails"""
+        try:
+            worker = self._converter_factory()
+        except Exception as e:
+            raise OfficeConversionError(f"Could not start a LibreOffice worker: {e}") from e
+        with self._stats_lock:
+            self._workers.append(worker)
+        return worker
+
+    def _replace(self, worker):
+        """
+        Shut down a crashed worker and return a new one that takes its place.
+
+        Raises OfficeConversionError if the new one can't be started; the
+        caller then returns None to the idle queue in the worker's place.
+        """
+        try:
+            worker.shutdown()
+        except Exception as e:
+            print(f"Error shutting down a crashed converter: {e}")
+        with self._stats_lock:
+            self._workers.remove(worker)
+        return self._start_worker()
+
+    def _acquire(self):
+        """Wait for a free worker, starting one in a slot whose worker couldn't be replaced (None)"""
+        worker = self._idle.get()
+        if worker is None:
+            try:
+                worker = self._start_worker()
+            except OfficeConversionError:
+                self._idle.put(None)
+                raise
+        return worker
+
+    def convert(self, docx_path, pdf_path, job=None, timeout=None):
+        """Convert one document on the next free worker (blocks until one is available)"""
+        timeout = timeout or self.timeout
+        try:
+            worker = self._acquire()
+        except OfficeConversionError:
+            self._count("failures")
+            raise
+        try:
+            try:
+                worker.convert(docx_path, pdf_path, job=job, timeout=timeout)
+            except OfficeWorkerCrashed:
+                if job is not None and job.cancelled:
+                    raise
+                self._count("retries")
+                crashed, worker = worker, None
+                worker = self._replace(crashed)
+                worker.convert(docx_path, pdf_path, job=job, timeout=timeout)
+            self._count("conversions")
+        except OfficeConversionError:
+            self._count("failures")
+            raise
+        finally:
+            self._idle.put(worker)
+
+    def convert_many(self, pairs, timeout=None):
+        """
+        Split (docx_path, pdf_path) pairs across the workers, one batch per
+        worker, so each LibreOffice start is shared by many files. Files
+        whose worker crashed are retried once on a replacement worker.
+        Returns {pdf_path: None, or the OfficeConversionError for a file that didn't convert}.
+        """
+        timeout = timeout or self.timeout
+        pairs = list(pairs)
+        chunks = [pairs[i::self.size] for i in range(self.size) if pairs[i::self.size]]
+
+        def run_chunk(chunk):
+            try:
+                worker = self._acquire()
+            except OfficeConversionError as e:
+                return {pdf_path: e for _, pdf_path in chunk}
+            results = {}
+            try:
+                results.update(worker.convert_many(chunk, timeout=timeout))
+                crashed = [(docx_path, pdf_path) for docx_path, pdf_path in chunk
+                           if isinstance(results.get(pdf_path), OfficeWorkerCrashed)]
+                if crashed:
+                    with self._stats_lock:
+                        self.stats["retries"] += len(crashed)
+                    crashed_worker, worker = worker, None
+                    worker = self._replace(crashed_worker)
+                    results.update(worker.convert_many(crashed, timeout=timeout))
+            except Exception as e:
+                # Runs in a thread: every file of the chunk must still get a result
+                failure = e if isinstance(e, OfficeConversionError) else OfficeConversionError(
+                    f"PDF conversion failed: {type(e).__name__}: {e}")
+                for _, pdf_path in chunk:
+                    if pdf_path not in results or isinstance(results[pdf_path], OfficeWorkerCrashed):
+                        results[pdf_path] = failure
+            finally:
+                self._idle.put(worker)
+            return results
+
+        results = {}
+        threads = []
+        for chunk in chunks:
+            thread = threading.Thread(target=lambda c=chunk: results.update(run_chunk(c)), daemon=True)
+            thread.start()
+            threads.append(thread)
+        for thread in threads:
+            thread.join()
+
+        with self._stats_lock:
+            for error in results.values():
+                self.stats["failures" if error else "conversions"] += 1
+        return results
+
+    def submit(self, docx_path, pdf_path, timeout=None):
+        """Queue a conversion; returns a concurrent.futures.Future"""
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="soffice")
+        return self._executor.submit(self.convert, docx_path, pdf_path, None, timeout)
+
+    def shutdown(self):
+        """Wait for queued jobs and stop every worker"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        for worker in self._workers:
+            worker.shutdown()
+
+
+_converter = None
+_converter_lock = threading.Lock()
+
+
+def get_office_converter():
+    """
+    Return the shared converter, creating it on first use.
+    Returns None if LibreOffice isn't installed.
+    """
+    global _converter
+    with _converter_lock:
+        if _converter is None:
+            soffice_path = find_soffice()
+            if soffice_path is None:
+                return None
+            if UNO_AVAILABLE:
+                _converter = LibreOfficeServer(soffice_path)
+            else:
+                _converter = SubprocessOfficeConverter(soffice_path)
+        return _converter
+
+
+def set_office_converter(converter):
+    """Replace the shared converter (e.g. with FakeOfficeConverter in tests); returns the previous one"""
+    global _converter
+    with _converter_lock:
+        previous, _converter = _converter, converter
+    return previous
@@ -0,0 +1,156 @@
+"""
+Output Cache Module for History Syllabus Generator
+Content-addressed on-disk cache of generated .docx and PDF bytes.
+
+Entries are keyed by a hash of the SyllabusContent, the output format and
+RENDERER_VERSION, so exporting an unchanged syllabus again (or rerunning a
+batch) returns the stored bytes instead of rebuilding and reconverting.
+The cache is bounded in size and evicts least recently used entries.
+"""
+
+import hashlib
+import json
+import os
+import platform
+import tempfile
+import threading
+
+# Bump whenever document output changes so stale entries stop matching
+RENDERER_VERSION = "7"
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def default_cache_dir():
+    """Per-user cache directory (override with the SYLLABUS_CACHE_DIR environment variable)"""
+    if os.environ.get("SYLLABUS_CACHE_DIR"):
+        return os.environ["SYLLABUS_CACHE_DIR"]
+    if platform.system() == "Windows":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    elif platform.system() == "Darwin":  # macOS
+        base = os.path.expanduser("~/Library/Caches")
+    else:  # Linux
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "history-syllabus-generator")
+
+
+def content_key(content, export_format):
+    """Stable hash of a SyllabusContent for one output format"""
+    payload = json.dumps(
+        {"renderer": RENDERER_VERSION, "format": export_format, "content": content.to_dict()},
+        sort_keys=True, ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class OutputCache:
+    """
+    Size-bounded LRU cache of output bytes stored as one file per entry.
+
+    Recency is the file's modification time, refreshed on every hit, so
+    several processes (e.g. batch workers) can share one cache directory.
+    """
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key, export_format):
+        return os.path.join(self.directory, f"{key}.{export_format}")
+
+    def get(self, content, export_format):
+        """Return cached bytes for this content and format, or None"""
+        path = self._path(content_key(content, export_format), export_format)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)  # Mark as recently used
+        except OSError:
+            with self._lock:
+                self.stats["misses"] += 1
+            return None
+        with self._lock:
+            self.stats["hits"] += 1
+        return data
+
+    def put(self, content, export_format, data):
+        """Store output bytes, then evict old entries if the cache is over its size limit"""
+        path = self._path(content_key(content, export_format), export_format)
+        try:
+            # Write under a private name and rename, so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError as e:
+            print(f"Could not write to output cache: {e}")
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            # evict() doesn't count *.tmp files, so a leftover would never be removed
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            print(f"Could not write to output cache: {e}")
+            return
+        with self._lock:
+            self.stats["stores"] += 1
+        self.evict()
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits in max_bytes"""
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(".tmp"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue  # Another process got there first
+            total -= size
+            with self._lock:
+                self.stats["evictions"] += 1
+
+    def size(self):
+        """Total bytes currently stored"""
+        total = 0
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                try:
+                    total += entry.stat().st_size
+                except OSError:
+                    pass
+        return total
+
+    def clear(self):
+        """Remove every entry"""
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+
+    def describe(self):
+        """One-line summary of hit/miss statistics"""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        rate = f"{100 * self.stats['hits'] / lookups:.0f}%" if lookups else "n/a"
+        return (f"{self.stats['hits']} hits, {self.stats['misses']} misses (hit rate {rate}), "
+                f"{self.stats['evictions']} evictions, {self.size() / (1024 * 1024):.1f} MB stored")
@@ -0,0 +1,283 @@
+"""
+PDF Renderer Module for History Syllabus Generator
+Renders a SyllabusContent straight to PDF with ReportLab.
+
+Mirrors build_syllabus_document() section for section (objectives table,
+grading components and scale, policies, hyperlinks, calendar with repeated
+header rows, page-number footer) so a complete PDF can be produced
+in-process, without Word or LibreOffice.
+"""
+
+from xml.sax.saxutils import escape
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+
+from constants import *
+from markup import tokenize, BOLD, ITALIC
+
+MARGIN = 0.75 * inch
+AVAILABLE_WIDTH = letter[0] - 2 * MARGIN
+
+# Column widths, scaled from the old syllabus2.generate_pdf calendar layout to the full text width
+CALENDAR_COLUMN_WIDTHS = [w * AVAILABLE_WIDTH / 7.0 for w in (1.0, 1.5, 3.1, 1.4)]
+SLO_COLUMN_WIDTHS = [w * AVAILABLE_WIDTH / 7.0 for w in (1.1, 2.3, 1.8, 1.8)]
+
+TABLE_STYLE = TableStyle([
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 3),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 3),
+    ('TOPPADDING', (0, 0), (-1, -1), 2),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+])
+
+
+def _styles():
+    """Paragraph styles roughly matching the Word document's defaults"""
+    base = getSampleStyleSheet()
+    body = ParagraphStyle("SyllabusBody", parent=base["Normal"], fontName="Times-Roman",
+                          fontSize=11, leading=14, spaceAfter=4)
+    return {
+        "title": ParagraphStyle("SyllabusTitle", parent=base["Title"], fontName="Times-Bold",
+                                fontSize=20, leading=24, alignment=TA_CENTER, spaceAfter=4),
+        "subtitle": ParagraphStyle("SyllabusSubtitle", parent=body, alignment=TA_CENTER, spaceAfter=12),
+        "h1": ParagraphStyle("SyllabusHeading1", parent=base["Heading1"], fontName="Times-Bold",
+                             fontSize=14, leading=18, spaceBefore=12, spaceAfter=6,
+                             textColor=colors.HexColor("#2F5496")),
+        "h2": ParagraphStyle("SyllabusHeading2", parent=base["Heading2"], fontName="Times-Bold",
+                             fontSize=12, leading=15, spaceBefore=8, spaceAfter=4,
+                             textColor=colors.HexColor("#2F5496")),
+        "body": body,
+        "compact": ParagraphStyle("SyllabusCompact", parent=body, leftIndent=18, spaceAfter=0),
+        "indent1": ParagraphStyle("SyllabusIndent1", parent=body, leftIndent=18),
+        "indent2": ParagraphStyle("SyllabusIndent2", parent=body, leftIndent=36),
+        "cell": ParagraphStyle("SyllabusCell", parent=body, fontSize=9, leading=11, spaceAfter=0),
+        "header_cell": ParagraphStyle("SyllabusHeaderCell", parent=body, fontName="Times-Bold",
+                                      fontSize=9, leading=11, spaceAfter=0),
+    }
+
+
+def _text(value):
+    """Escape plain text for a ReportLab Paragraph, keeping line breaks"""
+    return escape(value).replace("\n", "<br/>")
+
+
+# The href sits in a double-quoted attribute, and [text](url) markup allows quotes in the url
+_ATTRIBUTE_ENTITIES = {'"': "&quot;"}
+
+
+def _link(text, url):
+    return f'<a href="{escape(url, _ATTRIBUTE_ENTITIES)}" color="blue"><u>{escape(text)}</u></a>'
+
+
+def _tokens(tokens):
+    """Translate markup.tokenize() output to Paragraph markup"""
+    out = []
+    for token in tokens:
+        if token.url:
+            out.append(_link(token.text, token.url))
+        elif token.kind == BOLD:
+            out.append(f"<b>{_text(token.text)}</b>")
+        elif token.kind == ITALIC:
+            out.append(f"<i>{_text(token.text)}</i>")
+        else:
+            out.append(_text(token.text))
+    return "".join(out)
+
+
+def _linkify(value):
+    """Escape plain text and turn bare URLs and email addresses into clickable links"""
+    return _tokens(tokenize(value))
+
+
+def _markup(value):
+    """Translate the Required Materials markup (**bold**, *italic*, [text](url)) to Paragraph markup"""
+    return _tokens(tokenize(value, markup=True))
+
+
+def _table(rows, styles, col_widths=None):
+    """Grid table with a bold, repeated header row; cells wrap"""
+    data = [[Paragraph(_text(cell), styles["header_cell"]) for cell in rows[0]]]
+    data += [[Paragraph(_text(cell), styles["cell"]) for cell in row] for row in rows[1:]]
+    table = Table(data, colWidths=col_widths, repeatRows=1, hAlign="LEFT")
+    table.setStyle(TABLE_STYLE)
+    return table
+
+
+def _add_page_number(canvas, doc):
+    """Add page numbers to each page"""
+    canvas.saveState()
+    canvas.setFont('Times-Roman', 9)
+    # Position the page number at the bottom center of the page
+    canvas.drawCentredString(letter[0] / 2, 0.5 * inch, f"Page {canvas.getPageNumber()}")
+    canvas.restoreState()
+
+
+def render_syllabus_pdf(content, target):
+    """
+    Render a SyllabusContent to PDF.
+
+    target is a file path or a binary file-like object (e.g. io.BytesIO).
+    """
+    course = content.course_info
+    instructor = content.instructor
+    policies = content.policies
+    styles = _styles()
+    body = styles["body"]
+    story = []
+
+    def heading(text, level=1):
+        story.append(Paragraph(_text(text), styles["h1" if level == 1 else "h2"]))
+
+    def para(markup, style=body):
+        story.append(Paragraph(markup, style))
+
+    # Title and Course Info (centered)
+    para(_text(f"{course.course_num}: {course.course_title}"), styles["title"])
+    para(_text(f"{course.term} ({course.credits} credits)"), styles["subtitle"])
+
+    # I. General Information
+    heading("I. General Information")
+    para(f"<b>Meeting days and times:</b> {_text(course.meeting_times)}")
+    para(f"<b>Class location:</b> {_text(course.location)}")
+
+    para("<b>Instructor:</b>")
+    for label, value in (("Name:", instructor.name), ("Office:", instructor.office),
+                         ("Phone:", instructor.phone), ("Email:", instructor.email),
+                         ("Office Hours:", instructor.office_hours)):
+        value_markup = _link(value, f"mailto:{value}") if label == "Email:" and value else _text(value)
+        para(f"<b>{label}</b> {value_markup}", styles["compact"])
+
+    if content.tas:
+        story.append(Spacer(1, 6))
+        para("<b>Sections:</b>")
+        for ta in content.tas:
+            for label, value in (("Name:", ta.name), ("Email:", ta.email),
+                                 ("Office Hours:", ta.office_hours),
+                                 ("Class Room:", ta.class_room), ("Class Time:", ta.class_time)):
+                value_markup = _link(value, f"mailto:{value}") if label == "Email:" and value else _text(value)
+                para(f"<b>{label}</b> {value_markup}", styles["compact"])
+            story.append(Spacer(1, 4))
+
+    heading("Course Description")
+    para(_text(course.description))
+
+    heading("Prerequisites")
+    para(_text(course.prerequisites))
+
+    if policies.show_gen_ed:
+        heading(f"General Education Designation: {GEN_ED_DESIGNATION}")
+        para(_text(gen_ed_default))
+        para(_text(gen_ed_credit_statement.format(course_num=course.course_num, designation=GEN_ED_DESIGNATION)))
+
+    heading("Course Objectives")
+    para("All General Education area objectives can be found "
+         + _link("here", "https://undergrad.aa.ufl.edu/general-education/gen-ed-program/subject-area-objectives/")
+         + ".")
+    for i, objective in enumerate(course.objectives, 1):
+        para(_text(f"{i}. {objective}"), styles["indent1"])
+
+    # II. Student Learning Outcomes
+    heading("II. Student Learning Outcomes")
+    para("A student who successfully completes this course will:")
+    for i, outcome in enumerate(content.outcomes or student_learning_outcomes_default, 1):
+        para(_text(f"{i}. {outcome}"), styles["indent1"])
+
+    if policies.show_gen_ed:
+        story.append(Spacer(1, 6))
+        para(_text(f"Objectives—General Education and {GEN_ED_DESIGNATION}"))
+        if content.slo_rows:
+            slo_rows = [(row.category, row.slo, row.assignments, row.course_specific) for row in content.slo_rows]
+        else:
+            slo_rows = [(category, slo, assignments, "") for category, slo, assignments in slo_table_default]
+        story.append(_table([("CATEGORY", "SOCIAL SCIENCE SLOS", "STATE SLO ASSIGNMENTS", "COURSE-SPECIFIC")]
+                            + slo_rows, styles, SLO_COLUMN_WIDTHS))
+
+    # III. Graded Work
+    heading("III. Graded Work")
+
+    if content.materials is not None and content.materials.required:
+        heading("Required Materials", level=2)
+        para(_markup(content.materials.required))
+        para(f"<b>Materials Fee: $</b>{_text(content.materials.fee or '0.00')}")
+
+    if content.grading_categories:
+        heading("Grading Components", level=2)
+        weights = [("Category", "Weight")] + [
+            (category.name, f"{category.weight}%")
+            for category in content.grading_categories if category.name and category.weight
+        ]
+        story.append(_table(weights, styles, [AVAILABLE_WIDTH * 0.6, AVAILABLE_WIDTH * 0.2]))
+
+        for category in content.grading_categories:
+            if category.name and category.description:
+                story.append(Spacer(1, 6))
+                para(f"<b>{_text(category.name)}:</b> {_text(category.description)}")
+            assignments = [a for a in category.assignments if a.title]
+            if assignments:
+                para(f"<b>{_text(category.name)} Assignments:</b>")
+            for assignment in assignments:
+                line = f"• {assignment.title}"
+                if assignment.due_date:
+                    line += f" (Due: {assignment.due_date})"
+                if assignment.points:
+                    line += f" - {assignment.points} points"
+                para(_text(line), styles["indent1"])
+                if assignment.description:
+                    para(_text(assignment.description), styles["indent2"])
+
+    heading("Grading Scale", level=2)
+    story.append(_table([("Letter Grade", "Number Grade")] + GRADING_SCALE, styles,
+                        [AVAILABLE_WIDTH * 0.3, AVAILABLE_WIDTH * 0.3]))
+    story.append(Spacer(1, 4))
+    para("See the UF Catalog's "
+         + _link("Grades and Grading Policies", "https://catalog.ufl.edu/UGRD/academic-regulations/grades-grading-policies/")
+         + " for information on how UF assigns grade points.")
+    if policies.grading_rounding:
+        para(_text(grading_rounding_default))
+    para("Note: A minimum grade of C is required to earn General Education credit.")
+
+    heading("Instructions for Submitting Written Assignments")
+    para(_text("All written assignments must be submitted as Word documents (.doc or .docx) through the "
+               "\"Assignments\" portal in Canvas by the specified deadlines. Do NOT send assignments as PDF files."))
+
+    for section_heading, text in policies.course_sections():
+        heading(section_heading, level=2)
+        para(_linkify(text))
+
+    # IV. University Policies and Resources
+    heading("IV. University Policies and Resources")
+    if policies.use_simplified_policies:
+        para(_markup(uf_policies_simplified_text))
+    else:
+        for section_heading, text in UF_POLICIES_DETAILED:
+            heading(section_heading, level=2)
+            para(_markup(text))
+
+    # V. Calendar
+    heading("V. Calendar")
+    schedule = [entry for entry in content.schedule if not entry.is_empty()]
+    if schedule:
+        rows = [("Date", "Topic", "Readings/Preparation", "Work Due")] + [
+            (entry.date.strip(), entry.topic.strip(), entry.readings.strip(), entry.work_due.strip())
+            for entry in schedule
+        ]
+        story.append(_table(rows, styles, CALENDAR_COLUMN_WIDTHS))
+    else:
+        para("Schedule will be provided separately.")
+
+    doc = SimpleDocTemplate(
+        target,
+        pagesize=letter,
+        leftMargin=MARGIN,
+        rightMargin=MARGIN,
+        topMargin=MARGIN,
+        bottomMargin=MARGIN,
+        title=f"{course.course_num}: {course.course_title}",
+    )
+    doc.build(story, onFirstPage=_add_page_number, onLaterPages=_add_page_number)
@@ -0,0 +1,223 @@
+"""
+Roll Forward Module for History Syllabus Generator
+Re-dates saved syllabi for a new term.
+
+Usage:
+    python -m roll_forward SYLLABI_DIR --term "Spring 2026" --start 2026-01-12 --end 2026-04-29 \
+        --no-class holidays.txt --workers 4
+
+Each *.json file in SYLLABI_DIR is a SyllabusContent saved with
+syllabus_model.save_content(). Schedule rows are mapped by meeting index
+(class 1 of the old term becomes class 1 of the new one) onto the new
+term's meetings, skipping its no-class days (see term_calendar). Assignment
+due dates move with the class meeting they fall on, or keep their offset
+from the closest earlier meeting. The re-dated syllabi are written to
+--output (default: a folder named after the new term inside SYLLABI_DIR),
+and a report lists every date that moved and every due date that couldn't
+be read. --skip-no-class leaves the new term's no-class days off the
+schedule instead of adding a "No Class" row for each.
+"""
+
+import argparse
+import bisect
+import dataclasses
+import glob
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from syllabus_model import load_content, save_content
+from term_calendar import (
+    fill_schedule, format_date, is_no_class, load_no_class_dates, meeting_dates, parse_date, parse_meeting_days
+)
+
+
+# Report value for a due date that isn't a recognized date and so was left as it was
+NOT_MOVED = "not moved (date not recognized)"
+
+
+class DateMap:
+    """Old term date -> new term date, from pairs of matching class meetings"""
+
+    def __init__(self, pairs):
+        pairs = sorted(pairs)
+        self.old = [old for old, new in pairs]
+        self.new = [new for old, new in pairs]
+
+    def __bool__(self):
+        return bool(self.old)
+
+    def shift(self, day):
+        """Move a date by the same amount as the closest meeting on or before it (or the first meeting)"""
+        index = max(0, bisect.bisect_right(self.old, day) - 1)
+        return self.new[index] + (day - self.old[index])
+
+
+def roll_forward(content, term, start, end, weekdays=None, no_class=None, include_no_class=True):
+    """
+    Re-date one syllabus for a new term.
+
+    weekdays defaults to the days in the syllabus's meeting times. Returns
+    (new content, changes) where changes is a list of (where, old, new)
+    strings describing every value that moved; due dates that couldn't be
+    read are listed with new set to NOT_MOVED.
+    """
+    if weekdays is None:
+        weekdays = parse_meeting_days(content.course_info.meeting_times)
+    if not weekdays:
+        raise ValueError(f"no meeting days found in {content.course_info.meeting_times!r}; use --days")
+
+    changes = []
+    if content.course_info.term != term:
+        changes.append(("Term", content.course_info.term, term))
+
+    # Match class meetings by index; only the old dates that parse can move due dates
+    dates = meeting_dates(start, end, weekdays, no_class)
+    schedule = fill_schedule(content.schedule, dates, include_no_class)
+    old_classes = [entry for entry in content.schedule if not is_no_class(entry)]
+    new_classes = [entry for entry in schedule if not is_no_class(entry)]
+    date_map = DateMap(
+        (parse_date(old.date), parse_date(new.date))
+        for old, new in zip(old_classes, new_classes)
+        if parse_date(old.date) and parse_date(new.date)
+    )
+    for number, (old, new) in enumerate(zip(old_classes, new_classes), start=1):
+        if old.date != new.date:
+            label = f"Class {number}" + (f" ({old.topic})" if old.topic else "")
+            changes.append((label, old.date, new.date))
+    dropped = sum(1 for entry in new_classes if not entry.date)
+    if dropped:
+        changes.append(("Schedule", f"{dropped} classes", f"no date in {term}"))
+
+    categories = []
+    for category in content.grading_categories:
+        assignments = []
+        for assignment in category.assignments:
+            due = parse_date(assignment.due_date)
+            if due is None and assignment.due_date.strip():
+                changes.append((f"{category.name}: {assignment.title}", assignment.due_date, NOT_MOVED))
+            elif due is not None and date_map:
+                moved = format_date(date_map.shift(due))
+                if moved != assignment.due_date:
+                    changes.append((f"{category.name}: {assignment.title}", assignment.due_date, moved))
+                    assignment = dataclasses.replace(assignment, due_date=moved)
+            assignments.append(assignment)
+        categories.append(dataclasses.replace(category, assignments=tuple(assignments)))
+
+    new_content = dataclasses.replace(
+        content,
+        course_info=dataclasses.replace(content.course_info, term=term),
+        grading_categories=tuple(categories),
+        schedule=tuple(schedule),
+    )
+    return new_content, changes
+
+
+def roll_file(path, output_dir, term, start, end, weekdays=None, no_class=None, dry_run=False,
+              include_no_class=True):
+    """Roll one saved syllabus forward; runs in a worker process and returns a result dictionary"""
+    begin = time.perf_counter()
+    result = {"path": path, "output": None, "changes": [], "error": None, "seconds": 0.0}
+    try:
+        content, result["changes"] = roll_forward(load_content(path), term, start, end, weekdays, no_class,
+                                                  include_no_class)
+        if not dry_run:
+            result["output"] = os.path.join(output_dir, os.path.basename(path))
+            save_content(content, result["output"])
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["seconds"] = time.perf_counter() - begin
+    return result
+
+
+def run_roll_forward(input_dir, term, start, end, output_dir=None, weekdays=None, no_class=None,
+                     workers=None, dry_run=False, include_no_class=True):
+    """Roll every *.json syllabus in input_dir forward; returns the list of result dictionaries"""
+    paths = sorted(glob.glob(os.path.join(input_dir, "*.json")))
+    output_dir = output_dir or os.path.join(input_dir, re.sub(r"[^\w.-]+", "_", term).strip("_"))
+    if paths and not dry_run:
+        os.makedirs(output_dir, exist_ok=True)
+
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(roll_file, path, output_dir, term, start, end, weekdays, no_class, dry_run,
+                                   include_no_class)
+                   for path in paths]
+        for future in as_completed(futures):
+            results.append(future.result())
+    results.sort(key=lambda r: r["path"])
+    return results
+
+
+def format_report(results):
+    """Diff report: every value that moved, per file"""
+    lines = []
+    for result in results:
+        name = os.path.basename(result["path"])
+        if result["error"]:
+            lines.append(f"{name}: FAILED - {result['error']}")
+            continue
+        lines.append(f"{name}: {len(result['changes'])} changes" + (f" -> {result['output']}" if result["output"] else ""))
+        for where, old, new in result["changes"]:
+            lines.append(f"  {where}: {old or '(blank)'} -> {new or '(blank)'}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m roll_forward",
+        description="Re-date a directory of saved syllabi (*.json) for a new term."
+    )
+    parser.add_argument("input_dir", help="Directory containing saved syllabus files (*.json)")
+    parser.add_argument("--term", required=True, help="New term, e.g. \"Spring 2026\"")
+    parser.add_argument("--start", required=True, help="First day of classes, e.g. 2026-01-12")
+    parser.add_argument("--end", required=True, help="Last day of classes, e.g. 2026-04-29")
+    parser.add_argument("--days", help="Meeting days for every syllabus, e.g. MWF "
+                                       "(default: read from each syllabus's meeting times)")
+    parser.add_argument("--no-class", help="File of the new term's holidays and other no-class dates")
+    parser.add_argument("--skip-no-class", action="store_true",
+                        help="Leave no-class days off the schedule instead of adding a \"No Class\" row")
+    parser.add_argument("--output", help="Output directory (default: INPUT_DIR/<term>)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="Number of worker processes (default: CPU count)")
+    parser.add_argument("--report", help="Also write the report of moved dates to this file")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would move without writing files")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.input_dir):
+        parser.error(f"not a directory: {args.input_dir}")
+    start, end = parse_date(args.start), parse_date(args.end)
+    if start is None or end is None or end < start:
+        parser.error("--start and --end must be dates, with --end on or after --start")
+    weekdays = None
+    if args.days:
+        weekdays = parse_meeting_days(args.days)
+        if not weekdays:
+            parser.error(f"no meeting days found in --days {args.days!r}")
+    try:
+        no_class = load_no_class_dates(args.no_class) if args.no_class else None
+    except (OSError, ValueError) as e:
+        parser.error(f"could not read --no-class file: {e}")
+
+    begin = time.perf_counter()
+    results = run_roll_forward(args.input_dir, args.term, start, end, args.output, weekdays, no_class,
+                               args.workers, args.dry_run, not args.skip_no_class)
+    if not results:
+        print(f"No syllabus files (*.json) found in {args.input_dir}")
+        return 1
+
+    report = format_report(results)
+    print(report)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            f.write(report + "\n")
+    failures = sum(1 for r in results if r["error"])
+    print(f"\nRolled {len(results) - failures} of {len(results)} syllabi forward to {args.term} "
+          f"in {time.perf_counter() - begin:.2f}s")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
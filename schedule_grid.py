@@ -0,0 +1,288 @@
+"""
+Schedule Grid Module for History Syllabus Generator
+Virtualized editor for the Calendar/Course Schedule tab.
+
+The schedule is kept as a list of ScheduleEntry rows. Only enough row
+widgets to fill the visible area are created; scrolling rebinds that pool
+to different rows instead of laying out hundreds of widgets, and edits are
+written straight back to the row being shown.
+"""
+
+import tkinter as tk
+from tkinter import ttk, scrolledtext
+
+from syllabus_model import ScheduleEntry
+
+
+def _bind_wheel(widget, grid):
+    """Scroll the grid one row per mousewheel notch over widget"""
+    def on_wheel(event):
+        grid.yview_scroll(-1 if event.delta > 0 else 1, "units")
+        return "break"
+
+    widget.bind("<MouseWheel>", on_wheel)
+    widget.bind("<Button-4>", lambda e: grid.yview_scroll(-1, "units"))
+    widget.bind("<Button-5>", lambda e: grid.yview_scroll(1, "units"))
+
+
+class _RowWidgets:
+    """
+    One recycled row of editors.
+
+    index is the model row it shows, or None while hidden; shown is the
+    ScheduleEntry last written to or read back from its widgets.
+    """
+
+    def __init__(self, grid, position):
+        self.grid = grid
+        self.index = None
+        self.shown = None
+        self.mapped = True
+        parent = grid.body
+
+        self.date = ttk.Entry(parent, width=15)
+        self.topic = ttk.Entry(parent, width=40)
+
+        self.readings_frame = ttk.Frame(parent)
+        self.readings_frame.grid_columnconfigure(0, weight=1)
+        self.readings = scrolledtext.ScrolledText(self.readings_frame, width=50, height=3, wrap=tk.WORD)
+        self.readings.grid(row=0, column=0, sticky="ew")
+        buttons_frame = ttk.Frame(self.readings_frame)
+        buttons_frame.grid(row=0, column=1, sticky="ns", padx=(5, 0))
+        ttk.Button(buttons_frame, text="[P]", command=self.insert_p_marker,
+                   style="Small.TButton").pack(side=tk.TOP, pady=(0, 2))
+        ttk.Button(buttons_frame, text="#", command=self.count_words,
+                   style="Small.TButton").pack(side=tk.TOP)
+
+        self.work_due = ttk.Entry(parent, width=20)
+        self.delete_btn = ttk.Button(parent, text="X", command=self.remove, style="Delete.TButton")
+
+        self.date.grid(row=position, column=0, sticky="w", padx=(5, 10), pady=2)
+        self.topic.grid(row=position, column=1, sticky="ew", padx=5, pady=2)
+        self.readings_frame.grid(row=position, column=2, sticky="ew", padx=5, pady=2)
+        self.work_due.grid(row=position, column=3, sticky="w", padx=5, pady=2)
+        self.delete_btn.grid(row=position, column=4, padx=(0, 5), pady=2)
+        self.widgets = (self.date, self.topic, self.readings_frame, self.work_due, self.delete_btn)
+
+        for widget in (self.date, self.topic, self.readings, self.work_due):
+            widget.bind("<KeyRelease>", lambda e: self.grid.store(self))
+            widget.bind("<FocusOut>", lambda e: self.grid.store(self), add="+")
+        for widget in (self.date, self.topic, self.work_due, self.readings_frame, buttons_frame):
+            _bind_wheel(widget, grid)
+        # Tab out of the last field (or Shift-Tab out of the first) goes to the next row even if it is scrolled out
+        self.delete_btn.bind("<Tab>", lambda e: self.grid.focus_adjacent(self, 1))
+        for sequence in ("<Shift-Tab>", "<ISO_Left_Tab>"):
+            self.date.bind(sequence, lambda e: self.grid.focus_adjacent(self, -1))
+
+    def height(self):
+        """Requested height of the row including its padding"""
+        return max(widget.winfo_reqheight() for widget in self.widgets) + 4
+
+    def show(self, index, entry):
+        """Show a model row; the widgets are only rewritten if they hold different values"""
+        if not self.mapped:
+            for widget in self.widgets:
+                widget.grid()
+            self.mapped = True
+        self.index = index
+        if entry == self.shown:
+            return
+        for widget, value in ((self.date, entry.date), (self.topic, entry.topic), (self.work_due, entry.work_due)):
+            widget.delete(0, tk.END)
+            widget.insert(0, value)
+        self.readings.delete("1.0", tk.END)
+        self.readings.insert("1.0", entry.readings)
+        self.readings.edit_reset()
+        self.shown = entry
+
+    def hide(self):
+        self.index = None
+        if self.mapped:
+            for widget in self.widgets:
+                widget.grid_remove()
+            self.mapped = False
+
+    def entry(self):
+        """The row as currently edited"""
+        return ScheduleEntry(
+            date=self.date.get(),
+            topic=self.topic.get(),
+            readings=self.readings.get("1.0", tk.END).strip(),
+            work_due=self.work_due.get()
+        )
+
+    def insert_p_marker(self):
+        self.readings.insert(tk.INSERT, "[P] ")
+        self.grid.store(self)
+
+    def count_words(self):
+        text = self.readings.get("1.0", tk.END).strip()
+        self.readings.insert(tk.END, f" [{len(text.split())} words]")
+        self.grid.store(self)
+
+    def remove(self):
+        if self.index is not None:
+            self.grid.remove(self.index)
+
+
+class ScheduleGrid(ttk.Frame):
+    """
+    Scrolling schedule editor backed by a list of ScheduleEntry rows.
+
+    rows is the model; read it with get() and replace it with set_rows().
+    on_change is called (with no arguments) whenever an edit, a deletion or
+    set_rows() changes the model.
+    """
+
+    def __init__(self, parent, on_change=None, height=300, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.rows = []
+        self.on_change = on_change
+        self.top = 0
+        self.visible = 0
+        self.pool = []
+        self.row_height = None
+
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.body = ttk.Frame(self, style="Template.TFrame", height=height)
+        # The body's size comes from the window, not from however many rows are in the pool
+        self.body.grid_propagate(False)
+        self.body.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.body.bind("<Configure>", self._on_resize)
+        _bind_wheel(self.body, self)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def get(self):
+        """All rows, including edits still in the widgets"""
+        self.flush()
+        return tuple(self.rows)
+
+    def set_rows(self, rows):
+        """Replace the whole schedule"""
+        self.rows = list(rows)
+        self.top = 0
+        # Unsaved typing in the widgets is discarded with the old rows, so rewrite every row
+        for row in self.pool:
+            row.shown = None
+        self._rebind()
+        self._changed()
+
+    def clear(self):
+        self.set_rows(())
+
+    def append(self, entry):
+        """Add a row at the end and scroll it into view"""
+        self.flush()
+        self.rows.append(entry)
+        self.see(len(self.rows) - 1)
+
+    def remove(self, index):
+        self.flush()
+        del self.rows[index]
+        self._rebind()
+        self._changed()
+
+    def see(self, index):
+        """Scroll so that the given row is visible"""
+        if index < self.top:
+            self.top = index
+        elif self.visible and index >= self.top + self.visible:
+            self.top = index - self.visible + 1
+        self._rebind()
+
+    def focus_adjacent(self, row, step):
+        """
+        Tab/Shift-Tab handler: move the cursor to the row step rows away,
+        scrolling it into view. Returns "break" if it handled the key.
+        """
+        if row.index is None or not 0 <= row.index + step < len(self.rows):
+            return None
+        index = row.index + step
+        self.flush()
+        self.see(index)
+        for other in self.pool:
+            if other.index == index:
+                (other.date if step > 0 else other.delete_btn).focus_set()
+        return "break"
+
+    def focus_row(self, index):
+        """Put the cursor in the date field of a row"""
+        self.see(index)
+        for row in self.pool:
+            if row.index == index:
+                row.date.focus_set()
+
+    def yview(self, *args):
+        """Scrollbar command: ("moveto", fraction) or ("scroll", n, "units" | "pages")"""
+        if not args:
+            return
+        if args[0] == "moveto":
+            top = round(float(args[1]) * len(self.rows))
+        else:
+            amount = int(args[1])
+            if args[2] == "pages":
+                amount *= max(1, self.visible - 1)
+            top = self.top + amount
+        self.scroll_to(top)
+
+    def yview_scroll(self, number, what):
+        self.yview("scroll", number, what)
+
+    def scroll_to(self, top):
+        top = max(0, min(top, len(self.rows) - self.visible))
+        if top != self.top:
+            self.flush()
+            self.top = top
+            self._rebind()
+
+    def store(self, row):
+        """Copy a row's widgets back into the model; returns True if it changed"""
+        if row.index is None:
+            return False
+        entry = row.entry()
+        row.shown = entry
+        if entry == self.rows[row.index]:
+            return False
+        self.rows[row.index] = entry
+        self._changed()
+        return True
+
+    def flush(self):
+        for row in self.pool:
+            if row.index is not None:
+                self.rows[row.index] = row.shown = row.entry()
+
+    def _changed(self):
+        if self.on_change is not None:
+            self.on_change()
+
+    def _on_resize(self, event):
+        if self.row_height is None:
+            self.pool.append(_RowWidgets(self, 0))
+            self.body.update_idletasks()
+            self.row_height = self.pool[0].height()
+        visible = max(1, event.height // self.row_height)
+        while len(self.pool) < visible:
+            self.pool.append(_RowWidgets(self, len(self.pool)))
+        if visible != self.visible:
+            self.flush()
+            self.visible = visible
+            self._rebind()
+
+    def _rebind(self):
+        """Show rows top..top+visible in the pool and hide the rest; rows whose values are unchanged aren't rewritten"""
+        self.top = max(0, min(self.top, len(self.rows) - self.visible))
+        for position, row in enumerate(self.pool):
+            index = self.top + position
+            if position < self.visible and index < len(self.rows):
+                row.show(index, self.rows[index])
+            else:
+                row.hide()
+        total = len(self.rows)
+        if total:
+            self.scrollbar.set(self.top / total, min(1.0, (self.top + self.visible) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
@@ -0,0 +1,160 @@
+"""
+Schedule I/O Module for History Syllabus Generator
+Streaming reader and writer for Calendar spreadsheets (CSV and Excel .xlsx).
+
+Rows are read one at a time (openpyxl's read-only mode for .xlsx) and
+.xlsx files are written with openpyxl's write-only mode, so memory stays
+flat however long the schedule is and pandas isn't needed. openpyxl is
+only imported when an .xlsx file is actually read or written.
+
+Headers are matched loosely: case, spacing and punctuation are ignored and
+common alternatives ("Readings", "Assignments Due", ...) are accepted.
+"""
+
+import csv
+import datetime
+import os
+import re
+import zipfile
+
+from syllabus_model import ScheduleEntry
+from term_calendar import format_date
+
+COLUMNS = ("Date", "Topic", "Readings/Preparation", "Work Due")
+
+# Normalized header -> ScheduleEntry field
+HEADER_ALIASES = {
+    "date": "date", "day": "date", "classdate": "date", "week": "date",
+    "topic": "topic", "topics": "topic", "title": "topic", "subject": "topic",
+    "readingspreparation": "readings", "readings": "readings", "reading": "readings",
+    "preparation": "readings", "readingsprep": "readings", "assignedreadings": "readings",
+    "workdue": "work_due", "due": "work_due", "assignmentsdue": "work_due",
+    "assignmentdue": "work_due", "assignments": "work_due",
+}
+
+FIELDS = ("date", "topic", "readings", "work_due")
+
+
+def _normalize_header(value):
+    return re.sub(r"[^a-z]", "", str(value or "").lower())
+
+
+def _column_map(header):
+    """Map ScheduleEntry fields to column indexes; raise ValueError if none are recognized"""
+    columns = {}
+    for index, title in enumerate(header):
+        field = HEADER_ALIASES.get(_normalize_header(title))
+        if field and field not in columns:
+            columns[field] = index
+    if not columns:
+        raise ValueError("No schedule columns found; the first row should contain "
+                         + ", ".join(f'"{c}"' for c in COLUMNS))
+    return columns
+
+
+def _cell_text(value):
+    """Text for one cell; Excel dates are written the way the example schedule writes them"""
+    if value is None:
+        return ""
+    if isinstance(value, datetime.datetime) and value.time() == datetime.time():
+        value = value.date()
+    if isinstance(value, datetime.date) and not isinstance(value, datetime.datetime):
+        return format_date(value)
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value).strip()
+
+
+def _is_xlsx(path):
+    return os.path.splitext(path)[1].lower() in (".xlsx", ".xlsm")
+
+
+def _load_openpyxl():
+    try:
+        import openpyxl
+    except ImportError as e:
+        raise ImportError("openpyxl is required for Excel schedules. "
+                          "Install it with 'pip install openpyxl' or use CSV format.") from e
+    return openpyxl
+
+
+def _csv_rows(path):
+    # utf-8-sig drops the byte order mark Excel puts at the start of CSV files
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        yield from csv.reader(f)
+
+
+def _xlsx_rows(path):
+    openpyxl = _load_openpyxl()
+    from openpyxl.utils.exceptions import InvalidFileException
+    try:
+        workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    except (zipfile.BadZipFile, KeyError, InvalidFileException) as e:
+        # A damaged workbook, or another kind of file renamed to .xlsx
+        raise ValueError(f"{os.path.basename(path)} is not a readable Excel workbook ({e})") from e
+    try:
+        yield from workbook.active.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def iter_schedule(path, errors=None):
+    """
+    Yield a ScheduleEntry for each row of a CSV or .xlsx schedule.
+
+    Blank rows are skipped. Rows that can't be read are skipped too, and a
+    (row number, message) pair is appended to errors if a list is given.
+    Raises ValueError if the file is empty, its header row has no
+    recognizable columns, or an .xlsx file isn't a readable workbook.
+    """
+    rows = _xlsx_rows(path) if _is_xlsx(path) else _csv_rows(path)
+    columns = None
+    for number, values in enumerate(rows, start=1):
+        if columns is None:
+            if not any(_cell_text(v) for v in values):
+                continue
+            columns = _column_map(values)
+            width = len(values)
+            continue
+        try:
+            cells = [_cell_text(v) for v in values]
+            if any(cells[width:]):
+                raise ValueError(f"values beyond the last of the {width} header columns")
+            entry = ScheduleEntry(**{
+                field: cells[index] if index < len(cells) else ""
+                for field, index in columns.items()
+            })
+        except Exception as e:
+            if errors is not None:
+                errors.append((number, str(e)))
+            continue
+        if not entry.is_empty():
+            yield entry
+    if columns is None:
+        raise ValueError("The schedule file is empty")
+
+
+def read_schedule(path):
+    """Read a whole schedule; returns (list of ScheduleEntry, list of (row number, message))"""
+    errors = []
+    rows = list(iter_schedule(path, errors))
+    return rows, errors
+
+
+def write_schedule(path, entries):
+    """Write schedule rows to a CSV or .xlsx file with the standard column headers"""
+    if _is_xlsx(path):
+        openpyxl = _load_openpyxl()
+        workbook = openpyxl.Workbook(write_only=True)
+        sheet = workbook.create_sheet("Schedule")
+        sheet.append(COLUMNS)
+        for entry in entries:
+            sheet.append([getattr(entry, field) for field in FIELDS])
+        workbook.save(path)
+        return
+
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        for entry in entries:
+            writer.writerow([getattr(entry, field) for field in FIELDS])
@@ -0,0 +1,93 @@
+"""
+Startup Profile Module for History Syllabus Generator
+Wall-clock timing of application startup, enabled with --startup-profile.
+
+    python main.py --startup-profile
+
+Reports the time spent in each top-level import made while main.py loads,
+in each create_*_tab call, and until the window is first idle.
+"""
+
+import builtins
+import sys
+import time
+
+
+class StartupProfile:
+    """Records (label, seconds) pairs and prints them as a table"""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.start = time.perf_counter()
+        self.timings = []
+        self._original_import = None
+        self._depth = 0
+
+    @classmethod
+    def from_argv(cls, argv):
+        """Create a profile, enabled (and removed from argv) if --startup-profile was passed"""
+        enabled = "--startup-profile" in argv
+        if enabled:
+            argv.remove("--startup-profile")
+        return cls(enabled)
+
+    def record(self, label, seconds):
+        if self.enabled:
+            self.timings.append((label, seconds))
+
+    def start_import_timing(self):
+        """Time every top-level import that loads new modules; nested imports count toward their parent"""
+        if not self.enabled or self._original_import is not None:
+            return
+        self._original_import = original = builtins.__import__
+
+        def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            if self._depth:
+                return original(name, globals, locals, fromlist, level)
+            self._depth += 1
+            loaded = len(sys.modules)
+            start = time.perf_counter()
+            try:
+                return original(name, globals, locals, fromlist, level)
+            finally:
+                self._depth -= 1
+                # Only report imports that actually loaded something
+                if len(sys.modules) > loaded:
+                    names = ", ".join(fromlist[:4]) + (", ..." if len(fromlist) > 4 else "")
+                    label = f"from {name} import {names}" if fromlist else f"import {name}"
+                    self.record(label, time.perf_counter() - start)
+
+        builtins.__import__ = timed_import
+
+    def stop_import_timing(self):
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def instrument(self, obj, prefix="create_", suffix="_tab"):
+        """Wrap the matching methods of obj so every call is timed"""
+        if not self.enabled:
+            return
+        for name in dir(type(obj)):
+            if name.startswith(prefix) and name.endswith(suffix) and callable(getattr(obj, name)):
+                setattr(obj, name, self._timed(name, getattr(obj, name)))
+
+    def _timed(self, label, method):
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.record(f"{label}()", time.perf_counter() - start)
+        return wrapper
+
+    def report(self, file=None):
+        """Print every timing plus the total time since the profile was created"""
+        if not self.enabled:
+            return
+        file = file or sys.stdout
+        total = time.perf_counter() - self.start
+        print("\nStartup profile (wall time)", file=file)
+        for label, seconds in self.timings:
+            print(f"  {seconds * 1000:8.1f} ms  {label}", file=file)
+        print(f"  {total * 1000:8.1f} ms  total until the window was ready", file=file, flush=True)
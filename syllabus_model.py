@@ -0,0 +1,190 @@
+"""
+Syllabus Model Module for History Syllabus Generator
+Immutable, widget-free representation of a syllabus's content.
+
+gather_content() snapshots the form into a SyllabusContent once; document
+builders, previews and batch jobs consume it without touching Tk widgets,
+so they can run off the UI thread or headless.
+"""
+
+import json
+from dataclasses import dataclass, field, fields, asdict
+
+from constants import COURSE_POLICY_SECTIONS
+
+
+@dataclass(frozen=True, slots=True)
+class CourseInfo:
+    """Course Information tab"""
+    course_num: str = ""
+    course_title: str = ""
+    term: str = ""
+    credits: str = ""
+    prerequisites: str = ""
+    meeting_times: str = ""
+    location: str = ""
+    description: str = ""
+    objectives: tuple = ()
+
+
+@dataclass(frozen=True, slots=True)
+class InstructorInfo:
+    """Instructor contact details"""
+    name: str = ""
+    office: str = ""
+    phone: str = ""
+    email: str = ""
+    office_hours: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class Section:
+    """A discussion section and its TA"""
+    name: str = ""
+    email: str = ""
+    office_hours: str = ""
+    class_room: str = ""
+    class_time: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class SloRow:
+    """One row of the General Education objectives (SLO) table"""
+    category: str = ""
+    slo: str = ""
+    assignments: str = ""
+    course_specific: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class Assignment:
+    """An assignment within a grading category"""
+    title: str = ""
+    due_date: str = ""
+    points: str = ""
+    description: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class GradingCategory:
+    """A weighted grading category and its assignments"""
+    name: str = ""
+    weight: str = ""
+    description: str = ""
+    assignments: tuple = ()
+
+
+@dataclass(frozen=True, slots=True)
+class Materials:
+    """Required materials text (with markup) and materials fee"""
+    required: str = ""
+    fee: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class Policies:
+    """Optional policy toggles and their texts"""
+    show_gen_ed: bool = True
+    grading_rounding: bool = False
+    use_simplified_policies: bool = True
+    late_submissions_enabled: bool = True
+    late_policy_choice: str = ""
+    late_policy_text: str = ""
+    extra_credit_enabled: bool = True
+    extra_credit_choice: str = ""
+    extra_credit_text: str = ""
+    canvas_enabled: bool = True
+    canvas_text: str = ""
+    technology_enabled: bool = True
+    technology_text: str = ""
+    communication_enabled: bool = True
+    communication_text: str = ""
+    outside_support_enabled: bool = True
+    support_text: str = ""
+
+    def course_sections(self):
+        """(heading, text) of every instructor policy the document prints: turned on and not blank"""
+        return tuple(
+            (heading, getattr(self, text_field))
+            for heading, enabled_field, text_field in COURSE_POLICY_SECTIONS
+            if getattr(self, enabled_field) and getattr(self, text_field).strip()
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduleEntry:
+    """One row of the Calendar"""
+    date: str = ""
+    topic: str = ""
+    readings: str = ""
+    work_due: str = ""
+
+    def is_empty(self):
+        """Return True if every column is blank"""
+        return not any((self.date.strip(), self.topic.strip(),
+                        self.readings.strip(), self.work_due.strip()))
+
+
+@dataclass(frozen=True, slots=True)
+class SyllabusContent:
+    """Everything needed to build a syllabus document"""
+    course_info: CourseInfo = field(default_factory=CourseInfo)
+    instructor: InstructorInfo = field(default_factory=InstructorInfo)
+    tas: tuple = ()
+    outcomes: tuple = ()
+    slo_rows: tuple = ()
+    grading_categories: tuple = ()
+    materials: Materials = None
+    policies: Policies = field(default_factory=Policies)
+    schedule: tuple = ()
+
+    def to_dict(self):
+        """Return a JSON-serializable dictionary"""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a SyllabusContent from a dictionary produced by to_dict()"""
+        materials = data.get("materials")
+        return cls(
+            course_info=_from_mapping(CourseInfo, data.get("course_info")),
+            instructor=_from_mapping(InstructorInfo, data.get("instructor")),
+            tas=tuple(_from_mapping(Section, ta) for ta in data.get("tas", ())),
+            outcomes=tuple(data.get("outcomes", ())),
+            slo_rows=tuple(_from_mapping(SloRow, row) for row in data.get("slo_rows", ())),
+            grading_categories=tuple(
+                _from_mapping(GradingCategory, category) for category in data.get("grading_categories", ())
+            ),
+            materials=_from_mapping(Materials, materials) if materials is not None else None,
+            policies=_from_mapping(Policies, data.get("policies")),
+            schedule=tuple(_from_mapping(ScheduleEntry, entry) for entry in data.get("schedule", ())),
+        )
+
+
+def _from_mapping(cls, data):
+    """Create a model object from a mapping, ignoring unknown keys and using defaults for missing ones"""
+    if data is None:
+        return cls()
+    values = {}
+    for f in fields(cls):
+        if f.name not in data:
+            continue
+        value = data[f.name]
+        if f.name == "assignments":
+            value = tuple(_from_mapping(Assignment, a) for a in value)
+        elif isinstance(value, list):
+            value = tuple(value)
+        values[f.name] = value
+    return cls(**values)
+
+
+def save_content(content, path):
+    """Write a SyllabusContent to a JSON file"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(content.to_dict(), f, indent=2)
+
+
+def load_content(path):
+    """Read a SyllabusContent from a JSON file written by save_content()"""
+    with open(path, "r", encoding="utf-8") as f:
+        return SyllabusContent.from_dict(json.load(f))
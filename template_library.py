@@ -0,0 +1,262 @@
+"""
+Template Library Module for History Syllabus Generator
+SQLite search index over the built-in and saved templates.
+
+The template bodies stay in the template store (template_store.py); the
+library keeps one row per template in a local SQLite database with an FTS5
+full-text index over course code, title, description, objectives and
+schedule readings. search() answers the type-ahead box of the template
+selector a page at a time, so it stays instant with thousands of templates.
+
+sync() brings the index up to date with the store: only templates whose
+index entry changed since the last sync are read. If the SQLite build has
+no FTS5, searching falls back to LIKE matching on the same rows.
+
+Bulk-load saved syllabi (*.json, see syllabus_model.save_content) as
+templates with:
+
+    python -m template_library --import SYLLABI_DIR
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import sys
+from dataclasses import dataclass
+
+from template_store import default_template_dir, template_id, template_name
+
+PAGE_SIZE = 50
+
+BUILTIN_PREFIX = "builtin:"
+
+SAVED = "saved"
+BUILTIN = "builtin"
+
+# Indexed columns, in the order of the FTS table; bm25 weights favour code and title matches
+SEARCH_COLUMNS = ("course_code", "title", "description", "objectives", "readings")
+_BM25_WEIGHTS = "10.0, 5.0, 1.0, 1.0, 0.5"
+
+
+def default_library_path():
+    """The library database sits next to the saved templates"""
+    return os.path.join(os.path.dirname(default_template_dir()), "template_library.sqlite3")
+
+
+def search_text(template):
+    """The indexed text of a template, keyed by SEARCH_COLUMNS"""
+    code = getattr(template, "course_code", "") or ""
+    # "AMH2010" also as "AMH 2010" so either spelling matches
+    spaced = " ".join(re.findall(r"[A-Za-z]+|\d+", code))
+    readings = "\n".join(
+        entry.get("readings", "") for entry in getattr(template, "schedule", None) or ()
+        if isinstance(entry, dict)
+    )
+    return {
+        "course_code": f"{code} {spaced}".strip(),
+        "title": getattr(template, "title", "") or "",
+        "description": getattr(template, "description", "") or "",
+        "objectives": "\n".join(str(o) for o in getattr(template, "objectives", None) or ()),
+        "readings": readings,
+    }
+
+
+def _digest(text):
+    return hashlib.sha1("\0".join(text[c] for c in SEARCH_COLUMNS).encode("utf-8")).hexdigest()
+
+
+def _match_query(query):
+    """FTS5 query: every word of the type-ahead text as a prefix, all of them required"""
+    return " ".join(f'"{word}"*' for word in re.findall(r"\w+", query))
+
+
+@dataclass(frozen=True, slots=True)
+class LibraryEntry:
+    """One search result; id is the template store id, or BUILTIN_PREFIX + id for a built-in template"""
+    id: str
+    course_code: str
+    title: str
+    source: str
+
+    @property
+    def name(self):
+        return template_name(self.course_code, self.title)
+
+
+class TemplateLibrary:
+    """Searchable index of templates in a SQLite database"""
+
+    def __init__(self, path=None):
+        self.path = path or default_library_path()
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self.connection = sqlite3.connect(self.path)
+        self.fts5_available = True
+        self._create_tables()
+
+    def _create_tables(self):
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS templates ("
+                " id TEXT PRIMARY KEY, course_code TEXT, title TEXT, source TEXT,"
+                " updated REAL, digest TEXT, sort_key TEXT)"
+            )
+            self.connection.execute("CREATE INDEX IF NOT EXISTS templates_sort ON templates(sort_key)")
+            try:
+                self.connection.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS templates_fts USING fts5("
+                    f"id UNINDEXED, {', '.join(SEARCH_COLUMNS)}, prefix='2 3')"
+                )
+            except sqlite3.OperationalError:
+                # SQLite without FTS5: keep the text in a plain table and search it with LIKE
+                self.fts5_available = False
+                self.connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS templates_text (id TEXT PRIMARY KEY, {', '.join(SEARCH_COLUMNS)})"
+                )
+
+    @property
+    def _text_table(self):
+        return "templates_fts" if self.fts5_available else "templates_text"
+
+    def close(self):
+        self.connection.close()
+
+    def _put(self, entry_id, code, title, source, updated, text):
+        self.connection.execute(
+            "INSERT OR REPLACE INTO templates (id, course_code, title, source, updated, digest, sort_key)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (entry_id, code, title, source, updated, _digest(text), template_name(code, title).lower())
+        )
+        self.connection.execute(f"DELETE FROM {self._text_table} WHERE id = ?", (entry_id,))
+        self.connection.execute(
+            f"INSERT INTO {self._text_table} (id, {', '.join(SEARCH_COLUMNS)}) VALUES (?{', ?' * len(SEARCH_COLUMNS)})",
+            (entry_id, *(text[c] for c in SEARCH_COLUMNS))
+        )
+
+    def sync(self, store, builtins=()):
+        """
+        Bring the index up to date with a TemplateStore and the built-in templates.
+
+        Saved templates are re-read only when their index timestamp changed;
+        a built-in template is hidden when a saved one has the same name.
+        Returns the number of templates (re)indexed.
+        """
+        known = {row[0]: (row[1], row[2]) for row in
+                 self.connection.execute("SELECT id, updated, digest FROM templates")}
+        saved = store.entries()
+        saved_names = {info.name for info in saved}
+        wanted = set()
+        changed = 0
+        with self.connection:
+            for info in saved:
+                wanted.add(info.id)
+                if info.id in known and known[info.id][0] == info.updated:
+                    continue
+                try:
+                    template = store.load(info.id)
+                except (OSError, ValueError) as e:
+                    print(f"Not indexing template {info.name}: {e}")
+                    continue
+                self._put(info.id, info.course_code, info.title, SAVED, info.updated, search_text(template))
+                changed += 1
+            for template in builtins:
+                if template_name(template.course_code, template.title) in saved_names:
+                    continue
+                entry_id = BUILTIN_PREFIX + template_id(template.course_code, template.title)
+                wanted.add(entry_id)
+                text = search_text(template)
+                if entry_id in known and known[entry_id][1] == _digest(text):
+                    continue
+                self._put(entry_id, template.course_code, template.title, BUILTIN, 0.0, text)
+                changed += 1
+            for entry_id in set(known) - wanted:
+                self.connection.execute("DELETE FROM templates WHERE id = ?", (entry_id,))
+                self.connection.execute(f"DELETE FROM {self._text_table} WHERE id = ?", (entry_id,))
+        return changed
+
+    def search(self, query="", limit=PAGE_SIZE, offset=0):
+        """
+        One page of templates matching the type-ahead text; returns (entries, total matches).
+
+        Every word must match the start of a word in the course code, title,
+        description, objectives or readings. With no query, all templates are
+        listed by name.
+        """
+        columns = "t.id, t.course_code, t.title, t.source"
+        match = _match_query(query)
+        if not match:
+            total = self.connection.execute("SELECT count(*) FROM templates").fetchone()[0]
+            rows = self.connection.execute(
+                f"SELECT {columns} FROM templates t ORDER BY t.sort_key LIMIT ? OFFSET ?", (limit, offset))
+        elif self.fts5_available:
+            total = self.connection.execute(
+                "SELECT count(*) FROM templates_fts WHERE templates_fts MATCH ?", (match,)).fetchone()[0]
+            rows = self.connection.execute(
+                f"SELECT {columns} FROM templates_fts f JOIN templates t ON t.id = f.id"
+                f" WHERE templates_fts MATCH ? ORDER BY bm25(templates_fts, 0.0, {_BM25_WEIGHTS}), t.sort_key"
+                " LIMIT ? OFFSET ?", (match, limit, offset))
+        else:
+            words = re.findall(r"\w+", query)
+            any_column = "(" + " OR ".join(f"x.{c} LIKE ?" for c in SEARCH_COLUMNS) + ")"
+            where = " AND ".join([any_column] * len(words))
+            params = [f"%{word}%" for word in words for _ in SEARCH_COLUMNS]
+            total = self.connection.execute(
+                f"SELECT count(*) FROM templates_text x WHERE {where}", params).fetchone()[0]
+            rows = self.connection.execute(
+                f"SELECT {columns} FROM templates_text x JOIN templates t ON t.id = x.id"
+                f" WHERE {where} ORDER BY t.sort_key LIMIT ? OFFSET ?", (*params, limit, offset))
+        return [LibraryEntry(*row) for row in rows], total
+
+
+def import_syllabi(directory, store):
+    """Save every syllabus (*.json SyllabusContent) in directory as a template; returns (imported, errors)"""
+    import glob
+    from syllabus_model import load_content
+    from templates import template_from_content
+
+    templates, errors = [], []
+    for path in sorted(glob.glob(os.path.join(directory, "*.json"))):
+        try:
+            template = template_from_content(load_content(path))
+            if not template.course_code or not template.title:
+                raise ValueError("no course number or title")
+            templates.append(template)
+        except Exception as e:
+            errors.append((path, f"{type(e).__name__}: {e}"))
+    store.save_all(templates)
+    return len(templates), errors
+
+
+def main(argv=None):
+    import argparse
+    from template_store import TemplateStore
+    from templates import load_default_templates
+
+    parser = argparse.ArgumentParser(prog="python -m template_library",
+                                     description="Search or fill the department template library.")
+    parser.add_argument("query", nargs="*", help="Words to search for (default: list every template)")
+    parser.add_argument("--import", dest="import_dir", metavar="SYLLABI_DIR",
+                        help="Save every syllabus (*.json) in SYLLABI_DIR as a template")
+    parser.add_argument("--page", type=int, default=1, help="Page of results to show (default: 1)")
+    args = parser.parse_args(argv)
+
+    store = TemplateStore()
+    library = TemplateLibrary()
+    if args.import_dir:
+        imported, errors = import_syllabi(args.import_dir, store)
+        print(f"Imported {imported} templates")
+        for path, error in errors:
+            print(f"  {os.path.basename(path)}: {error}")
+    library.sync(store, load_default_templates())
+
+    entries, total = library.search(" ".join(args.query), PAGE_SIZE, (max(args.page, 1) - 1) * PAGE_SIZE)
+    for entry in entries:
+        print(f"  {entry.name}" + (" (built-in)" if entry.source == BUILTIN else ""))
+    print(f"{total} templates match")
+    library.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,309 @@
+"""
+Template Store Module for History Syllabus Generator
+Saved syllabus templates as versioned JSON, one file per template.
+
+    <template dir>/index.json        course code, title and file of every template
+    <template dir>/<id>.json         {"version": 1, "template": {...}}
+
+Only the index is read at startup; a template's body is read the first time
+it is loaded. Saving writes that one template's file plus the index, each
+through a temporary file and an atomic rename, so a crash never leaves a
+half-written template behind. Bodies are checked against TEMPLATE_FIELDS
+when they are saved and loaded.
+
+Templates saved by older versions in syllabus_templates.pickle can be
+imported once with:
+
+    python -m template_store --import-pickle syllabus_templates.pickle
+"""
+
+import hashlib
+import json
+import os
+import platform
+import re
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+
+from templates import SyllabusTemplate
+
+SCHEMA_VERSION = 1
+
+INDEX_FILE = "index.json"
+
+# Attribute -> JSON type; attributes not listed here are stored as they are
+TEMPLATE_FIELDS = {
+    "course_code": str, "title": str, "description": str, "objectives": list, "outcomes": list,
+    "semester": str, "credits": str, "prerequisites": str,
+    "class_days": str, "class_times": str, "classroom": str,
+    "instructor_name": str, "instructor_office": str, "instructor_phone": str,
+    "instructor_email": str, "instructor_office_hours": str,
+    "tas": list, "schedule": list, "grading_categories": list, "learning_objectives": dict,
+    "optional_policies": dict, "grading_rounding": bool, "use_simplified_policies": bool,
+    "late_policy": str, "late_policy_text": str, "extra_credit_policy": str, "extra_credit_policy_text": str,
+    "canvas_policy": str, "technology_policy": str, "communication_policy": str, "support_policy": str,
+}
+
+REQUIRED_FIELDS = ("course_code", "title")
+
+
+class TemplateSchemaError(ValueError):
+    """A template file that doesn't match the expected schema"""
+
+
+def default_template_dir():
+    """Per-user template directory (override with the SYLLABUS_TEMPLATE_DIR environment variable)"""
+    if os.environ.get("SYLLABUS_TEMPLATE_DIR"):
+        return os.environ["SYLLABUS_TEMPLATE_DIR"]
+    if platform.system() == "Windows":
+        base = os.environ.get("APPDATA") or os.path.expanduser("~")
+    elif platform.system() == "Darwin":  # macOS
+        base = os.path.expanduser("~/Library/Application Support")
+    else:  # Linux
+        base = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    return os.path.join(base, "history-syllabus-generator", "templates")
+
+
+def template_name(course_code, title):
+    """Name shown in the template selector"""
+    return f"{course_code}: {title}"
+
+
+def template_id(course_code, title):
+    """File-name-safe id, unique per template name"""
+    name = template_name(course_code, title)
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", name).strip("-").lower()[:60]
+    return f"{slug}-{hashlib.sha1(name.encode('utf-8')).hexdigest()[:8]}"
+
+
+def validate_template(data):
+    """Raise TemplateSchemaError unless data is a template dictionary"""
+    if not isinstance(data, dict):
+        raise TemplateSchemaError(f"expected an object, got {type(data).__name__}")
+    for name in REQUIRED_FIELDS:
+        if not isinstance(data.get(name), str):
+            raise TemplateSchemaError(f"'{name}' is missing")
+    for name, value in data.items():
+        expected = TEMPLATE_FIELDS.get(name)
+        if expected is not None and not isinstance(value, expected):
+            raise TemplateSchemaError(f"'{name}' should be {expected.__name__}, not {type(value).__name__}")
+
+
+def template_to_dict(template):
+    """The template's attributes as a JSON-ready dictionary"""
+    data = {name: list(value) if isinstance(value, tuple) else value
+            for name, value in vars(template).items() if not name.startswith("_")}
+    validate_template(data)
+    return data
+
+
+def template_from_dict(data):
+    """Rebuild a SyllabusTemplate from template_to_dict() output"""
+    validate_template(data)
+    template = SyllabusTemplate(data["course_code"], data["title"])
+    for name, value in data.items():
+        setattr(template, name, value)
+    return template
+
+
+def _write_json_atomic(path, data):
+    """Write JSON under a private name, flush it to disk, then rename it over path"""
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _read_versioned(path):
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or not isinstance(data.get("version"), int):
+        raise TemplateSchemaError(f"{os.path.basename(path)} has no version")
+    if data["version"] > SCHEMA_VERSION:
+        raise TemplateSchemaError(f"{os.path.basename(path)} was written by a newer version of the program")
+    return data
+
+
+@dataclass(frozen=True, slots=True)
+class TemplateInfo:
+    """Index entry for a stored template; the body is read with TemplateStore.load(id)"""
+    id: str
+    course_code: str
+    title: str
+    updated: float = 0.0
+
+    @property
+    def name(self):
+        return template_name(self.course_code, self.title)
+
+
+class TemplateStore:
+    """Directory of JSON templates with an index, read lazily"""
+
+    def __init__(self, directory=None):
+        self.directory = directory or default_template_dir()
+        self._index = None  # id -> TemplateInfo, read on first use
+        self._bodies = {}  # id -> SyllabusTemplate loaded so far
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def _read_index(self):
+        try:
+            data = _read_versioned(self._path(INDEX_FILE))
+            return {
+                item["id"]: TemplateInfo(item["id"], item["course_code"], item["title"], item.get("updated", 0.0))
+                for item in data["templates"]
+            }
+        except FileNotFoundError:
+            # No index yet; there may still be template files (e.g. the index was deleted)
+            return self.rebuild_index() if os.path.isdir(self.directory) else {}
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Template index unreadable ({e}); rebuilding it from the template files")
+            return self.rebuild_index()
+
+    def _write_index(self, index):
+        os.makedirs(self.directory, exist_ok=True)
+        _write_json_atomic(self._path(INDEX_FILE), {
+            "version": SCHEMA_VERSION,
+            "templates": [
+                {"id": info.id, "course_code": info.course_code, "title": info.title, "updated": info.updated}
+                for info in index.values()
+            ],
+        })
+
+    def index(self):
+        if self._index is None:
+            self._index = self._read_index()
+        return self._index
+
+    def entries(self):
+        """TemplateInfo for every stored template, by name"""
+        return sorted(self.index().values(), key=lambda info: info.name.lower())
+
+    def find(self, name):
+        """TemplateInfo for a template name ("CODE: Title"), or None"""
+        for info in self.index().values():
+            if info.name == name:
+                return info
+        return None
+
+    def load(self, template_id):
+        """Read one template's body (once); raises OSError or TemplateSchemaError"""
+        if template_id not in self._bodies:
+            data = _read_versioned(self._path(f"{template_id}.json"))
+            self._bodies[template_id] = template_from_dict(data.get("template"))
+        return self._bodies[template_id]
+
+    def save(self, template):
+        """Write one template and its index entry; returns its TemplateInfo"""
+        return self.save_all([template])[0]
+
+    def save_all(self, templates):
+        """Write several templates, then the index once; returns their TemplateInfo"""
+        os.makedirs(self.directory, exist_ok=True)
+        infos = []
+        for template in templates:
+            data = template_to_dict(template)
+            info = TemplateInfo(template_id(data["course_code"], data["title"]),
+                                data["course_code"], data["title"], time.time())
+            _write_json_atomic(self._path(f"{info.id}.json"), {"version": SCHEMA_VERSION, "template": data})
+            self._bodies[info.id] = template
+            infos.append(info)
+
+        # Re-read the index so entries saved by another window aren't lost
+        self._index = self._read_index()
+        self._index.update((info.id, info) for info in infos)
+        self._write_index(self._index)
+        return infos
+
+    def delete(self, template_id):
+        index = self.index()
+        if index.pop(template_id, None) is not None:
+            self._write_index(index)
+        self._bodies.pop(template_id, None)
+        try:
+            os.remove(self._path(f"{template_id}.json"))
+        except FileNotFoundError:
+            pass
+
+    def rebuild_index(self):
+        """Recreate index.json from the template files (used when it is missing or damaged)"""
+        index = {}
+        try:
+            names = sorted(os.listdir(self.directory))
+        except FileNotFoundError:
+            return index
+        for file_name in names:
+            if not file_name.endswith(".json") or file_name == INDEX_FILE:
+                continue
+            path = self._path(file_name)
+            try:
+                data = _read_versioned(path)
+                validate_template(data.get("template"))
+            except (OSError, ValueError) as e:
+                print(f"Skipping template {file_name}: {e}")
+                continue
+            template_id = file_name[:-len(".json")]
+            index[template_id] = TemplateInfo(template_id, data["template"]["course_code"],
+                                              data["template"]["title"], os.path.getmtime(path))
+        try:
+            self._write_index(index)
+        except OSError as e:
+            print(f"Could not write the template index: {e}")
+        return index
+
+    def import_pickle(self, path):
+        """Copy every template from a legacy syllabus_templates.pickle into the store; returns the count"""
+        import pickle
+
+        class LegacyTemplateUnpickler(pickle.Unpickler):
+            """Unpickle old template objects as templates.SyllabusTemplate, refusing any other class"""
+
+            def find_class(self, module, name):
+                if name == "SyllabusTemplate":
+                    return SyllabusTemplate
+                raise pickle.UnpicklingError(f"unexpected object in template file: {module}.{name}")
+
+        with open(path, "rb") as f:
+            loaded = LegacyTemplateUnpickler(f).load()
+        templates = list(loaded.values()) if isinstance(loaded, dict) else list(loaded)
+        return len(self.save_all(templates))
+
+
+def main(argv=None):
+    import argparse
+    import pickle
+
+    parser = argparse.ArgumentParser(prog="python -m template_store", description="Manage saved syllabus templates.")
+    parser.add_argument("--dir", help="Template directory (default: the per-user template directory)")
+    parser.add_argument("--import-pickle", metavar="FILE", help="Import templates from a legacy .pickle file")
+    args = parser.parse_args(argv)
+
+    store = TemplateStore(args.dir)
+    if args.import_pickle:
+        try:
+            count = store.import_pickle(args.import_pickle)
+        except (OSError, ValueError, pickle.UnpicklingError) as e:
+            print(f"Could not import {args.import_pickle}: {e}")
+            return 1
+        print(f"Imported {count} templates into {store.directory}")
+    for info in store.entries():
+        print(f"  {info.name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,5 @@
+from dataclasses import asdict
+
 from constants import *
 
 class SyllabusTemplate:
@@ -12,6 +14,62 @@ class SyllabusTemplate:
         self.grading_categories = []
         self.learning_objectives = {}
 
+
+def template_from_content(content):
+    """Build a SyllabusTemplate from a SyllabusContent (the current form), in the shape load_template_content() reads"""
+    info = content.course_info
+    template = SyllabusTemplate(
+        course_code=info.course_num,
+        title=info.course_title,
+        description=info.description,
+        objectives=list(info.objectives),
+        outcomes=list(content.outcomes)
+    )
+    template.semester = info.term
+    template.credits = info.credits
+    template.prerequisites = info.prerequisites
+    # The form has a single Meeting Days/Times field
+    template.class_days = info.meeting_times
+    template.class_times = ""
+    template.classroom = info.location
+
+    instructor = content.instructor
+    template.instructor_name = instructor.name
+    template.instructor_office = instructor.office
+    template.instructor_phone = instructor.phone
+    template.instructor_email = instructor.email
+    template.instructor_office_hours = instructor.office_hours
+    template.tas = [asdict(section) for section in content.tas]
+
+    template.schedule = [asdict(entry) for entry in content.schedule]
+    template.grading_categories = [asdict(category) for category in content.grading_categories]
+    template.learning_objectives = {
+        row.category: {"slo": row.slo, "assignments": row.assignments, "course_specific": row.course_specific}
+        for row in content.slo_rows
+    }
+
+    policies = content.policies
+    template.optional_policies = {
+        "late_submissions": policies.late_submissions_enabled,
+        "extra_credit": policies.extra_credit_enabled,
+        "canvas": policies.canvas_enabled,
+        "technology": policies.technology_enabled,
+        "communication": policies.communication_enabled,
+        "outside_support": policies.outside_support_enabled,
+        "show_gen_ed": policies.show_gen_ed,
+    }
+    template.grading_rounding = policies.grading_rounding
+    template.use_simplified_policies = policies.use_simplified_policies
+    template.late_policy = policies.late_policy_choice
+    template.late_policy_text = policies.late_policy_text
+    template.extra_credit_policy = policies.extra_credit_choice
+    template.extra_credit_policy_text = policies.extra_credit_text
+    template.canvas_policy = policies.canvas_text
+    template.technology_policy = policies.technology_text
+    template.communication_policy = policies.communication_text
+    template.support_policy = policies.support_text
+    return template
+
 def load_default_templates():
     """Load a single default template for testing purposes"""
     try:
@@ -0,0 +1,172 @@
+"""
+Term Calendar Module for History Syllabus Generator
+Generates class meeting dates for the Calendar tab.
+
+Given the first and last day of the term, the meeting pattern from the
+Meeting Days/Times field ("MWF", "TR", "Tue/Thu 2:00-3:15", ...) and an
+optional no-class date file, meeting_dates() lists every class meeting and
+fill_schedule() puts those dates on the schedule rows, keeping the topics,
+readings and work due of the existing rows in class order.
+
+No-class file format, one date or range per line, '#' starts a comment:
+
+    2025-09-01  Labor Day
+    2025-11-26 - 2025-11-28  Thanksgiving Break
+"""
+
+import datetime
+import re
+
+from syllabus_model import ScheduleEntry
+
+NO_CLASS_TOPIC = "No Class"
+
+_DAY_NAMES = {
+    "monday": 0, "mon": 0,
+    "tuesday": 1, "tues": 1, "tue": 1,
+    "wednesday": 2, "wed": 2,
+    "thursday": 3, "thurs": 3, "thur": 3, "thu": 3,
+    "friday": 4, "fri": 4,
+    "saturday": 5, "sat": 5,
+    "sunday": 6, "sun": 6,
+}
+
+# Compact codes: M T W R F S U, plus Tu/Th/Sa/Su; the two-letter codes are tried first.
+# Codes are capitalized so that ordinary words ("must", "trust") aren't read as days.
+_DAY_CODES = {"tu": 1, "th": 3, "sa": 5, "su": 6, "m": 0, "t": 1, "w": 2, "r": 3, "f": 4, "s": 5, "u": 6}
+_DAY_CODE = re.compile(r"T[uUhH]|S[aAuU]|[MTWRFSU]")
+_DAY_CODE_RUN = re.compile(f"(?:{_DAY_CODE.pattern})+")
+
+_DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y", "%B %d, %Y", "%b %d, %Y", "%B %d %Y", "%b %d %Y",
+                 "%A, %B %d, %Y")
+_RANGE_SEPARATOR = re.compile(r"\s+(?:-|–|to|through)\s+|\.\.")
+
+
+def format_date(day):
+    """Date as the schedule shows it, e.g. "January 10, 2025" """
+    return f"{day:%B} {day.day}, {day.year}"
+
+
+def parse_date(text):
+    """Parse a date typed by hand (2025-08-25, 8/25/2025, August 25, 2025, ...); None if it isn't one"""
+    text = " ".join(str(text).replace(".", "").split())
+    for date_format in _DATE_FORMATS:
+        try:
+            return datetime.datetime.strptime(text, date_format).date()
+        except ValueError:
+            continue
+    return None
+
+
+def parse_meeting_days(text):
+    """
+    Weekdays (0 = Monday) named in a meeting-times string.
+
+    Understands compact patterns ("MWF", "TR", "TTh"), day names and
+    abbreviations ("Tuesday/Thursday", "Mon, Wed"); times and other words
+    are ignored. Returns a sorted tuple.
+    """
+    days = set()
+    for token in re.split(r"[\s,/&+;-]+", text or ""):
+        token = token.strip(".:")
+        if token.lower() in _DAY_NAMES:
+            days.add(_DAY_NAMES[token.lower()])
+            continue
+        if token.islower() and len(token) <= 3:
+            # Short lowercase patterns such as "mwf" or "tr"
+            token = token.upper()
+        if _DAY_CODE_RUN.fullmatch(token):
+            days.update(_DAY_CODES[code.lower()] for code in _DAY_CODE.findall(token))
+    return tuple(sorted(days))
+
+
+def load_no_class_dates(path):
+    """Read a no-class date file; returns {date: label}. Raises ValueError naming the first bad line"""
+    no_class = {}
+    with open(path, "r", encoding="utf-8-sig") as f:
+        for number, line in enumerate(f, start=1):
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            first, last, label = _parse_no_class_line(line)
+            if first is None:
+                raise ValueError(f"Line {number} of {path}: no date found in {line!r}")
+            day = first
+            while day <= last:
+                no_class[day] = label
+                day += datetime.timedelta(days=1)
+    return no_class
+
+
+def _parse_no_class_line(line):
+    """(first, last, label) for one line of a no-class file; first is None if there is no date"""
+    # The date (or range) is at the start of the line, separated from the label by a comma, tab or two spaces
+    parts = re.split(r",\s*(?=[A-Za-z])|\t|\s{2,}", line, maxsplit=1)
+    when = parts[0]
+    label = parts[1].strip() if len(parts) > 1 else ""
+    ends = _RANGE_SEPARATOR.split(when, maxsplit=1)
+    first = parse_date(ends[0])
+    last = parse_date(ends[1]) if len(ends) > 1 else first
+    if first is None or last is None:
+        # Single date followed by a label with no clear separator: "2025-09-01 Labor Day"
+        date_text, _, label = line.partition(" ")
+        first = last = parse_date(date_text)
+    return first, max(first, last) if first else None, label.strip()
+
+
+def meeting_dates(start, end, weekdays, no_class=None):
+    """
+    Every meeting between start and end (inclusive) on the given weekdays.
+
+    Returns a list of (date, label) pairs in order: label is "" for a class
+    meeting, or the no-class label (possibly "") for a meeting day that has
+    no class.
+    """
+    no_class = no_class or {}
+    weekdays = set(weekdays)
+    dates = []
+    if not weekdays or start is None or end is None:
+        return dates
+    day = start
+    while day <= end:
+        if day.weekday() in weekdays:
+            if day in no_class:
+                dates.append((day, no_class[day] or NO_CLASS_TOPIC))
+            else:
+                dates.append((day, ""))
+        day += datetime.timedelta(days=1)
+    return dates
+
+
+def is_no_class(entry):
+    """True for rows added by fill_schedule() for a day without class"""
+    return entry.topic.startswith(NO_CLASS_TOPIC) and not (entry.readings or entry.work_due)
+
+
+def fill_schedule(existing, dates, include_no_class=True):
+    """
+    Schedule rows for the given meeting_dates(), in one list.
+
+    The n-th class meeting keeps the topic, readings and work due of the
+    n-th existing class row (no-class rows are regenerated). Existing rows
+    left over when the new term has fewer meetings are kept at the end
+    without a date, so nothing typed is lost.
+    """
+    classes = [entry for entry in existing if not is_no_class(entry)]
+    rows = []
+    index = 0
+    for day, label in dates:
+        if label:
+            if include_no_class:
+                topic = NO_CLASS_TOPIC if label == NO_CLASS_TOPIC else f"{NO_CLASS_TOPIC} – {label}"
+                rows.append(ScheduleEntry(date=format_date(day), topic=topic))
+            continue
+        if index < len(classes):
+            entry = classes[index]
+            rows.append(ScheduleEntry(format_date(day), entry.topic, entry.readings, entry.work_due))
+        else:
+            rows.append(ScheduleEntry(date=format_date(day)))
+        index += 1
+    rows.extend(ScheduleEntry("", entry.topic, entry.readings, entry.work_due)
+                for entry in classes[index:] if not entry.is_empty())
+    return rows
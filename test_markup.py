@@ -0,0 +1,40 @@
+"""Tests for markup.tokenize"""
+
+from markup import BOLD, EMAIL, ITALIC, LINK, TEXT, Token, tokenize
+
+
+def test_plain_text_is_one_token():
+    assert tokenize("No links here.") == (Token(TEXT, "No links here."),)
+
+
+def test_bare_url_excludes_trailing_punctuation():
+    assert tokenize("See https://syllabus.ufl.edu/policy.") == (
+        Token(TEXT, "See "),
+        Token(LINK, "https://syllabus.ufl.edu/policy", "https://syllabus.ufl.edu/policy"),
+        Token(TEXT, "."),
+    )
+
+
+def test_email_links_to_mailto():
+    assert tokenize("Write to prof@ufl.edu") == (
+        Token(TEXT, "Write to "),
+        Token(EMAIL, "prof@ufl.edu", "mailto:prof@ufl.edu"),
+    )
+
+
+def test_asterisks_are_literal_without_markup():
+    assert tokenize("5 * 3 = **15**") == (Token(TEXT, "5 * 3 = **15**"),)
+
+
+def test_markup_bold_italic_and_labelled_link():
+    assert tokenize("**Book** by *Author*, [buy](https://example.com/a)", markup=True) == (
+        Token(BOLD, "Book"),
+        Token(TEXT, " by "),
+        Token(ITALIC, "Author"),
+        Token(TEXT, ", "),
+        Token(LINK, "buy", "https://example.com/a"),
+    )
+
+
+def test_results_are_memoized():
+    assert tokenize("https://example.com x", markup=True) is tokenize("https://example.com x", markup=True)
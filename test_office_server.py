@@ -0,0 +1,219 @@
+"""Tests for office_server: the conversion pool's retry logic, the warm server's fallback and batch timeouts"""
+
+import os
+import stat
+import sys
+import textwrap
+import time
+
+import pytest
+
+import office_server
+from office_server import (
+    ConversionPool, FakeOfficeConverter, LibreOfficeServer, OfficeConversionError, OfficeWorkerCrashed,
+    SubprocessOfficeConverter
+)
+
+
+class CrashOnceConverter(FakeOfficeConverter):
+    """Fake converter that crashes on its first call and works afterwards"""
+
+    def convert(self, docx_path, pdf_path, job=None, timeout=30):
+        if not self.calls:
+            self.calls.append((docx_path, pdf_path))
+            raise OfficeWorkerCrashed("crashed")
+        super().convert(docx_path, pdf_path, job, timeout)
+
+
+def fake_factory(*templates):
+    """converter_factory returning the given converters in order, then working fakes"""
+    made = []
+    pending = list(templates)
+
+    def factory():
+        made.append(pending.pop(0) if pending else FakeOfficeConverter())
+        return made[-1]
+
+    return factory, made
+
+
+def test_pool_retries_a_crash_on_a_fresh_worker(tmp_path):
+    factory, made = fake_factory(FakeOfficeConverter(crash=True))
+    pool = ConversionPool("soffice", size=1, converter_factory=factory)
+    pool.convert("a.docx", str(tmp_path / "a.pdf"))
+    crashed, fresh = made
+    assert crashed.shut_down and len(crashed.calls) == 1
+    assert fresh.calls == [("a.docx", str(tmp_path / "a.pdf"))]
+    assert (tmp_path / "a.pdf").exists()
+    assert pool.stats == {"conversions": 1, "retries": 1, "failures": 0}
+    pool.shutdown()
+    assert fresh.shut_down
+
+
+def test_pool_gives_up_after_one_retry(tmp_path):
+    factory, made = fake_factory(FakeOfficeConverter(crash=True), FakeOfficeConverter(crash=True))
+    pool = ConversionPool("soffice", size=1, converter_factory=factory)
+    with pytest.raises(OfficeWorkerCrashed):
+        pool.convert("a.docx", str(tmp_path / "a.pdf"))
+    assert len(made) == 2
+    assert pool.stats == {"conversions": 0, "retries": 1, "failures": 1}
+
+
+def test_pool_does_not_retry_ordinary_failures(tmp_path):
+    factory, made = fake_factory(FakeOfficeConverter(fail=True))
+    pool = ConversionPool("soffice", size=1, converter_factory=factory)
+    with pytest.raises(OfficeConversionError):
+        pool.convert("a.docx", str(tmp_path / "a.pdf"))
+    assert len(made) == 1 and pool.stats["retries"] == 0
+
+
+def test_convert_many_retries_crashed_files_on_a_fresh_worker(tmp_path):
+    factory, made = fake_factory(CrashOnceConverter(), FakeOfficeConverter())
+    pool = ConversionPool("soffice", size=2, converter_factory=factory)
+    pairs = [(f"{n}.docx", str(tmp_path / f"{n}.pdf")) for n in range(6)]
+    results = pool.convert_many(pairs)
+    assert results == {pdf_path: None for _, pdf_path in pairs}
+    # Whichever chunk hit the crash, only the crashed file went to the replacement
+    assert len(made) == 3 and made[0].shut_down
+    assert len(made[2].calls) == 1
+    assert pool.stats == {"conversions": 6, "retries": 1, "failures": 0}
+
+
+class RaisingConverter(FakeOfficeConverter):
+    """Fake converter whose batch conversion fails with an unexpected exception"""
+
+    def convert_many(self, pairs, timeout=30):
+        raise OSError("disk full")
+
+
+def test_convert_many_reports_every_file_when_a_replacement_cannot_start(tmp_path):
+    crashed = FakeOfficeConverter(crash=True)
+    made = []
+
+    def factory():
+        if made:
+            raise RuntimeError("soffice not found")
+        made.append(crashed)
+        return crashed
+
+    pool = ConversionPool("soffice", size=1, converter_factory=factory)
+    pairs = [(f"{n}.docx", str(tmp_path / f"{n}.pdf")) for n in range(3)]
+    results = pool.convert_many(pairs)
+    assert set(results) == {pdf_path for _, pdf_path in pairs}
+    assert all(isinstance(error, OfficeConversionError) for error in results.values())
+    assert "Could not start" in str(results[pairs[0][1]])
+    # The shut-down worker isn't handed out again; the next job tries to start a new one
+    assert crashed.shut_down
+    with pytest.raises(OfficeConversionError, match="Could not start"):
+        pool.convert("a.docx", str(tmp_path / "a.pdf"))
+    assert len(crashed.calls) == 3
+
+
+def test_convert_many_reports_unexpected_errors_per_file(tmp_path):
+    factory, made = fake_factory(RaisingConverter())
+    pool = ConversionPool("soffice", size=1, converter_factory=factory)
+    pairs = [(f"{n}.docx", str(tmp_path / f"{n}.pdf")) for n in range(2)]
+    results = pool.convert_many(pairs)
+    assert set(results) == {pdf_path for _, pdf_path in pairs}
+    assert all("disk full" in str(error) for error in results.values())
+    assert pool.stats["failures"] == 2
+    # The worker itself still works and goes back to the pool
+    pool.convert("a.docx", str(tmp_path / "a.pdf"))
+    assert made[0].calls == [("a.docx", str(tmp_path / "a.pdf"))]
+
+
+def test_server_falls_back_and_backs_off_after_a_failed_start(monkeypatch):
+    fallback = FakeOfficeConverter()
+    server = LibreOfficeServer("soffice", fallback=fallback, retry_interval=60)
+    starts = []
+
+    def failing_start():
+        starts.append(time.monotonic())
+        raise OfficeConversionError("soffice did not accept a UNO connection")
+
+    monkeypatch.setattr(server, "_start", failing_start)
+    server.convert("a.docx", os.devnull)
+    server.convert("b.docx", os.devnull)
+    assert len(starts) == 1
+    assert len(fallback.calls) == 2
+    assert server.stats["start_failures"] == 1 and server.stats["fallbacks"] == 2
+
+    # Once retry_interval has passed, the next job tries to start the server again
+    monkeypatch.setattr(server, "_start_failed_at", time.monotonic() - 61)
+    server.convert("c.docx", os.devnull)
+    assert len(starts) == 2
+
+
+@pytest.fixture
+def fake_soffice(tmp_path):
+    """
+    Executable that "converts" each input to <stem>.pdf. Stems containing hang or crash do just that;
+    stems containing bad are skipped with LibreOffice's load error. Each run adds a line to tmp_path/runs.
+    """
+    script = tmp_path / "soffice"
+    script.write_text(textwrap.dedent(f"""\
+        #!{sys.executable}
+        import os, signal, sys, time
+        args = sys.argv[1:]
+        with open({str(tmp_path / "runs")!r}, "a") as log:
+            log.write("run\\n")
+        outdir = args[args.index("--outdir") + 1]
+        for path in args[args.index("--outdir") + 2:]:
+            stem = os.path.splitext(os.path.basename(path))[0]
+            if "bad" in stem:
+                print("Error: source file could not be loaded", file=sys.stderr, flush=True)
+                continue
+            if "hang" in stem:
+                time.sleep(60)
+            if "crash" in stem:
+                os.kill(os.getpid(), signal.SIGKILL)
+            with open(os.path.join(outdir, stem + ".pdf"), "wb") as f:
+                f.write(b"%PDF-1.4\\n%%EOF\\n")
+    """))
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    return str(script)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs an executable script as soffice")
+def test_batch_hang_costs_one_timeout(tmp_path, fake_soffice, monkeypatch):
+    monkeypatch.setattr(office_server, "GROUP_POLL_INTERVAL", 0.05)
+    names = ["a", "b", "hang", "c", "d"]
+    pairs = []
+    for name in names:
+        (tmp_path / f"{name}.docx").write_bytes(b"docx")
+        pairs.append((str(tmp_path / f"{name}.docx"), str(tmp_path / f"{name}-out.pdf")))
+
+    begin = time.monotonic()
+    results = SubprocessOfficeConverter(fake_soffice).convert_many(pairs, timeout=0.5)
+    assert time.monotonic() - begin < 5
+    failed = {os.path.basename(pdf) for pdf, error in results.items() if error is not None}
+    assert failed == {"hang-out.pdf"}
+    assert "timed out" in str(results[str(tmp_path / "hang-out.pdf")])
+    assert all(os.path.exists(pdf) for pdf, error in results.items() if error is None)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs an executable script as soffice")
+def test_batch_crash_is_reported_as_worker_crash(tmp_path, fake_soffice):
+    pairs = []
+    for name in ("a", "crash", "b"):
+        (tmp_path / f"{name}.docx").write_bytes(b"docx")
+        pairs.append((str(tmp_path / f"{name}.docx"), str(tmp_path / f"{name}-out.pdf")))
+    results = SubprocessOfficeConverter(fake_soffice).convert_many(pairs, timeout=5)
+    assert results[pairs[0][1]] is None
+    assert isinstance(results[pairs[1][1]], OfficeWorkerCrashed)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs an executable script as soffice")
+def test_batch_skipped_file_is_not_blamed_for_a_hang(tmp_path, fake_soffice, monkeypatch):
+    monkeypatch.setattr(office_server, "GROUP_POLL_INTERVAL", 0.05)
+    pairs = []
+    for name in ("a", "bad", "hang", "b"):
+        (tmp_path / f"{name}.docx").write_bytes(b"docx")
+        pairs.append((str(tmp_path / f"{name}.docx"), str(tmp_path / f"{name}-out.pdf")))
+
+    results = SubprocessOfficeConverter(fake_soffice).convert_many(pairs, timeout=0.5)
+    # The hung file isn't sent to a second invocation to hang again; only b is
+    assert len((tmp_path / "runs").read_text().splitlines()) == 2
+    assert "could not be loaded" in str(results[pairs[1][1]])
+    assert "timed out" in str(results[pairs[2][1]])
+    assert results[pairs[0][1]] is None and results[pairs[3][1]] is None
@@ -0,0 +1,60 @@
+"""Tests for output_cache: content keys and the LRU cache"""
+
+import os
+import time
+
+import output_cache
+from output_cache import OutputCache, content_key
+from syllabus_model import CourseInfo, SyllabusContent
+
+
+def content(title="United States to 1877"):
+    return SyllabusContent(course_info=CourseInfo(course_num="AMH2010", course_title=title))
+
+
+def test_key_is_stable_for_equal_content():
+    assert content_key(content(), "pdf") == content_key(content(), "pdf")
+
+
+def test_key_depends_on_content_format_and_renderer(monkeypatch):
+    key = content_key(content(), "pdf")
+    assert content_key(content("Another title"), "pdf") != key
+    assert content_key(content(), "docx") != key
+    monkeypatch.setattr(output_cache, "RENDERER_VERSION", output_cache.RENDERER_VERSION + "-next")
+    assert content_key(content(), "pdf") != key
+
+
+def test_get_and_put(tmp_path):
+    cache = OutputCache(str(tmp_path))
+    assert cache.get(content(), "pdf") is None
+    cache.put(content(), "pdf", b"%PDF")
+    assert cache.get(content(), "pdf") == b"%PDF"
+    assert cache.get(content(), "docx") is None
+    assert cache.stats["hits"] == 1 and cache.stats["misses"] == 2 and cache.stats["stores"] == 1
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = OutputCache(str(tmp_path), max_bytes=25)
+    cache.put(content("old"), "pdf", b"x" * 10)
+    cache.put(content("used"), "pdf", b"x" * 10)
+    # Age both entries, then touch "used" so "old" is the least recently used
+    for name in os.listdir(tmp_path):
+        os.utime(tmp_path / name, (time.time() - 60, time.time() - 60))
+    assert cache.get(content("used"), "pdf") is not None
+    cache.put(content("new"), "pdf", b"x" * 10)
+    assert cache.get(content("old"), "pdf") is None
+    assert cache.get(content("used"), "pdf") is not None
+    assert cache.get(content("new"), "pdf") is not None
+    assert cache.stats["evictions"] == 1
+
+
+def test_failed_write_leaves_no_temporary_file(tmp_path, monkeypatch):
+    cache = OutputCache(str(tmp_path))
+
+    def replace_fails(src, dst):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(output_cache.os, "replace", replace_fails)
+    cache.put(content(), "pdf", b"%PDF")
+    assert os.listdir(tmp_path) == []
+    assert cache.stats["stores"] == 0
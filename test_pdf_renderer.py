@@ -0,0 +1,30 @@
+"""Smoke tests for pdf_renderer"""
+
+import io
+
+import pytest
+
+pytest.importorskip("reportlab")
+
+from pdf_renderer import render_syllabus_pdf
+from syllabus_model import CourseInfo, Materials, ScheduleEntry, SyllabusContent
+
+
+def render(content):
+    buffer = io.BytesIO()
+    render_syllabus_pdf(content, buffer)
+    return buffer.getvalue()
+
+
+def test_renders_a_pdf():
+    content = SyllabusContent(
+        course_info=CourseInfo(course_num="AMH2010", course_title="United States to 1877"),
+        materials=Materials(required="**Give Me Liberty!** [publisher](https://example.com/?a=1&b=2)"),
+        schedule=(ScheduleEntry("August 22, 2025", "Introduction"),),
+    )
+    assert render(content).startswith(b"%PDF")
+
+
+def test_link_with_a_quote_in_its_url():
+    content = SyllabusContent(materials=Materials(required='See [the reader](http://a.com/x"onload) now'))
+    assert render(content).startswith(b"%PDF")
@@ -0,0 +1,67 @@
+"""Tests for roll_forward: re-dating a syllabus and the batch report"""
+
+import datetime
+
+from roll_forward import NOT_MOVED, format_report, roll_forward, run_roll_forward
+from syllabus_model import (
+    Assignment, CourseInfo, GradingCategory, ScheduleEntry, SyllabusContent, load_content, save_content
+)
+from term_calendar import NO_CLASS_TOPIC
+
+START = datetime.date(2026, 1, 12)
+END = datetime.date(2026, 1, 23)
+HOLIDAY = {datetime.date(2026, 1, 19): "MLK Day"}
+
+
+def fall_content():
+    return SyllabusContent(
+        course_info=CourseInfo(course_num="AMH2010", term="Fall 2025", meeting_times="MWF"),
+        grading_categories=(GradingCategory("Quizzes", assignments=(
+            Assignment("Quiz 1", "September 3, 2025"),
+            Assignment("Quiz 2", "Sept 5"),
+            Assignment("Quiz 3", ""),
+        )),),
+        schedule=tuple(ScheduleEntry(f"September {day}, 2025", f"Topic {day}") for day in (1, 3, 5)),
+    )
+
+
+def test_schedule_moves_by_class_index():
+    content, changes = roll_forward(fall_content(), "Spring 2026", START, END, no_class=HOLIDAY)
+    assert content.course_info.term == "Spring 2026"
+    assert [(row.date, row.topic) for row in content.schedule[:3]] == [
+        ("January 12, 2026", "Topic 1"), ("January 14, 2026", "Topic 3"), ("January 16, 2026", "Topic 5")]
+    assert content.schedule[3].topic == f"{NO_CLASS_TOPIC} – MLK Day"
+    assert ("Term", "Fall 2025", "Spring 2026") in changes
+
+
+def test_include_no_class_false_leaves_holidays_off():
+    content, _ = roll_forward(fall_content(), "Spring 2026", START, END, no_class=HOLIDAY, include_no_class=False)
+    assert not any(row.topic.startswith(NO_CLASS_TOPIC) for row in content.schedule)
+
+
+def test_due_dates_move_and_unreadable_ones_are_reported():
+    content, changes = roll_forward(fall_content(), "Spring 2026", START, END, no_class=HOLIDAY)
+    quizzes = content.grading_categories[0].assignments
+    assert quizzes[0].due_date == "January 14, 2026"
+    assert quizzes[1].due_date == "Sept 5"
+    assert ("Quizzes: Quiz 2", "Sept 5", NOT_MOVED) in changes
+    # A blank due date isn't a date that failed to move
+    assert not any(where == "Quizzes: Quiz 3" for where, _, _ in changes)
+
+
+def test_run_roll_forward_passes_include_no_class(tmp_path):
+    save_content(fall_content(), tmp_path / "amh2010.json")
+    output = tmp_path / "out"
+    results = run_roll_forward(str(tmp_path), "Spring 2026", START, END, str(output), no_class=HOLIDAY,
+                               workers=1, include_no_class=False)
+    assert [r["error"] for r in results] == [None]
+    rolled = load_content(output / "amh2010.json")
+    assert not any(row.topic.startswith(NO_CLASS_TOPIC) for row in rolled.schedule)
+    assert f"Quizzes: Quiz 2: Sept 5 -> {NOT_MOVED}" in format_report(results)
+
+
+def test_dry_run_writes_nothing(tmp_path):
+    save_content(fall_content(), tmp_path / "amh2010.json")
+    results = run_roll_forward(str(tmp_path), "Spring 2026", START, END, workers=1, dry_run=True)
+    assert results[0]["output"] is None
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["amh2010.json"]
@@ -0,0 +1,57 @@
+"""Tests for schedule_io: CSV and Excel schedule import/export"""
+
+import pytest
+
+from schedule_io import iter_schedule, read_schedule, write_schedule
+from syllabus_model import ScheduleEntry
+
+ROWS = [
+    ScheduleEntry("August 22, 2025", "Introduction", "Syllabus", ""),
+    ScheduleEntry("August 25, 2025", "Colonial America", "Ch. 1, pp. 1-30", "Quiz 1"),
+]
+
+
+@pytest.mark.parametrize("name", ["schedule.csv", "schedule.xlsx"])
+def test_write_then_read(tmp_path, name):
+    path = str(tmp_path / name)
+    write_schedule(path, ROWS)
+    assert read_schedule(path) == (ROWS, [])
+
+
+def test_headers_match_loosely_and_blank_rows_are_skipped(tmp_path):
+    path = tmp_path / "schedule.csv"
+    path.write_text("\ufeffclass date,TOPICS,Assigned Readings,Assignments Due\n"
+                    "8/22/2025,Introduction,,\n,,,\nAugust 25,Colonial America,Ch. 1,Quiz 1\n", encoding="utf-8")
+    rows, errors = read_schedule(str(path))
+    assert rows == [ScheduleEntry("8/22/2025", "Introduction"),
+                    ScheduleEntry("August 25", "Colonial America", "Ch. 1", "Quiz 1")]
+    assert errors == []
+
+
+def test_rows_wider_than_the_header_are_reported(tmp_path):
+    path = tmp_path / "schedule.csv"
+    path.write_text("Date,Topic\nAugust 22,Introduction\nAugust 25,Colonial America,extra\n", encoding="utf-8")
+    rows, errors = read_schedule(str(path))
+    assert rows == [ScheduleEntry("August 22", "Introduction")]
+    assert [number for number, _ in errors] == [3]
+
+
+def test_unrecognized_header_raises(tmp_path):
+    path = tmp_path / "schedule.csv"
+    path.write_text("Name,Score\nA,1\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="No schedule columns"):
+        list(iter_schedule(str(path)))
+
+
+def test_empty_file_raises(tmp_path):
+    path = tmp_path / "schedule.csv"
+    path.write_text("", encoding="utf-8")
+    with pytest.raises(ValueError, match="empty"):
+        list(iter_schedule(str(path)))
+
+
+def test_file_that_is_not_a_workbook_raises_value_error(tmp_path):
+    path = tmp_path / "schedule.xlsx"
+    path.write_text("Date,Topic\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="not a readable Excel workbook"):
+        list(iter_schedule(str(path)))
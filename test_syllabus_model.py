@@ -0,0 +1,54 @@
+"""Tests for syllabus_model: the SyllabusContent JSON round trip and policy sections"""
+
+from syllabus_model import (
+    Assignment, CourseInfo, GradingCategory, Materials, Policies, ScheduleEntry, Section, SyllabusContent,
+    load_content, save_content
+)
+
+
+def sample_content():
+    return SyllabusContent(
+        course_info=CourseInfo(course_num="AMH2010", course_title="United States to 1877", term="Fall 2025",
+                               meeting_times="MWF 3rd period", objectives=("Read sources", "Write history")),
+        tas=(Section(name="A. Student", email="student@ufl.edu"),),
+        outcomes=("Content", "Communication"),
+        grading_categories=(
+            GradingCategory("Essays", "40", assignments=(Assignment("Essay 1", "September 26, 2025", "100"),)),
+        ),
+        materials=Materials(required="**Give Me Liberty!** [publisher](https://example.com)"),
+        policies=Policies(late_submissions_enabled=False, canvas_text="Check Canvas daily."),
+        schedule=(ScheduleEntry("August 22, 2025", "Introduction"), ScheduleEntry(topic="Review")),
+    )
+
+
+def test_dict_round_trip():
+    content = sample_content()
+    assert SyllabusContent.from_dict(content.to_dict()) == content
+
+
+def test_file_round_trip(tmp_path):
+    content = sample_content()
+    path = tmp_path / "syllabus.json"
+    save_content(content, path)
+    assert load_content(path) == content
+
+
+def test_from_dict_fills_defaults_and_ignores_unknown_keys():
+    content = SyllabusContent.from_dict({"course_info": {"course_num": "EUH2000", "retired": True}})
+    assert content.course_info == CourseInfo(course_num="EUH2000")
+    assert content.materials is None
+    assert content.schedule == ()
+
+
+def test_course_sections_skip_disabled_and_blank_policies():
+    policies = Policies(late_submissions_enabled=False, late_policy_text="Late work loses 10%.",
+                        canvas_text="Check Canvas daily.", technology_text="  ")
+    headings = [heading for heading, _ in policies.course_sections()]
+    assert "Canvas" in headings
+    assert "Late Submissions" not in headings
+    assert "Technology in the Classroom" not in headings
+
+
+def test_schedule_entry_is_empty():
+    assert ScheduleEntry(" ", "", "\n", "").is_empty()
+    assert not ScheduleEntry(work_due="Quiz").is_empty()
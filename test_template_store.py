@@ -0,0 +1,115 @@
+"""Tests for template_store and template_library"""
+
+import json
+import pickle
+
+import pytest
+
+from template_library import BUILTIN, SAVED, TemplateLibrary
+from template_store import INDEX_FILE, TemplateSchemaError, TemplateStore, template_from_dict, template_to_dict
+from templates import SyllabusTemplate
+
+
+def make_template(code, title, description="", readings=""):
+    template = SyllabusTemplate(code, title, description, objectives=["Analyze primary sources"])
+    template.schedule = [{"date": "", "topic": "Intro", "readings": readings, "work_due": ""}]
+    template.semester = "Fall 2025"
+    return template
+
+
+def test_dict_round_trip():
+    template = make_template("AMH2010", "United States to 1877")
+    assert vars(template_from_dict(template_to_dict(template))) == vars(template)
+
+
+def test_schema_is_checked():
+    with pytest.raises(TemplateSchemaError):
+        template_from_dict({"course_code": "AMH2010"})
+    with pytest.raises(TemplateSchemaError):
+        template_from_dict({"course_code": "AMH2010", "title": "US", "objectives": "not a list"})
+
+
+def test_save_then_load_from_a_new_store(tmp_path):
+    TemplateStore(str(tmp_path)).save(make_template("AMH2010", "United States to 1877"))
+    store = TemplateStore(str(tmp_path))
+    [info] = store.entries()
+    assert info.name == "AMH2010: United States to 1877"
+    assert store.load(info.id).semester == "Fall 2025"
+
+
+def test_missing_index_is_rebuilt(tmp_path):
+    TemplateStore(str(tmp_path)).save_all([make_template("AMH2010", "US to 1877"),
+                                           make_template("AMH2020", "US since 1877")])
+    (tmp_path / INDEX_FILE).unlink()
+    store = TemplateStore(str(tmp_path))
+    assert [info.course_code for info in store.entries()] == ["AMH2010", "AMH2020"]
+    assert (tmp_path / INDEX_FILE).exists()
+
+
+def test_newer_schema_version_is_refused(tmp_path):
+    store = TemplateStore(str(tmp_path))
+    info = store.save(make_template("AMH2010", "US to 1877"))
+    path = tmp_path / f"{info.id}.json"
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["version"] += 1
+    path.write_text(json.dumps(data), encoding="utf-8")
+    with pytest.raises(TemplateSchemaError, match="newer version"):
+        TemplateStore(str(tmp_path)).load(info.id)
+
+
+def test_delete(tmp_path):
+    store = TemplateStore(str(tmp_path))
+    info = store.save(make_template("AMH2010", "US to 1877"))
+    store.delete(info.id)
+    assert TemplateStore(str(tmp_path)).entries() == []
+
+
+def test_import_pickle(tmp_path):
+    path = tmp_path / "syllabus_templates.pickle"
+    with open(path, "wb") as f:
+        pickle.dump({"AMH2010": make_template("AMH2010", "US to 1877")}, f)
+    store = TemplateStore(str(tmp_path / "store"))
+    assert store.import_pickle(path) == 1
+    assert store.entries()[0].course_code == "AMH2010"
+
+
+def test_library_search_and_sync(tmp_path):
+    store = TemplateStore(str(tmp_path / "store"))
+    store.save(make_template("AMH2010", "United States to 1877", readings="Give Me Liberty, ch. 1"))
+    builtins = [make_template("EUH2001", "Modern Europe", description="Revolutions and empires"),
+                make_template("AMH2010", "United States to 1877")]
+    library = TemplateLibrary(str(tmp_path / "library.sqlite3"))
+    try:
+        assert library.sync(store, builtins) == 2
+        assert library.sync(store, builtins) == 0
+
+        entries, total = library.search()
+        # The saved template hides the built-in one with the same name
+        assert total == 2
+        assert {(e.course_code, e.source) for e in entries} == {("AMH2010", SAVED), ("EUH2001", BUILTIN)}
+
+        assert [e.course_code for e in library.search("AMH 2010")[0]] == ["AMH2010"]
+        assert [e.course_code for e in library.search("liber")[0]] == ["AMH2010"]
+        assert [e.course_code for e in library.search("revol emp")[0]] == ["EUH2001"]
+        assert library.search("medieval") == ([], 0)
+
+        store.delete(store.entries()[0].id)
+        library.sync(store, builtins)
+        assert {(e.course_code, e.source) for e in library.search()[0]} == {
+            ("AMH2010", BUILTIN), ("EUH2001", BUILTIN)}
+    finally:
+        library.close()
+
+
+def test_library_pages(tmp_path):
+    store = TemplateStore(str(tmp_path / "store"))
+    store.save_all([make_template(f"HIS{n:04d}", "Topics in History") for n in range(7)])
+    library = TemplateLibrary(str(tmp_path / "library.sqlite3"))
+    try:
+        library.sync(store)
+        first, total = library.search("topics", limit=5)
+        second, _ = library.search("topics", limit=5, offset=5)
+        assert total == 7 and len(first) == 5 and len(second) == 2
+        assert not {e.id for e in first} & {e.id for e in second}
+    finally:
+        library.close()
@@ -0,0 +1,73 @@
+"""Tests for term_calendar: date parsing, meeting days and schedule filling"""
+
+import datetime
+
+from syllabus_model import ScheduleEntry
+from term_calendar import (
+    NO_CLASS_TOPIC, fill_schedule, format_date, load_no_class_dates, meeting_dates, parse_date, parse_meeting_days
+)
+
+
+def test_parse_date_formats():
+    expected = datetime.date(2025, 8, 25)
+    for text in ("2025-08-25", "8/25/2025", "8/25/25", "August 25, 2025", "Aug. 25, 2025", "Monday, August 25, 2025"):
+        assert parse_date(text) == expected, text
+    assert parse_date("Sept 5") is None
+    assert parse_date("TBA") is None
+
+
+def test_format_date_has_no_leading_zero():
+    assert format_date(datetime.date(2026, 1, 5)) == "January 5, 2026"
+
+
+def test_parse_meeting_days():
+    assert parse_meeting_days("MWF 3rd period") == (0, 2, 4)
+    assert parse_meeting_days("TR 10:40-11:30") == (1, 3)
+    assert parse_meeting_days("TTh") == (1, 3)
+    assert parse_meeting_days("Tuesday/Thursday 2:00-3:15") == (1, 3)
+    assert parse_meeting_days("mwf") == (0, 2, 4)
+    assert parse_meeting_days("must trust") == ()
+
+
+def test_load_no_class_dates(tmp_path):
+    path = tmp_path / "holidays.txt"
+    path.write_text("# Fall 2025\n2025-09-01  Labor Day\n2025-11-26 - 2025-11-28  Thanksgiving Break\n"
+                    "11/11/2025, Veterans Day\n", encoding="utf-8")
+    no_class = load_no_class_dates(path)
+    assert no_class[datetime.date(2025, 9, 1)] == "Labor Day"
+    assert no_class[datetime.date(2025, 11, 27)] == "Thanksgiving Break"
+    assert no_class[datetime.date(2025, 11, 11)] == "Veterans Day"
+    assert len(no_class) == 5
+
+
+def test_load_no_class_dates_names_bad_line(tmp_path):
+    path = tmp_path / "holidays.txt"
+    path.write_text("2025-09-01  Labor Day\nsometime  Homecoming\n", encoding="utf-8")
+    try:
+        load_no_class_dates(path)
+    except ValueError as e:
+        assert "Line 2" in str(e)
+    else:
+        raise AssertionError("expected ValueError")
+
+
+def test_meeting_dates_marks_no_class_days():
+    dates = meeting_dates(datetime.date(2025, 9, 1), datetime.date(2025, 9, 5), (0, 2, 4),
+                          {datetime.date(2025, 9, 1): "Labor Day"})
+    assert dates == [(datetime.date(2025, 9, 1), "Labor Day"), (datetime.date(2025, 9, 3), ""),
+                     (datetime.date(2025, 9, 5), "")]
+
+
+def test_fill_schedule_keeps_topics_in_class_order():
+    existing = [ScheduleEntry("old", "Topic 1", "Ch. 1"), ScheduleEntry("old", "Topic 2"), ScheduleEntry("old", "Topic 3")]
+    dates = [(datetime.date(2025, 9, 1), "Labor Day"), (datetime.date(2025, 9, 3), ""),
+             (datetime.date(2025, 9, 5), "")]
+    rows = fill_schedule(existing, dates)
+    assert rows == [
+        ScheduleEntry("September 1, 2025", f"{NO_CLASS_TOPIC} – Labor Day"),
+        ScheduleEntry("September 3, 2025", "Topic 1", "Ch. 1"),
+        ScheduleEntry("September 5, 2025", "Topic 2"),
+        ScheduleEntry("", "Topic 3"),
+    ]
+    assert [row.topic for row in fill_schedule(existing, dates, include_no_class=False)] == [
+        "Topic 1", "Topic 2", "Topic 3"]
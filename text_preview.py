@@ -0,0 +1,303 @@
+"""
+Text Preview Module for History Syllabus Generator
+Alternative document preview backend that renders the whole syllabus into a
+single read-only tk.Text widget using named tags
+"""
+
+import tkinter as tk
+from tkinter import ttk
+import webbrowser
+from constants import *
+from markup import tokenize, BOLD, ITALIC
+
+# Tab stops (pixels) used to lay out table-like sections
+CALENDAR_TABS = (110, 330, 680)
+SLO_TABLE_TABS = (130, 380, 560)
+TWO_COLUMN_TABS = (200,)
+
+
+class TaggedTextBuffer:
+    """Collects (chars, tags) pairs so a full render is a single Text.insert call"""
+
+    def __init__(self):
+        self.parts = []
+        self.links = {}
+
+    def write(self, text, *tags):
+        """Append text carrying the given tags"""
+        if text:
+            self.parts.append(text)
+            self.parts.append(tags)
+
+    def line(self, text="", *tags):
+        """Append text followed by a newline"""
+        self.write(text + "\n", *tags)
+
+    def heading(self, text, level=1):
+        """Append a section heading"""
+        self.line(text, f"h{level}")
+
+    def link(self, text, url, *tags):
+        """Append a clickable link; the URL is looked up from its href tag on click"""
+        href = f"href{len(self.links)}"
+        self.links[href] = url
+        self.write(text, "link", href, *tags)
+
+    def paragraph(self, text, *tags, links=True, markup=False):
+        """
+        Append a paragraph, turning URLs and email addresses into links when
+        requested and applying the Required Materials markup when markup=True
+        """
+        if links or markup:
+            for token in tokenize(text, markup):
+                if token.url:
+                    self.link(token.text, token.url, *tags)
+                elif token.kind == BOLD:
+                    self.write(token.text, "bold", *tags)
+                elif token.kind == ITALIC:
+                    self.write(token.text, "italic", *tags)
+                else:
+                    self.write(token.text, *tags)
+        else:
+            self.write(text, *tags)
+        self.write("\n", *tags)
+
+    def table_row(self, cells, *tags):
+        """
+        Append a tab-separated table row.
+
+        Multi-line cells are spread over several physical lines so every line
+        stays aligned with the table's tab stops.
+        """
+        columns = [str(cell).split("\n") for cell in cells]
+        for i in range(max(len(lines) for lines in columns)):
+            values = [lines[i] if i < len(lines) else "" for lines in columns]
+            self.line("\t".join(values), *tags)
+
+    def insert_args(self):
+        """Return the flattened chars/tags arguments for Text.insert"""
+        return self.parts
+
+
+class TextPreviewMixin:
+    """Mixin class containing the single-widget tagged-text preview backend"""
+
+    def create_text_preview_widget(self, parent):
+        """Create the read-only Text widget and configure its tags"""
+        text_frame = ttk.Frame(parent, relief=tk.SUNKEN, borderwidth=1)
+
+        self.preview_text = tk.Text(text_frame, wrap=tk.WORD, bg="white", bd=0,
+                                    padx=20, pady=20, highlightthickness=0,
+                                    font=("Times New Roman", 10), cursor="arrow")
+        scrollbar_y = ttk.Scrollbar(text_frame, orient="vertical", command=self.preview_text.yview)
+        scrollbar_x = ttk.Scrollbar(text_frame, orient="horizontal", command=self.preview_text.xview)
+        self.preview_text.configure(yscrollcommand=scrollbar_y.set, xscrollcommand=scrollbar_x.set)
+
+        scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
+        scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
+        self.preview_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        text = self.preview_text
+        text.tag_configure("title", font=("Times New Roman", 14, "bold"), justify=tk.CENTER, spacing3=5)
+        text.tag_configure("subtitle", font=("Times New Roman", 12), justify=tk.CENTER, spacing3=10)
+        text.tag_configure("h1", font=("Times New Roman", 12, "bold"), spacing1=10, spacing3=5)
+        text.tag_configure("h2", font=("Times New Roman", 11, "bold"), spacing1=8, spacing3=4)
+        text.tag_configure("bold", font=("Times New Roman", 10, "bold"))
+        text.tag_configure("italic", font=("Times New Roman", 9, "italic"))
+        text.tag_configure("indent1", lmargin1=20, lmargin2=20)
+        text.tag_configure("indent2", lmargin1=40, lmargin2=40)
+        text.tag_configure("link", foreground="blue", underline=True)
+        text.tag_configure("calendar", tabs=CALENDAR_TABS, wrap=tk.NONE)
+        text.tag_configure("slo_table", tabs=SLO_TABLE_TABS, wrap=tk.NONE, lmargin1=10)
+        text.tag_configure("two_column", tabs=TWO_COLUMN_TABS, lmargin1=10)
+        text.tag_configure("table_header", font=("Arial", 9, "bold"),
+                           background="#808080", foreground="white")
+        text.tag_configure("footer", font=("Times New Roman", 9, "italic"), spacing1=20)
+
+        # A single binding serves every link; the href tag under the pointer identifies the URL
+        text.tag_bind("link", "<Button-1>", self._on_text_preview_link)
+        text.tag_bind("link", "<Enter>", lambda e: text.config(cursor="hand2"))
+        text.tag_bind("link", "<Leave>", lambda e: text.config(cursor="arrow"))
+
+        text.config(state=tk.DISABLED)
+        self._preview_text_links = {}
+        self._preview_text_inputs = None
+        return text_frame
+
+    def _on_text_preview_link(self, event):
+        """Open the URL of the link that was clicked"""
+        for tag in self.preview_text.tag_names(tk.CURRENT):
+            if tag in self._preview_text_links:
+                webbrowser.open(self._preview_text_links[tag])
+                break
+
+    def render_text_preview(self, inputs, force=False):
+        """Render all preview sections into the Text widget with one bulk insert"""
+        snapshot = tuple(inputs[key] for key in self.PREVIEW_SECTIONS)
+        if not force and snapshot == self._preview_text_inputs:
+            return
+
+        buffer = TaggedTextBuffer()
+        for key in self.PREVIEW_SECTIONS:
+            getattr(self, f"_text_preview_{key}")(buffer, inputs[key])
+
+        text = self.preview_text
+        first_visible = text.yview()[0]
+        text.config(state=tk.NORMAL)
+        text.delete("1.0", tk.END)
+        text.insert("1.0", *buffer.insert_args())
+        text.config(state=tk.DISABLED)
+        text.yview_moveto(first_visible)
+
+        self._preview_text_links = buffer.links
+        self._preview_text_inputs = snapshot
+
+    # ------------------------------------------------------------------
+    # Section writers (mirror the widget renderers in DocumentPreviewMixin)
+
+    def _text_preview_header(self, out, inputs):
+        course_num, course_title, term, credits = inputs
+        out.line(f"{course_num}: {course_title}", "title")
+        out.line(f"{term} ({credits} credits)", "subtitle")
+
+    def _text_preview_general_info(self, out, inputs):
+        (meeting_times, location, instructor, has_sections, tas,
+         description, prerequisites, show_gen_ed, course_num) = inputs
+
+        out.heading("I. General Information")
+        out.write("Meeting days and times: ", "bold", "indent1")
+        out.line(meeting_times, "indent1")
+        out.write("Class location: ", "bold", "indent1")
+        out.line(location, "indent1")
+
+        out.line("\nInstructor:", "bold")
+        for label, value in zip(("Name:", "Office:", "Phone:", "Email:", "Office Hours:"), instructor):
+            out.write(f"{label} ", "bold", "indent1")
+            out.line(value, "indent1")
+
+        if has_sections:
+            out.line("\nSections:", "bold")
+            labels = ("TA Name:", "Email:", "Office Hours:", "Section Meeting Place:", "Section Meeting Time:")
+            for ta in tas:
+                for label, value in zip(labels, ta):
+                    out.write(f"{label} ", "bold", "indent1")
+                    out.line(value, "indent1")
+
+        out.heading("Course Description")
+        out.paragraph(description)
+
+        out.heading("Prerequisites")
+        out.paragraph(prerequisites or "None", links=False)
+
+        if show_gen_ed:
+            out.heading(f"General Education Designation: {GEN_ED_DESIGNATION}")
+            out.paragraph(gen_ed_default.strip(), links=False)
+            out.paragraph(gen_ed_credit_statement.format(course_num=course_num, designation=GEN_ED_DESIGNATION),
+                          links=False)
+
+    def _text_preview_objectives(self, out, inputs):
+        objectives, outcomes = inputs
+
+        out.heading("Course Objectives")
+        out.write("All General Education area objectives can be found ")
+        out.link("here", "https://undergrad.aa.ufl.edu/general-education/gen-ed-program/subject-area-objectives/")
+        out.line(".")
+        for i, obj_text in objectives:
+            if obj_text:
+                out.line(f"{i}. {obj_text}", "indent1")
+
+        out.heading("II. Student Learning Outcomes")
+        out.line("A student who successfully completes this course will:")
+        if outcomes is None:
+            outcomes = tuple(enumerate(student_learning_outcomes_default, 1))
+        for i, outcome_text in outcomes:
+            if outcome_text:
+                out.line(f"{i}. {outcome_text}", "indent1")
+
+    def _text_preview_slo_table(self, out, rows):
+        if rows is None:
+            return
+        out.heading(f"Objectives—General Education and {GEN_ED_DESIGNATION}", level=2)
+        out.table_row(("CATEGORY", "SOCIAL SCIENCE SLOS", "STATE SLO ASSIGNMENTS", "COURSE-SPECIFIC"),
+                      "slo_table", "table_header")
+        for row in rows:
+            out.table_row(row, "slo_table")
+
+    def _text_preview_graded_work(self, out, inputs):
+        materials, fee_value, categories, rounding = inputs
+
+        out.heading("III. Graded Work")
+
+        if materials:
+            out.heading("Required Materials", level=2)
+            out.paragraph(materials, markup=True)
+            out.line(f"\nMaterials Fee: ${fee_value}", "bold")
+
+        if categories:
+            out.heading("Grading Components", level=2)
+            out.table_row(("Category", "Weight"), "two_column", "bold")
+            for name, weight, _, _ in categories:
+                if name and weight:
+                    out.table_row((name, f"{weight}%"), "two_column")
+
+            for name, _, desc, assignments in categories:
+                if name and desc:
+                    out.write(f"\n{name}: ", "bold")
+                    out.paragraph(desc, links=False)
+
+                has_assignments = False
+                for title, due_date, points, description in assignments:
+                    if not title:
+                        continue
+                    if not has_assignments:
+                        out.line(f"{name} Assignments:", "bold")
+                        has_assignments = True
+                    assignment_text = f"• {title}"
+                    if due_date:
+                        assignment_text += f" (Due: {due_date})"
+                    if points:
+                        assignment_text += f" - {points} points"
+                    out.line(assignment_text, "indent1")
+                    if description:
+                        out.paragraph(description, "indent2")
+
+        out.heading("Grading Scale", level=2)
+        out.table_row(("Letter Grade", "Number Grade"), "two_column", "table_header")
+        for grade in GRADING_SCALE:
+            out.table_row(grade, "two_column")
+
+        out.line("See the UF Catalog's \"Grades and Grading Policies\" for information on how UF assigns grade points.")
+        if rounding:
+            out.paragraph(grading_rounding_default, links=False)
+        out.line("Note: A minimum grade of C is required to earn General Education credit.")
+
+    def _text_preview_policies(self, out, inputs):
+        sections, simplified = inputs
+
+        out.heading("Instructions for Submitting Written Assignments")
+        out.line("All written assignments must be submitted as Word documents (.doc or .docx) through the \"Assignments\" portal in Canvas by the specified deadlines. Do NOT send assignments as PDF files.")
+
+        # Instructor policies that are turned on and filled in (see Policies.course_sections)
+        for heading, text in sections:
+            out.heading(heading, level=2)
+            out.paragraph(text)
+
+        out.heading("IV. University Policies and Resources")
+        if simplified:
+            out.paragraph(uf_policies_simplified_text, markup=True)
+        else:
+            for heading, text in UF_POLICIES_DETAILED:
+                out.heading(heading, level=2)
+                out.paragraph(text, markup=True)
+
+    def _text_preview_calendar(self, out, rows):
+        out.heading("V. Calendar")
+        if not rows:
+            out.line("Schedule will be provided separately.")
+            return
+        out.table_row(("Date", "Topic", "Readings/Preparation", "Work Due"), "calendar", "table_header")
+        for row in rows:
+            out.table_row(row, "calendar")
+
+    def _text_preview_footer(self, out, inputs):
+        out.line("Note: Page numbers will appear in the generated document", "footer")
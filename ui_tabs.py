@@ -1,7 +1,15 @@
+import csv
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, simpledialog
 from tkinter import scrolledtext
 from constants import *
+from syllabus_model import ScheduleEntry
+from schedule_grid import ScheduleGrid
+from schedule_io import read_schedule, write_schedule
+from term_calendar import (
+    fill_schedule, format_date, load_no_class_dates, meeting_dates, parse_date, parse_meeting_days
+)
 
 class UITabsMixin:
     """Mixin class containing all UI tab creation methods"""
@@ -40,90 +48,89 @@ class UITabsMixin:
         widget.bind("<Button-4>", lambda e: _on_mousewheel(type('Event', (), {'delta': 120})))
         widget.bind("<Button-5>", lambda e: _on_mousewheel(type('Event', (), {'delta': -120})))
 
-    def add_schedule_entry(self, date="", topic="", readings="", work_due=""):
-        """Add a new schedule entry with enhanced styling"""
-        row = len(self.schedule_entries)
-        
-        # Date entry
-        date_entry = ttk.Entry(self.entries_frame, width=15)
-        date_entry.grid(row=row, column=0, sticky="w", padx=(5, 10), pady=2)
-        date_entry.insert(0, date)  # Populate with provided data
-        
-        # Topic entry
-        topic_entry = ttk.Entry(self.entries_frame, width=40)
-        topic_entry.grid(row=row, column=1, sticky="ew", padx=5, pady=2)
-        topic_entry.insert(0, topic)  # Populate with provided data
-        
-        # Readings frame
-        readings_frame = ttk.Frame(self.entries_frame)
-        readings_frame.grid(row=row, column=2, sticky="ew", padx=5, pady=2)
-        readings_frame.grid_columnconfigure(0, weight=1)
-        
-        # Readings text area
-        readings_text = scrolledtext.ScrolledText(readings_frame, width=50, height=3, wrap=tk.WORD)
-        readings_text.grid(row=0, column=0, sticky="ew")
-        readings_text.insert("1.0", readings)  # Populate with provided data
-        self.add_mousewheel_scrolling(readings_text)
-        
-        # Buttons frame
-        buttons_frame = ttk.Frame(readings_frame)
-        buttons_frame.grid(row=0, column=1, sticky="ns", padx=(5, 0))
-        
-        def insert_p_marker():
-            readings_text.insert(tk.INSERT, "[P] ")
-        
-        def count_words():
-            text = readings_text.get("1.0", tk.END).strip()
-            word_count = len(text.split())
-            readings_text.insert(tk.END, f" [{word_count} words]")
-        
-        ttk.Button(buttons_frame, text="[P]", command=insert_p_marker, style="Small.TButton").pack(side=tk.TOP, pady=(0, 2))
-        ttk.Button(buttons_frame, text="#", command=count_words, style="Small.TButton").pack(side=tk.TOP)
-        
-        # Work Due entry
-        work_due_entry = ttk.Entry(self.entries_frame, width=20)
-        work_due_entry.grid(row=row, column=3, sticky="w", padx=5, pady=2)
-        work_due_entry.insert(0, work_due)  # Populate with provided data
-        
-        def remove_entry():
-            date_entry.destroy()
-            topic_entry.destroy()
-            readings_frame.destroy()
-            work_due_entry.destroy()
-            delete_btn.destroy()
-            self.schedule_entries.remove(entry_dict)
-            self.repack_schedule_entries()
-        
-        # Delete button
-        delete_btn = ttk.Button(self.entries_frame, text="X", command=remove_entry, style="Delete.TButton")
-        delete_btn.grid(row=row, column=4, padx=(0, 5), pady=2)
-        
-        entry_dict = {
-            "date": date_entry,
-            "topic": topic_entry,
-            "readings": readings_text,
-            "work_due": work_due_entry,
-            "delete_btn": delete_btn,
-            "readings_frame": readings_frame
-        }
-        
-        self.schedule_entries.append(entry_dict)
-        
-        # Bind update events
-        for widget in [date_entry, topic_entry, work_due_entry]:
-            widget.bind("<KeyRelease>", lambda e: self.update_document_preview() if hasattr(self, 'update_document_preview') else None)
-        readings_text.bind("<KeyRelease>", lambda e: self.update_document_preview() if hasattr(self, 'update_document_preview') else None)
-        
-        return entry_dict
+    def add_lazy_tab(self, title, builder, defaults=None):
+        """
+        Register a tab that is built the first time it is selected.
+        
+        An empty placeholder frame stands in for the tab until then. defaults
+        maps widget attribute names to the values the builder gives them; they
+        are kept in pending_field_values so gather_content() sees the same
+        values as if the tab had been built.
+        """
+        placeholder = ttk.Frame(self.notebook)
+        self.notebook.add(placeholder, text=title)
+        defaults = dict(defaults or {})
+        self._lazy_tabs[str(placeholder)] = (builder, defaults)
+        self.pending_field_values.update(defaults)
+
+    def build_lazy_tab(self, tab_id, select=True):
+        """Build a registered tab in place of its placeholder and return the new tab's id"""
+        builder, defaults = self._lazy_tabs.pop(tab_id)
+        index = self.notebook.index(tab_id)
+        
+        # Builders add their tab at the end of the notebook; move it into the placeholder's slot
+        builder()
+        new_tab = self.notebook.tabs()[-1]
+        self.notebook.insert(index, new_tab)
+        if select:
+            self.notebook.select(new_tab)
+        self.notebook.forget(tab_id)
+        self.root.nametowidget(tab_id).destroy()
+        
+        # The widgets now hold the values; push any that changed while the tab was unbuilt
+        for attr_name, default in defaults.items():
+            value = self.pending_field_values.pop(attr_name, default)
+            if value != default:
+                self.set_field_value(attr_name, value)
+        return new_tab
+
+    def build_all_tabs(self):
+        """Build every tab that hasn't been visited yet"""
+        for tab_id in list(self._lazy_tabs):
+            self.build_lazy_tab(tab_id, select=False)
+
+    def reset_pending_field_values(self):
+        """Restore the defaults of tabs that haven't been built"""
+        for builder, defaults in self._lazy_tabs.values():
+            self.pending_field_values.update(defaults)
+
+    def field_value(self, attr_name, default=""):
+        """Value of an Entry, Text, tk variable or ScheduleGrid field, or its pending value if its tab isn't built"""
+        widget = getattr(self, attr_name, None)
+        if widget is None:
+            return self.pending_field_values.get(attr_name, default)
+        if isinstance(widget, tk.Text):
+            return widget.get("1.0", tk.END).strip()
+        return widget.get()
 
-    def repack_schedule_entries(self):
-        """Repack all schedule entries after a deletion"""
-        for i, entry in enumerate(self.schedule_entries):
-            entry["date"].grid(row=i, column=0, sticky="w", padx=(5, 10), pady=2)
-            entry["topic"].grid(row=i, column=1, sticky="ew", padx=5, pady=2)
-            entry["readings_frame"].grid(row=i, column=2, sticky="ew", padx=5, pady=2)
-            entry["work_due"].grid(row=i, column=3, sticky="w", padx=5, pady=2)
-            entry["delete_btn"].grid(row=i, column=4, padx=(0, 5), pady=2)
+    def set_field_value(self, attr_name, value):
+        """Set a field's value, or remember it until its tab is built"""
+        widget = getattr(self, attr_name, None)
+        if widget is None:
+            self.pending_field_values[attr_name] = value
+        elif isinstance(widget, tk.Text):
+            state = widget.cget("state")
+            widget.config(state="normal")
+            widget.delete("1.0", tk.END)
+            widget.insert("1.0", value)
+            widget.config(state=state)
+        elif isinstance(widget, tk.Variable):
+            widget.set(value)
+        elif isinstance(widget, ScheduleGrid):
+            widget.set_rows(value)
+        else:
+            widget.delete(0, tk.END)
+            widget.insert(0, value)
+
+    def add_schedule_entry(self, date="", topic="", readings="", work_due=""):
+        """Add a schedule row and scroll it into view"""
+        entry = ScheduleEntry(date, topic, readings, work_due)
+        if getattr(self, 'schedule_grid', None) is None:
+            self.set_field_value('schedule_grid', self.field_value('schedule_grid', ()) + (entry,))
+            return entry
+        self.schedule_grid.append(entry)
+        self.schedule_grid.focus_row(len(self.schedule_grid) - 1)
+        return entry
 
     def get_outcomes_range(self):
         """Get the range of outcomes based on current number of outcomes"""
@@ -304,8 +311,7 @@ class UITabsMixin:
             frame.destroy()
             self.objective_entries.remove(obj_dict)
             self.renumber_objectives()
-            if hasattr(self, 'update_document_preview'):
-                self.update_document_preview()
+            self.schedule_preview_refresh()
         
         remove_btn = ttk.Button(frame, text="X", command=remove_objective, style="Delete.TButton")
         remove_btn.pack(side=tk.LEFT, padx=5)
@@ -313,7 +319,7 @@ class UITabsMixin:
         obj_dict = {"frame": frame, "number": number_label, "entry": entry}
         self.objective_entries.append(obj_dict)
         
-        entry.bind("<KeyRelease>", lambda e: self.update_document_preview() if hasattr(self, 'update_document_preview') else None)
+        entry.bind("<KeyRelease>", self.schedule_preview_refresh)
         
         return obj_dict
 
@@ -375,6 +381,7 @@ class UITabsMixin:
         self.update_outcomes_references()
         if hasattr(self, 'update_lo_preview'):
             self.update_lo_preview()
+        self.schedule_preview_refresh()
 
     def renumber_outcomes(self):
         """Update the numbering of outcome entries after one is removed"""
@@ -421,7 +428,7 @@ class UITabsMixin:
             gen_ed_frame,
             text="Show General Education Designation in syllabus",
             variable=self.show_gen_ed,
-            command=self.update_document_preview
+            command=self.schedule_preview_refresh
         )
         gen_ed_check.pack(side=tk.LEFT, padx=10)
         current_row += 1
@@ -445,6 +452,7 @@ class UITabsMixin:
     def create_learning_objectives_tab(self):
         """Create a tab for customizable learning objectives table"""
         tab = ttk.Frame(self.notebook)
+        self.lo_tab = tab
         self.notebook.add(tab, text="Learning Objectives & SLOs")
         self.add_mousewheel_scrolling(tab, tab)
 
@@ -620,6 +628,9 @@ class UITabsMixin:
         ttk.Button(buttons_frame, text="Export Schedule",
                   command=self.export_schedule,
                   style="Action.TButton").pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons_frame, text="Generate Dates",
+                  command=self.open_term_calendar,
+                  style="Action.TButton").pack(side=tk.LEFT, padx=5)
         
         # Add to the buttons_frame in create_schedule_tab method:
         # Update the button text in create_schedule_tab method:
@@ -649,29 +660,9 @@ class UITabsMixin:
         ttk.Label(header_frame, text="Readings/Preparation", style="Heading.TLabel").pack(side=tk.LEFT, padx=5)
         ttk.Label(header_frame, text="Work Due", style="Heading.TLabel").pack(side=tk.LEFT, padx=175)
         
-        # Scrollable frame for schedule entries
-        canvas = tk.Canvas(main_frame, bg='#f5f5f5')  # Light gray background
-        scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
-        
-        # Create a frame inside the canvas for entries
-        self.entries_frame = ttk.Frame(canvas, style="Template.TFrame")
-        self.entries_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-
-        # Configure the canvas
-        canvas.create_window((0, 0), window=self.entries_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        # Pack the canvas and scrollbar
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, pady=5)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=5)
-
-        # Enable mousewheel scrolling
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
-        
-        self.schedule_entries = []
+        # Only the visible rows have widgets; they are reused as the schedule scrolls
+        self.schedule_grid = ScheduleGrid(main_frame, on_change=self.schedule_preview_refresh)
+        self.schedule_grid.pack(fill=tk.BOTH, expand=True, pady=5)
         
     def create_assignments_tab(self):
         """Create the assignments and grading tab with proper layout"""
@@ -738,7 +729,7 @@ class UITabsMixin:
         # Materials text area
         self.materials_text = scrolledtext.ScrolledText(materials_frame, width=60, height=6, wrap=tk.WORD)
         self.materials_text.pack(fill=tk.X, padx=5, pady=5)
-        self.materials_text.insert("1.0", "**Required** textbook *and* materials will be *listed* here.")
+        self.materials_text.insert("1.0", required_materials_default)
         self.add_mousewheel_scrolling(self.materials_text)
         
         fee_frame = ttk.Frame(materials_frame)
@@ -833,7 +824,7 @@ class UITabsMixin:
             frame,
             text="Include Canvas Policy",
             variable=self.canvas_policy_var,
-            command=self.update_document_preview
+            command=self.schedule_preview_refresh
         )
         canvas_check.pack(anchor="w", padx=5, pady=2)
 
@@ -854,7 +845,7 @@ class UITabsMixin:
             frame,
             text="Include Technology Policy",
             variable=self.technology_policy_var,
-            command=self.update_document_preview
+            command=self.schedule_preview_refresh
         )
         technology_check.pack(anchor="w", padx=5, pady=2)
 
@@ -875,7 +866,7 @@ class UITabsMixin:
             frame,
             text="Include Class Communication Policy",
             variable=self.communication_policy_var,
-            command=self.update_document_preview
+            command=self.schedule_preview_refresh
         )
         communication_check.pack(anchor="w", padx=5, pady=2)
 
@@ -896,7 +887,7 @@ class UITabsMixin:
             frame,
             text="Include Assignment Support Outside the Classroom",
             variable=self.outside_support_var,
-            command=self.update_document_preview
+            command=self.schedule_preview_refresh
         )
         support_check.pack(anchor="w", padx=5, pady=2)
 
@@ -920,7 +911,7 @@ class UITabsMixin:
             grading_options_frame,
             text="Include grading rounding statement",
             variable=self.grading_rounding_var,
-            command=self.update_document_preview
+            command=self.schedule_preview_refresh
         )
         grading_rounding_check.pack(anchor="w", padx=5, pady=2)
         
@@ -937,7 +928,7 @@ class UITabsMixin:
             frame,
             text="Include Late Submissions Policy",
             variable=self.late_submissions_policy_var,
-            command=self.update_document_preview
+            command=self.schedule_preview_refresh
         )
         late_policy_check.pack(anchor="w", padx=5, pady=2)
 
@@ -947,7 +938,7 @@ class UITabsMixin:
         
         self.late_policy_var = tk.StringVar()
         # Default late policy text that should be used for Custom option
-        default_late_text = "Late assignments will be penalized 10% per day late unless prior arrangements have been made with the instructor due to documented emergency or illness. Contact instructor as soon as possible if you anticipate being unable to meet a deadline."
+        default_late_text = late_policy_default
         self.late_policies = {
             "Standard (10% per day)": "Unless an extension is granted, assignments will incur a 10-point penalty for every day they are late.",
             "No late work": "No late work will be accepted without prior approval.",
@@ -993,7 +984,7 @@ class UITabsMixin:
             frame,
             text="Include Extra Credit Policy",
             variable=self.extra_credit_policy_var,
-            command=self.update_document_preview
+            command=self.schedule_preview_refresh
         )
         extra_credit_check.pack(anchor="w", padx=5, pady=2)
 
@@ -1003,7 +994,7 @@ class UITabsMixin:
         
         self.extra_credit_var = tk.StringVar()
         # Default extra credit text that should be used for Custom option
-        default_extra_credit_text = "Extra credit opportunities may be available at the instructor's discretion. These will be announced in class and posted on Canvas when available."
+        default_extra_credit_text = extra_credit_policy_default
         self.extra_credit_policies = {
             "Standard": "Extra credit opportunities may be announced during the semester. Points will be added to your mid-term exam grade.",
             "No extra credit": "No extra credit will be offered in this course.",
@@ -1069,46 +1060,139 @@ class UITabsMixin:
         if not file_path:
             return
         
-        # Clear existing entries
-        for entry in self.schedule_entries:
-            if "readings_frame" in entry:
-                entry["readings_frame"].destroy()
-            if "delete_btn" in entry:
-                entry["delete_btn"].destroy()
-            entry["date"].destroy()
-            entry["topic"].destroy()
-            entry["work_due"].destroy()
-        self.schedule_entries.clear()
-        
-        # Import based on file type
-        if file_path.endswith('.csv'):
-            import csv
-            with open(file_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    self.add_schedule_entry(
-                        row.get("Date", ""),
-                        row.get("Topic", ""),
-                        row.get("Readings/Preparation", ""),
-                        row.get("Work Due", "")
-                    )
+        start = time.perf_counter()
+        try:
+            rows, errors = read_schedule(file_path)
+        except ImportError as e:
+            messagebox.showerror("Error", str(e))
+            return
+        except (OSError, ValueError, csv.Error) as e:
+            messagebox.showerror("Error", f"Could not import schedule:\n{str(e)}")
+            return
+        self.load_schedule_rows(rows)
+        elapsed = time.perf_counter() - start
+        
+        rate = f" ({len(rows) / elapsed:,.0f} rows/second)" if rows and elapsed > 0 else ""
+        message = f"Imported {len(rows)} schedule rows from {file_path}{rate}"
+        if errors:
+            skipped = "\n".join(f"Row {number}: {error}" for number, error in errors[:10])
+            more = f"\n... and {len(errors) - 10} more" if len(errors) > 10 else ""
+            messagebox.showwarning("Imported with Errors",
+                                   f"{message}\n\n{len(errors)} rows were skipped:\n{skipped}{more}")
         else:
-            # Handle Excel import
-            try:
-                import pandas as pd
-                df = pd.read_excel(file_path)
-                for _, row in df.iterrows():
-                    self.add_schedule_entry(
-                        str(row.get("Date", "")),
-                        str(row.get("Topic", "")),
-                        str(row.get("Readings/Preparation", "")),
-                        str(row.get("Work Due", ""))
-                    )
-            except ImportError:
-                messagebox.showerror("Error", "pandas is required for Excel import. Please install it or use CSV format.")
-        
-        messagebox.showinfo("Success", f"Schedule imported from {file_path}")
+            messagebox.showinfo("Success", message)
+
+    def load_schedule_rows(self, rows):
+        """
+        Replace the schedule with rows in one batch.
+        
+        Preview refreshes are held back while the rows are loaded and the grid
+        binds its visible rows once, however many rows there are.
+        """
+        with self.preview_refresh_suspended():
+            self.set_field_value('schedule_grid', tuple(rows))
+            self.schedule_preview_refresh()
             
+    def open_term_calendar(self):
+        """Dialog that generates the class meeting dates for the term and fills the schedule with them"""
+        settings = self.term_calendar_settings
+        window = tk.Toplevel(self.root)
+        window.title("Generate Class Dates")
+        window.resizable(False, False)
+        window.transient(self.root)
+        
+        frame = ttk.Frame(window, padding=10)
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        start_var = tk.StringVar(value=settings.get("start", ""))
+        end_var = tk.StringVar(value=settings.get("end", ""))
+        days_var = tk.StringVar(value=settings.get("days") or self.field_value('entry_meeting_times'))
+        no_class_var = tk.StringVar(value=settings.get("no_class_path", ""))
+        include_var = tk.BooleanVar(value=settings.get("include_no_class", True))
+        summary_var = tk.StringVar()
+        
+        rows = [
+            ("First day of classes:", start_var),
+            ("Last day of classes:", end_var),
+            ("Meeting days:", days_var),
+            ("No-class date file:", no_class_var),
+        ]
+        for row, (label, var) in enumerate(rows):
+            ttk.Label(frame, text=label).grid(row=row, column=0, sticky="e", padx=5, pady=3)
+            ttk.Entry(frame, textvariable=var, width=30).grid(row=row, column=1, sticky="w", padx=5, pady=3)
+        ttk.Label(frame, text="e.g. 2025-08-21 or August 21, 2025", style="Italic.TLabel").grid(
+            row=0, column=2, sticky="w", padx=5)
+        ttk.Label(frame, text="e.g. MWF, TR, Tue/Thu", style="Italic.TLabel").grid(row=2, column=2, sticky="w", padx=5)
+        
+        def browse():
+            path = filedialog.askopenfilename(
+                parent=window, title="No-Class Dates",
+                filetypes=[("Text files", "*.txt"), ("CSV files", "*.csv"), ("All files", "*.*")]
+            )
+            if path:
+                no_class_var.set(path)
+        
+        ttk.Button(frame, text="Browse...", command=browse).grid(row=3, column=2, sticky="w", padx=5)
+        ttk.Checkbutton(frame, text="Add a row for each day without class",
+                        variable=include_var).grid(row=4, column=1, columnspan=2, sticky="w", padx=5, pady=3)
+        ttk.Label(frame, textvariable=summary_var, wraplength=420, justify=tk.LEFT).grid(
+            row=5, column=0, columnspan=3, sticky="w", padx=5, pady=(8, 3))
+        
+        no_class_cache = {}
+        
+        def compute():
+            """Meeting dates for the current inputs; raises ValueError with a message for the summary line"""
+            start, end = parse_date(start_var.get()), parse_date(end_var.get())
+            if start is None or end is None:
+                raise ValueError("Enter the first and last day of classes.")
+            if end < start:
+                raise ValueError("The last day of classes is before the first.")
+            weekdays = parse_meeting_days(days_var.get())
+            if not weekdays:
+                raise ValueError("Enter the meeting days, e.g. MWF or TR.")
+            path = no_class_var.get().strip()
+            if path and path not in no_class_cache:
+                try:
+                    no_class_cache[path] = load_no_class_dates(path)
+                except OSError as e:
+                    raise ValueError(f"Could not read the no-class file: {e.strerror or e}")
+            return meeting_dates(start, end, weekdays, no_class_cache.get(path))
+        
+        def update_summary(*args):
+            try:
+                dates = compute()
+            except ValueError as e:
+                summary_var.set(str(e))
+                return
+            classes = [day for day, label in dates if not label]
+            skipped = len(dates) - len(classes)
+            if not classes:
+                summary_var.set("No class meetings in that range.")
+                return
+            summary_var.set(f"{len(classes)} class meetings, {format_date(classes[0])} to "
+                            f"{format_date(classes[-1])}; {skipped} meeting days without class.")
+        
+        for var in (start_var, end_var, days_var, no_class_var):
+            var.trace_add("write", update_summary)
+        update_summary()
+        
+        def apply():
+            try:
+                dates = compute()
+            except ValueError as e:
+                messagebox.showerror("Error", str(e), parent=window)
+                return
+            settings.update(start=start_var.get(), end=end_var.get(), days=days_var.get(),
+                            no_class_path=no_class_var.get(), include_no_class=include_var.get())
+            self.load_schedule_rows(fill_schedule(self.field_value('schedule_grid', ()), dates,
+                                                  include_var.get()))
+            window.destroy()
+        
+        buttons = ttk.Frame(frame)
+        buttons.grid(row=6, column=0, columnspan=3, pady=(8, 0))
+        ttk.Button(buttons, text="Fill Schedule", command=apply, style="Action.TButton").pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons, text="Cancel", command=window.destroy).pack(side=tk.LEFT, padx=5)
+        
     def export_schedule(self):
         """Export schedule to CSV with formatting preserved"""
         file_path = filedialog.asksaveasfilename(
@@ -1119,32 +1203,14 @@ class UITabsMixin:
         if not file_path:
             return
         
-        # Prepare data
-        data = []
-        for entry in self.schedule_entries:
-            data.append({
-                "Date": entry["date"].get(),
-                "Topic": entry["topic"].get(),
-                "Readings/Preparation": entry["readings"].get("1.0", tk.END).strip(),
-                "Work Due": entry["work_due"].get()
-            })
-        
-        # Export based on file type
-        if file_path.endswith('.csv'):
-            import csv
-            with open(file_path, 'w', encoding='utf-8', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=["Date", "Topic", "Readings/Preparation", "Work Due"])
-                writer.writeheader()
-                writer.writerows(data)
-        else:
-            # Handle Excel export
-            try:
-                import pandas as pd
-                df = pd.DataFrame(data)
-                df.to_excel(file_path, index=False)
-            except ImportError:
-                messagebox.showerror("Error", "pandas is required for Excel export. Please install it or use CSV format.")
-                return
+        try:
+            write_schedule(file_path, self.field_value('schedule_grid', ()))
+        except ImportError as e:
+            messagebox.showerror("Error", str(e))
+            return
+        except OSError as e:
+            messagebox.showerror("Error", f"Could not export schedule:\n{str(e)}")
+            return
                 
         messagebox.showinfo("Success", f"Schedule exported to {file_path}")
             